@@ -1,3 +1,5 @@
 import os
 
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"
+
+__version__ = "1.0.0"
@@ -1,9 +1,12 @@
 import os
+import sys
 from argparse import ArgumentParser, ArgumentTypeError
 from typing import Any
 
 from credsweeper.app import CredSweeper
+from credsweeper.common.constants import GitIgnoreEngine, OversizePolicy
 from credsweeper.logger.logger import logging, Logger
+from credsweeper.utils.git_diff import GitDiff
 
 
 def positive_int(value: Any) -> int:
@@ -15,14 +18,33 @@ def positive_int(value: Any) -> int:
     return int_value
 
 
+def positive_float(value: Any) -> float:
+    """Check if time limit is not a positive number"""
+    float_value = float(value)
+    if float_value <= 0:
+        logging.error("Time limit should be a positive number: %s", value)
+        raise ArgumentTypeError(f"{value} should be greater than 0")
+    return float_value
+
+
 def get_arguments() -> ArgumentParser.parse_args:
     parser = ArgumentParser(prog="python -m credsweeper")
-    parser.add_argument("--path",
-                        nargs="+",
-                        help="file or directory to scan",
-                        dest="path",
-                        metavar="PATH",
-                        required=True)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--path", nargs="+", help="file or directory to scan", dest="path", metavar="PATH")
+    group.add_argument("--diff",
+                       help="scan only lines added by unified diff from the file, or from stdin if PATH is '-'. "
+                       "Multi-line rules see only context lines of the diff",
+                       dest="diff",
+                       metavar="PATH")
+    parser.add_argument("--diff_base",
+                        help="scan only lines of --path added since git revision REF, with enough context lines "
+                        "for multi-line rules",
+                        dest="diff_base",
+                        metavar="REF")
+    parser.add_argument("--diff_head",
+                        help="git revision with the changes for --diff_base (default: working tree)",
+                        dest="diff_head",
+                        metavar="REF")
     parser.add_argument("--rules",
                         nargs="?",
                         help="path of rule config file (default: credsweeper/rules/config.yaml)",
@@ -45,10 +67,47 @@ def get_arguments() -> ArgumentParser.parse_args:
                         type=positive_int,
                         dest="jobs",
                         metavar="POSITIVE_INT")
+    parser.add_argument("--buffer_scan",
+                        help="search rules over whole file content instead of line by line",
+                        dest="buffer_scan",
+                        action="store_true")
+    parser.add_argument("--long_line_scan",
+                        help="scan lines longer than 1500 characters in overlapping windows instead of skipping them",
+                        dest="long_line_scan",
+                        action="store_true")
+    parser.add_argument("--regex_timeout",
+                        help="time limit in seconds for a rule pattern search in a line, lines where the limit is "
+                        "exceeded are skipped and reported (default: no limit)",
+                        type=positive_float,
+                        dest="regex_timeout",
+                        metavar="SECONDS")
+    parser.add_argument("--max_file_size",
+                        help="size in bytes, files larger than it are handled by --oversize_policy (default: no limit)",
+                        type=positive_int,
+                        dest="max_file_size",
+                        metavar="BYTES")
+    parser.add_argument("--oversize_policy",
+                        help="how to handle files larger than --max_file_size: skip them, scan only head of the "
+                        "file, or stream the whole file with bounded memory, where lines longer than 65536 characters "
+                        "are truncated with a warning (default: skip)",
+                        default="skip",
+                        dest="oversize_policy",
+                        choices=[policy.value for policy in OversizePolicy])
     parser.add_argument("--skip_ignored",
                         help="parse .gitignore files and skip credentials from ignored objects",
                         dest="skip_ignored",
                         action="store_true")
+    parser.add_argument("--gitignore_engine",
+                        help="how to check files against gitignore rules with --skip_ignored: with git, which keeps "
+                        "tracked files, or in-process, which also works without .git directory (default: git)",
+                        default="git",
+                        dest="gitignore_engine",
+                        choices=[engine.value for engine in GitIgnoreEngine])
+    parser.add_argument("--cache-dir",
+                        help="directory of persistent caches, parsed rules and findings of files are cached there by "
+                        "file content and unchanged files are not scanned again (default: no caches)",
+                        dest="cache_dir",
+                        metavar="PATH")
     parser.add_argument("--save-json",
                         nargs="?",
                         help="save result to json file (default: output.json)",
@@ -63,7 +122,23 @@ def get_arguments() -> ArgumentParser.parse_args:
                         metavar="LOG_LEVEL",
                         choices=list(Logger.LEVELS)
                         )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.diff_base is not None and args.diff is not None:
+        parser.error("argument --diff_base: not allowed with argument --diff")
+    if args.diff_head is not None and args.diff_base is None:
+        parser.error("argument --diff_head: requires --diff_base")
+    if args.diff is not None or args.diff_base is not None:
+        # Lines of diff hunks are scanned in the main process, files are not read, so these arguments do not apply.
+        # Parallel processes are only used by API validation
+        diff_argument = "--diff" if args.diff is not None else "--diff_base"
+        file_scan_arguments = [("--skip_ignored", args.skip_ignored), ("--max_file_size", args.max_file_size),
+                               ("--oversize_policy", args.oversize_policy != OversizePolicy.SKIP.value),
+                               ("--buffer_scan", args.buffer_scan), ("--cache-dir", args.cache_dir),
+                               ("-j/--jobs", args.jobs and not args.api_validation)]
+        for argument, is_set in file_scan_arguments:
+            if is_set:
+                parser.error(f"argument {argument}: not allowed with argument {diff_argument}")
+    return args
 
 
 def main() -> None:
@@ -76,9 +151,31 @@ def main() -> None:
                               api_validation=args.api_validation,
                               json_filename=args.json_filename,
                               pool_count=args.jobs,
-                              ml_batch_size=args.ml_batch_size)
-    logging.info(f"Run analyzer on path :{args.path}")
-    credsweeper.run(paths=args.path, skip_ignored=args.skip_ignored)
+                              ml_batch_size=args.ml_batch_size,
+                              buffer_scan=args.buffer_scan,
+                              long_line_scan=args.long_line_scan,
+                              regex_timeout=args.regex_timeout,
+                              max_file_size=args.max_file_size,
+                              oversize_policy=args.oversize_policy,
+                              gitignore_engine=args.gitignore_engine,
+                              cache_dir=args.cache_dir)
+    if args.diff == "-":
+        logging.info(f"Run analyzer on diff from stdin")
+        credsweeper.run_diff(GitDiff.parse(sys.stdin.buffer))
+    elif args.diff is not None:
+        logging.info(f"Run analyzer on diff :{args.diff}")
+        with open(args.diff, "rb") as diff_file:
+            credsweeper.run_diff(GitDiff.parse(diff_file))
+    elif args.diff_base is not None:
+        logging.info(f"Run analyzer on diff of path :{args.path} since {args.diff_base}")
+        try:
+            credsweeper.run_diff(credsweeper.get_git_diff_hunks(args.path, args.diff_base, args.diff_head))
+        except RuntimeError as exc:
+            logging.error(exc)
+            sys.exit(1)
+    else:
+        logging.info(f"Run analyzer on path :{args.path}")
+        credsweeper.run(paths=args.path, skip_ignored=args.skip_ignored)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,23 @@
-import itertools
 import json
 import multiprocessing
 import os
+import queue
 import sys
-from typing import Dict, List, Optional
+import time
+from multiprocessing.pool import Pool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from credsweeper.common.constants import KeyValidationOption
+from credsweeper.common.constants import GitIgnoreEngine, KeyValidationOption, OversizePolicy
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate, CredentialManager
-from credsweeper.logger.logger import logging
+from credsweeper.logger.logger import logging, Logger
 from credsweeper.scanner import Scanner
+from credsweeper.scanner.content_deduplicator import ContentDeduplicator
+from credsweeper.scanner.scan_cache import ScanCache
+from credsweeper.scanner.scan_scheduler import ScanScheduler
 from credsweeper.utils.file_path_extractor import FilePathExtractor
+from credsweeper.utils.file_reader import FileReader
+from credsweeper.utils.git_diff import DiffHunk, GitDiff
 from credsweeper.validations.apply_validation import ApplyValidation
 
 
@@ -23,7 +30,23 @@ class CredSweeper:
         POOL_COUNT: number of pools used to run multiprocessing scanning
         config: dictionary variable, stores analyzer features
         json_filename: string variable, credential candidates export filename
+        worker_spec: configs and rules path, workers set up their scanners from them
+        worker: CredSweeper of the current worker process that scans files, see `pool_initializer`
+        scan_scheduler: ScanScheduler of the last scan, it has work of the worker processes
+        SCAN_CHUNK_TIME: Float constant. Scan time in seconds of file paths sent to a worker process at once. Size of
+            the files is adapted to the observed scan time per byte
+        SCAN_TASKS_PER_WORKER: Int constant. Number of chunks of file paths sent ahead to each worker process
+        ML_STREAM_BATCH_SIZE: Int constant. Number of credential candidates validated by ML at once when findings are
+            reported during the scan
+        ML_STREAM_DELAY: Float constant. Time in seconds that credential candidates may wait for ML validation when
+            findings are reported during the scan
     """
+    SCAN_CHUNK_TIME = 0.05
+    SCAN_TASKS_PER_WORKER = 2
+    ML_STREAM_BATCH_SIZE = 1024
+    ML_STREAM_DELAY = 1.0
+    worker: Optional["CredSweeper"] = None
+
     def __init__(self,
                  rule_path: Optional[str] = None,
                  ml_validation: bool = False,
@@ -31,7 +54,14 @@ class CredSweeper:
                  json_filename: Optional[str] = None,
                  use_filters: bool = True,
                  pool_count: Optional[int] = None,
-                 ml_batch_size: Optional[int] = 16) -> None:
+                 ml_batch_size: Optional[int] = 16,
+                 buffer_scan: bool = False,
+                 long_line_scan: bool = False,
+                 regex_timeout: Optional[float] = None,
+                 max_file_size: Optional[int] = None,
+                 oversize_policy: str = "skip",
+                 gitignore_engine: str = "git",
+                 cache_dir: Optional[str] = None) -> None:
         """Initialize Advanced credential scanner
 
         Args:
@@ -45,6 +75,21 @@ class CredSweeper:
             use_filters: boolean variable, specifying the need of rule filters
             pool_count: int value, number of parallel processes to use
             ml_batch_size: int value, size of the batch for model inference
+            buffer_scan: boolean variable, specifying the need to search rules over whole file content instead of
+                line by line
+            long_line_scan: boolean variable, specifying the need to scan lines longer than MAX_LINE_LENGTH in
+                overlapping windows instead of skipping them
+            regex_timeout: optional float value, time limit in seconds for a single search of a rule pattern.
+                Lines where the limit is exceeded are skipped and reported in the summary
+            max_file_size: optional int value, size in bytes. Files larger than it are handled by oversize_policy
+            oversize_policy: string variable, how to handle files larger than max_file_size: "skip" the file, scan
+                only its "head" of max_file_size bytes, or "stream" the whole file in blocks with bounded memory
+            gitignore_engine: string variable, how to skip ignored files: with "git" check-ignore, which keeps
+                tracked files, or with in-process "python" matcher, which does not enter ignored directories and
+                works without .git directory
+            cache_dir: optional str variable, directory of persistent caches. Parsed rule set and findings of scanned
+                files are cached there by file content, and files with the same content are not scanned again.
+                Nothing is cached if not set
         """
         if pool_count is None:
             pool_count = self.__get_pool_count()
@@ -57,11 +102,36 @@ class CredSweeper:
         config_dict["validation"]["ml_validation"] = ml_validation
         config_dict["validation"]["api_validation"] = api_validation
         config_dict["use_filters"] = use_filters
-        self.config = Config(config_dict)
+        config_dict["buffer_scan"] = buffer_scan
+        config_dict["long_line_scan"] = long_line_scan
+        config_dict["regex_timeout"] = regex_timeout
+        config_dict["max_file_size"] = max_file_size
+        config_dict["oversize_policy"] = oversize_policy
+        config_dict["gitignore_engine"] = gitignore_engine
+        config_dict["cache_dir"] = cache_dir
+        # Worker processes set up their own scanner from configs and rules path, so tasks carry only file paths
+        self.worker_spec: Tuple[Dict[str, Any], Optional[str]] = (config_dict, rule_path)
+        self.set_up_scanner(config_dict, rule_path)
         self.credential_manager = CredentialManager()
-        self.scanner = Scanner(self.config, rule_path)
         self.json_filename: Optional[str] = json_filename
         self.ml_batch_size = ml_batch_size
+        self.regex_timeouts: Dict[Tuple[str, str], int] = {}
+        self.scan_scheduler: Optional[ScanScheduler] = None
+
+    def set_up_scanner(self, config_dict: Dict[str, Any], rule_path: Optional[str]) -> None:
+        """Set up objects that scan files: config, scanner and scan cache
+
+        Args:
+            config_dict: configs to create Config object
+            rule_path: optional str variable, path of rule config file
+        """
+        self.config = Config(config_dict)
+        self.scanner = Scanner(self.config, rule_path)
+        self.scan_cache: Optional[ScanCache] = None
+        if config_dict.get("cache_dir"):
+            self.scan_cache = ScanCache(config_dict["cache_dir"],
+                                        ScanCache.get_fingerprint(self.scanner.rule_set_key, self.scanner.rules,
+                                                                   config_dict))
 
     def __get_pool_count(self) -> int:
         """Get the number of pools based on doubled CPUs in the system"""
@@ -89,12 +159,45 @@ class CredSweeper:
             skip_ignored: boolean variable, Checking the directory to the list
                 of ignored directories from the gitignore file
         """
-        file_paths = self.get_scannable_paths(paths, skip_ignored)
+        file_paths = self.discover_scannable_paths(paths, skip_ignored)
         logging.info(f"Start Scanner")
-        logging.debug(f"List of file paths to scan:{file_paths}")
-        self.scan(file_paths)
+        if self.config.api_validation:
+            # API validation runs over all credentials after the scan, so they are reported at the end
+            self.scan(file_paths)
+            self.post_processing()
+            self.export_results()
+        else:
+            self.stream_scan(file_paths)
+        self.report_regex_timeouts()
+        if self.scan_scheduler is not None:
+            self.scan_scheduler.report_utilization(self.pool_count)
+
+    def run_diff(self, diff_hunks: Iterable[Tuple[str, DiffHunk]]) -> None:
+        """Run an analysis of lines added by a diff
+
+        Args:
+            diff_hunks: file paths and hunks of the diff, see `GitDiff.parse` and `get_git_diff_hunks`
+        """
+        logging.info(f"Start Scanner of diff")
+        self.diff_scan(diff_hunks)
         self.post_processing()
         self.export_results()
+        self.report_regex_timeouts()
+
+    def get_git_diff_hunks(self, paths: List[str], base_ref: str,
+                           head_ref: Optional[str] = None) -> Iterator[Tuple[str, DiffHunk]]:
+        """Get hunks of `git diff` of the paths. Hunks have enough context lines for multi-line rules
+
+        Args:
+            paths: list of files or directories in working trees of repositories
+            base_ref: git revision to compare with
+            head_ref: git revision with the changes, working tree is compared if not set
+        """
+        context_lines = max(Scanner.CONTEXT_LINES_BEFORE, Scanner.CONTEXT_LINES_AFTER)
+        for path in paths:
+            path = os.path.expanduser(path)
+            dir_path = path if os.path.isdir(path) else os.path.dirname(path)
+            yield from GitDiff.parse(GitDiff.run_git_diff(path, base_ref, head_ref, context_lines), dir_path)
 
     def get_scannable_paths(self, paths: List[str], skip_ignored: bool) -> List[str]:
         """Run analysis of directory paths from an argument "paths"
@@ -104,6 +207,11 @@ class CredSweeper:
             skip_ignored: boolean variable, Checking the directory to the list
                 of ignored directories from the gitignore file
         """
+        if skip_ignored and self.config.gitignore_engine == GitIgnoreEngine.PYTHON:
+            return [
+                file_path for path in paths
+                for file_path in FilePathExtractor.get_file_paths(self.config, path, skip_ignored=True)
+            ]
         file_paths = []
         for path in paths:
             new_files = FilePathExtractor.get_file_paths(self.config, path)
@@ -112,39 +220,269 @@ class CredSweeper:
             file_paths.extend(new_files)
         return file_paths
 
-    def scan(self, file_paths: List[str]) -> None:
+    def discover_scannable_paths(self, paths: List[str], skip_ignored: bool) -> Iterator[str]:
+        """Same as `get_scannable_paths`, but paths are found lazily by parallel threads, so scanning can start
+            before the whole file tree is walked
+
+        Args:
+            paths: list of parent directories to scan
+            skip_ignored: boolean variable, Checking the directory to the list
+                of ignored directories from the gitignore file
+        """
+        if skip_ignored and self.config.gitignore_engine == GitIgnoreEngine.PYTHON:
+            return FilePathExtractor.discover_file_paths(self.config, paths, skip_ignored=True)
+        file_paths = FilePathExtractor.discover_file_paths(self.config, paths)
+        if skip_ignored:
+            return FilePathExtractor.filter_gitignored(file_paths)
+        return file_paths
+
+    def scan(self, file_paths: Iterable[str]) -> None:
         """Run scanning of directory paths from an argument "file_paths"
 
         Args:
-            file_paths: list of file paths to scan
+            file_paths: file paths to scan. Paths are passed to worker processes as they are taken from the iterable.
+                Files with the same content as a previous file are not scanned, findings of that file are copied
+        """
+        for candidates in self.iter_scan_results(file_paths):
+            self.credential_manager.add_credentials(candidates)
+        if self.config.api_validation:
+            logging.info(f"Run API Validation")
+            with self.create_pool() as pool:
+                ApplyValidation().validate_credentials(pool, self.credential_manager)
+
+    def stream_scan(self, file_paths: Iterable[str]) -> None:
+        """Run scanning of "file_paths" and report credentials as files are scanned, so findings are given before the
+            whole scan is finished. With ML validation, candidates are validated in batches of about
+            ML_STREAM_BATCH_SIZE candidates, and a batch does not wait for more than ML_STREAM_DELAY when results
+            come. Credentials are saved to json file at the end
+
+        Args:
+            file_paths: file paths to scan, see `scan`
+        """
+        if self.config.ml_validation:
+            from credsweeper.ml_model import MlValidator
+            MlValidator()
+            logging.info(f"Run Ml Validation of scanned files")
+        batch: List[Candidate] = []
+        batch_start_time = time.monotonic()
+        for candidates in self.iter_scan_results(file_paths):
+            if not batch:
+                batch_start_time = time.monotonic()
+            batch.extend(candidates)
+            if batch and (not self.config.ml_validation or len(batch) >= self.ML_STREAM_BATCH_SIZE
+                          or time.monotonic() - batch_start_time >= self.ML_STREAM_DELAY):
+                self.report_batch(batch)
+                batch = []
+        if batch:
+            self.report_batch(batch)
+        self.export_json()
+
+    def report_batch(self, candidates: List[Candidate]) -> None:
+        """Validate credential candidates of scanned files with ML if it is enabled, report them and add them to the
+            credential manager
+
+        Args:
+            candidates: candidates of whole files, so all candidates of a group are validated together
+        """
+        if self.config.ml_validation:
+            candidates = self.ml_validate(candidates)
+        self.credential_manager.add_credentials(candidates)
+        self.report_credentials(candidates)
+
+    def iter_scan_results(self, file_paths: Iterable[str]) -> Iterator[List[Candidate]]:
+        """Run scanning of "file_paths" in worker processes and give findings of each file as soon as it is scanned
+
+        Paths are sent to workers in chunks by ScanScheduler: largest files first, and smaller files packed into
+        chunks of about SCAN_CHUNK_TIME of scanning, by the observed scan time per byte. Only SCAN_TASKS_PER_WORKER
+        tasks per worker are sent ahead, so paths are taken from the iterable and results are kept as fast as the
+        workers scan them
+
+        Args:
+            file_paths: file paths to scan, see `scan`
+
+        Return:
+            Iterator over candidates of each file, in order the files are scanned
+        """
+        content_deduplicator = ContentDeduplicator()
+        self.scan_scheduler = ScanScheduler(content_deduplicator.filter_unique(file_paths))
+        task_results: queue.SimpleQueue = queue.SimpleQueue()
+        tasks_count = 0
+        with self.create_pool(self.worker_spec) as pool:
+            while True:
+                while tasks_count < self.pool_count * self.SCAN_TASKS_PER_WORKER:
+                    chunk = self.scan_scheduler.get_chunk(self.SCAN_CHUNK_TIME)
+                    if not chunk:
+                        break
+                    pool.apply_async(self.worker_files_scan, (chunk, ),
+                                     callback=task_results.put,
+                                     error_callback=task_results.put)
+                    tasks_count += 1
+                for file_path, records in content_deduplicator.pop_copies():
+                    yield ScanCache.get_candidates(records, file_path, self.scanner.rules)
+                if not tasks_count:
+                    break
+                task_result = task_results.get()
+                tasks_count -= 1
+                if isinstance(task_result, BaseException):
+                    raise task_result
+                file_results, worker_id, chunk_scan_time = task_result
+                self.scan_scheduler.complete_chunk(file_results[0][0], worker_id, chunk_scan_time)
+                for index, file_path, records, regex_timeouts in file_results:
+                    for key, count in regex_timeouts.items():
+                        self.regex_timeouts[key] = self.regex_timeouts.get(key, 0) + count
+                    yield ScanCache.get_candidates(records, file_path, self.scanner.rules)
+                    for copy_path, copy_records in content_deduplicator.add_records(index, records):
+                        yield ScanCache.get_candidates(copy_records, copy_path, self.scanner.rules)
+        if self.scan_cache is not None:
+            self.scan_cache.evict()
+
+    def diff_scan(self, diff_hunks: Iterable[Tuple[str, DiffHunk]]) -> None:
+        """Run scanning of lines added by a diff. Context lines of the hunks are only used by multi-line rules, and
+            findings have line numbers of the new file versions. Files excluded by configs are skipped
+
+        Args:
+            diff_hunks: file paths and hunks of the diff
+        """
+        for file_path, (lines, line_nums, line_num_offset) in diff_hunks:
+            if FilePathExtractor.check_exclude_file(self.config, file_path):
+                continue
+            self.credential_manager.add_credentials(self.scanner.scan(file_path, lines, line_nums, line_num_offset))
+        for key, count in self.scanner.pop_regex_timeouts().items():
+            self.regex_timeouts[key] = self.regex_timeouts.get(key, 0) + count
+        if self.config.api_validation:
+            logging.info(f"Run API Validation")
+            with self.create_pool() as pool:
+                ApplyValidation().validate_credentials(pool, self.credential_manager)
+
+    def create_pool(self, worker_spec: Optional[Tuple[Dict[str, Any], Optional[str]]] = None) -> Pool:
+        """Start pool of pool_count worker processes
+
+        Args:
+            worker_spec: optional configs and rules path. Each worker sets up its scanner from them once, if set
+
+        Return:
+            Pool object
+        """
+        return multiprocessing.get_context("spawn").Pool(self.pool_count,
+                                                         initializer=self.pool_initializer,
+                                                         initargs=(worker_spec, ))
+
+    @classmethod
+    def pool_initializer(cls, worker_spec: Optional[Tuple[Dict[str, Any], Optional[str]]] = None) -> None:
+        """Init logging in a worker process with log level of the main process. Logging is not configured on import.
+            Set up scanner of the worker process, so it is not passed with each task
+
+        Args:
+            worker_spec: optional configs and rules path to set up scanner of the worker
         """
-        with multiprocessing.get_context("spawn").Pool(self.pool_count) as pool:
-            # Get list credentials for each file
-            scan_results_per_file = pool.map(self.file_scan, file_paths)
-            # Join all sublist into a single list
-            scan_results = list(itertools.chain(*scan_results_per_file))
-            for cred in scan_results:
-                self.credential_manager.add_credential(cred)
-            if self.config.api_validation:
-                logging.info(f"Run API Validation")
-                api_validation = ApplyValidation()
-                api_validation.validate_credentials(pool, self.credential_manager)
+        log_level = os.getenv("LOG_LEVEL")
+        if log_level is not None:
+            Logger.init_logging(log_level)
+        if worker_spec is not None:
+            # Only the scanning part of CredSweeper is needed in the worker
+            worker = cls.__new__(cls)
+            worker.set_up_scanner(*worker_spec)
+            cls.worker = worker
+
+    @classmethod
+    def worker_files_scan(
+            cls, indexed_paths: List[Tuple[int, str]]
+    ) -> Tuple[List[Tuple[int, str, List[Any], Dict[Tuple[str, str], int]]], int, float]:
+        """Run `file_scan_with_timeouts` with the scanner of the current worker process, see `pool_initializer`.
+            Credentials are converted to plain records, so rules and config are not sent to the main process
+
+        Args:
+            indexed_paths: chunk of file paths to scan with their indexes
+
+        Return:
+            Index, file path, records of credential candidates, see `ScanCache.get_records`, and dictionary of regex
+                timeouts per rule name and file path for each file, process id of the worker and scan time of the
+                chunk in seconds
+        """
+        start_time = time.perf_counter()
+        file_results = []
+        for index, file_path in indexed_paths:
+            candidates, regex_timeouts = cls.worker.file_scan_with_timeouts(file_path)
+            file_results.append((index, file_path, ScanCache.get_records(candidates, cls.worker.scanner.rules),
+                                 regex_timeouts))
+        return file_results, os.getpid(), time.perf_counter() - start_time
 
     def file_scan(self, file_path: str) -> List[Candidate]:
-        """Run scanning of file from 'file_paths'
+        """Run scanning of file from 'file_paths'. Findings are taken from the scan cache if the file content was
+            scanned before with the same rules and configs
+
+        Args:
+            file_path: path to file to scan
+        """
+        if self.scan_cache is None:
+            return self.read_and_scan_file(file_path)
+        key = self.scan_cache.get_key(file_path)
+        if key is not None:
+            records = self.scan_cache.load(key)
+            if records is not None:
+                logging.debug(f"Scan cache hit for file: {file_path}")
+                return ScanCache.get_candidates(records, file_path, self.scanner.rules)
+        candidates = self.read_and_scan_file(file_path)
+        # Findings depend on time of the search if regex timeout was hit, so they are not cached
+        if key is not None and all(path != file_path for _, path in self.scanner.regex_timeouts):
+            self.scan_cache.save(key, ScanCache.get_records(candidates, self.scanner.rules))
+        return candidates
+
+    def read_and_scan_file(self, file_path: str) -> List[Candidate]:
+        """Read file from 'file_paths' and scan its content
 
         Args:
             file_path: path to file to scan
         """
         # Get list credentials for each file
         logging.debug(f"Start scan file: {file_path}")
-        try:
-            with open(file_path, "r") as file_content:
-                lines = file_content.read().splitlines()
-                return self.scanner.scan(file_path, lines)
-        except UnicodeDecodeError:
-            logging.warning(f"Can't read file content from \"{file_path}\".")
+        max_file_size = self.config.max_file_size
+        if max_file_size is not None and os.path.getsize(file_path) > max_file_size:
+            return self.oversize_file_scan(file_path)
+        text = FileReader.read_text(file_path)
+        if text is None:
             return []
+        if self.config.buffer_scan:
+            return self.scanner.scan_text(file_path, text)
+        return self.scanner.scan(file_path, text.splitlines())
+
+    def oversize_file_scan(self, file_path: str) -> List[Candidate]:
+        """Run scanning of file larger than max_file_size according to oversize_policy
+
+        Args:
+            file_path: path to file to scan
+        """
+        if self.config.oversize_policy == OversizePolicy.HEAD:
+            logging.info(f"File larger than max file size, only head is scanned: {file_path}")
+            text = FileReader.read_text(file_path, self.config.max_file_size)
+            if text is None:
+                return []
+            return self.scanner.scan(file_path, text.splitlines())
+        if self.config.oversize_policy == OversizePolicy.STREAM:
+            logging.info(f"File larger than max file size is streamed: {file_path}")
+            lines = FileReader.read_lines(file_path)
+            if lines is None:
+                return []
+            try:
+                return self.scanner.scan_stream(file_path, lines)
+            except UnicodeDecodeError:
+                logging.warning(f"Can't read file content from \"{file_path}\".")
+                return []
+        logging.info(f"File larger than max file size is skipped: {file_path}")
+        return []
+
+    def file_scan_with_timeouts(self, file_path: str) -> Tuple[List[Candidate], Dict[Tuple[str, str], int]]:
+        """Run scanning of file from 'file_paths' and collect regex timeouts of the file. Used in worker processes,
+            so the timeouts are passed to the main process together with the credentials
+
+        Args:
+            file_path: path to file to scan
+
+        Return:
+            List of credential candidates and dictionary of regex timeouts per rule name and file path
+        """
+        file_results = self.file_scan(file_path)
+        return file_results, self.scanner.pop_regex_timeouts()
 
     def post_processing(self) -> None:
         """Machine learning validation for received credential candidates"""
@@ -152,35 +490,69 @@ class CredSweeper:
             from credsweeper.ml_model import MlValidator
             MlValidator()
             logging.info(f"Run Ml Validation")
-            new_cred_list = []
-            cred_groups = self.credential_manager.group_credentials()
-            ml_cred_groups = []
-            for group_key, group_candidates in cred_groups.items():
-                # Analyze with ML if all candidates in group require ML
-                if all(candidate.use_ml for candidate in group_candidates):
-                    ml_cred_groups.append((group_key.value, group_candidates))
-                # If at least one of credentials in the group do not require ML - automatically report to user
-                else:
-                    for candidate in group_candidates:
-                        candidate.ml_validation = KeyValidationOption.NOT_AVAILABLE
-                    new_cred_list += group_candidates
-
-            pred = MlValidator.validate_groups(ml_cred_groups, self.ml_batch_size)
-            for i, (_, group_candidates) in enumerate(ml_cred_groups):
-                if pred[i]:
-                    for candidate in group_candidates:
-                        candidate.ml_validation = KeyValidationOption.VALIDATED_KEY
-                    new_cred_list += group_candidates
-
-            self.credential_manager.set_credentials(new_cred_list)
+            self.credential_manager.set_credentials(self.ml_validate(self.credential_manager.get_credentials()))
+
+    def ml_validate(self, candidates: List[Candidate]) -> List[Candidate]:
+        """Validate credential candidates with ML model, which is loaded by MlValidator constructor
+
+        Args:
+            candidates: credential candidates to validate, grouped by path, line and value
+
+        Return:
+            Candidates that are reported to user
+        """
+        from credsweeper.ml_model import MlValidator
+        credential_manager = CredentialManager()
+        credential_manager.add_credentials(candidates)
+        new_cred_list = []
+        cred_groups = credential_manager.group_credentials()
+        ml_cred_groups = []
+        for group_key, group_candidates in cred_groups.items():
+            # Analyze with ML if all candidates in group require ML
+            if all(candidate.use_ml for candidate in group_candidates):
+                ml_cred_groups.append((group_key.value, group_candidates))
+            # If at least one of credentials in the group do not require ML - automatically report to user
+            else:
+                for candidate in group_candidates:
+                    candidate.ml_validation = KeyValidationOption.NOT_AVAILABLE
+                new_cred_list += group_candidates
+
+        pred = MlValidator.validate_groups(ml_cred_groups, self.ml_batch_size)
+        for i, (_, group_candidates) in enumerate(ml_cred_groups):
+            if pred[i]:
+                for candidate in group_candidates:
+                    candidate.ml_validation = KeyValidationOption.VALIDATED_KEY
+                new_cred_list += group_candidates
+        return new_cred_list
 
     def export_results(self) -> None:
-        """Save credential candidates to json file"""
-        for credential in self.credential_manager.get_credentials():
+        """Print credential candidates and save them to json file"""
+        self.report_credentials(self.credential_manager.get_credentials())
+        self.export_json()
+
+    def report_credentials(self, candidates: List[Candidate]) -> None:
+        """Print credential candidates
+
+        Args:
+            candidates: credential candidates to print
+        """
+        for credential in candidates:
             print(credential)
+        # Output may be piped, it is flushed so reported credentials are seen during the scan
+        sys.stdout.flush()
 
+    def export_json(self) -> None:
+        """Save credential candidates to json file"""
         if self.json_filename:
             with open(self.json_filename, "w") as result_file:
                 json.dump([credential.to_json() for credential in self.credential_manager.get_credentials()],
                           result_file,
                           indent=4)
+
+    def report_regex_timeouts(self) -> None:
+        """Report summary of lines skipped because rule pattern search exceeded `regex_timeout`"""
+        if not self.regex_timeouts:
+            return
+        logging.warning(f"Lines skipped by regex timeout: {sum(self.regex_timeouts.values())}")
+        for (rule_name, file_path), count in sorted(self.regex_timeouts.items(), key=lambda item: -item[1]):
+            logging.warning(f"Regex timeout for rule: {rule_name} in file: {file_path} lines: {count}")
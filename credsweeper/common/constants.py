@@ -54,6 +54,19 @@ class RuleType(Enum):
     PEM_KEY = "pem_key"
 
 
+class GitIgnoreEngine(Enum):
+    """How to check files against gitignore rules"""
+    GIT = "git"
+    PYTHON = "python"
+
+
+class OversizePolicy(Enum):
+    """How to scan files larger than the max file size"""
+    SKIP = "skip"
+    HEAD = "head"
+    STREAM = "stream"
+
+
 class ThresholdPreset(Enum):
     """Preset threshold to simplify precision/recall selection for the user"""
     balanced = "balanced"
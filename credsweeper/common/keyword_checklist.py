@@ -1,14 +1,18 @@
 import os
-from typing import List
+from typing import List, Optional
 
 
 class KeywordChecklist:
     __keyword_list = None
+    # Keywords from keyword_checklist.txt, the file is read once per process
+    __file_keyword_list: Optional[List[str]] = None
 
     def __init__(self) -> None:
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        with open(os.path.join(dir_path, "keyword_checklist.txt"), "r", encoding='utf8') as f:
-            self.set_list(f.read().splitlines())
+        if KeywordChecklist.__file_keyword_list is None:
+            dir_path = os.path.dirname(os.path.realpath(__file__))
+            with open(os.path.join(dir_path, "keyword_checklist.txt"), "r", encoding='utf8') as f:
+                KeywordChecklist.__file_keyword_list = f.read().splitlines()
+        self.set_list(list(KeywordChecklist.__file_keyword_list))
 
     def get_list(self) -> List[str]:
         """Get list with keywords
@@ -1,7 +1,8 @@
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional
 
 from regex import regex
 
+from credsweeper.common.constants import GitIgnoreEngine, OversizePolicy
 from credsweeper.utils import Util
 
 
@@ -15,16 +16,64 @@ class Config:
     ]
 
     def __init__(self, config: Dict) -> None:
-        self.exclude_patterns: List[regex.Pattern] = [
-            regex.compile(pattern) for pattern in config["exclude"]["pattern"]
-        ]
+        self.exclude_patterns: List[regex.Pattern] = self.get_combined_patterns(config["exclude"]["pattern"])
         self.exclude_paths: List[str] = config["exclude"]["path"]
-        self.exclude_extensions: List[str] = config["exclude"]["extension"]
+        self.exclude_extensions: FrozenSet[str] = frozenset(config["exclude"]["extension"])
         self.source_extensions: List[str] = config["source_ext"]
         self.source_quote_ext: List[str] = config["source_quote_ext"]
         self.check_for_literals: bool = config["check_for_literals"]
-        self.not_allowed_path_pattern = regex.compile(f"{Util.get_regex_combine_or(self.NOT_ALLOWED_PATH)}",
-                                                      flags=regex.IGNORECASE)
+        self.exclude_path_pattern: regex.Pattern = self.get_exclude_path_pattern(self.exclude_paths)
         self.ml_validation: bool = config["validation"]["ml_validation"]
         self.api_validation: bool = config["validation"]["api_validation"]
         self.use_filters: bool = config["use_filters"]
+        self.buffer_scan: bool = config.get("buffer_scan", False)
+        self.long_line_scan: bool = config.get("long_line_scan", False)
+        self.regex_timeout: Optional[float] = config.get("regex_timeout")
+        self.cache_dir: Optional[str] = config.get("cache_dir")
+        self.max_file_size: Optional[int] = config.get("max_file_size")
+        self.oversize_policy: OversizePolicy = OversizePolicy(config.get("oversize_policy", OversizePolicy.SKIP.value))
+        self.gitignore_engine: GitIgnoreEngine = GitIgnoreEngine(
+            config.get("gitignore_engine", GitIgnoreEngine.GIT.value))
+
+    @classmethod
+    def get_exclude_path_pattern(cls, exclude_paths: List[str]) -> regex.Pattern:
+        """Compile NOT_ALLOWED_PATH and excluded path fragments into a single pattern for `match`. Match of a path
+            prefix is also a match of any path that starts with it, so the pattern is applied to directories too
+
+        Args:
+            exclude_paths: path fragments, a path is excluded if it contains any of them
+
+        Return:
+            Compiled pattern
+        """
+        pattern = f"(?i:{Util.get_regex_combine_or(cls.NOT_ALLOWED_PATH)})"
+        if not exclude_paths:
+            # Named list argument that is not used in the pattern is an error of regex.compile
+            return regex.compile(pattern)
+        # Named list is matched with a single lookup at each position, whatever the number of fragments
+        pattern += "|(?s:.*?)\\L<exclude_paths>"
+        return regex.compile(pattern, exclude_paths=exclude_paths)
+
+    @classmethod
+    def get_combined_patterns(cls, patterns: List[str]) -> List[regex.Pattern]:
+        """Compile patterns into a single alternation, so a path is matched with one call. Patterns with groups or
+            global flags would change their meaning in an alternation and are compiled separately
+
+        Args:
+            patterns: list of regex strings
+
+        Return:
+            List of compiled patterns, `match` of any of them is the same as `match` of any of the source patterns
+        """
+        default_flags = regex.compile("").flags
+        combined_patterns = []
+        separate_patterns = []
+        for pattern in patterns:
+            compiled_pattern = regex.compile(pattern)
+            if compiled_pattern.groups or compiled_pattern.flags != default_flags:
+                separate_patterns.append(compiled_pattern)
+            else:
+                combined_patterns.append(f"(?:{pattern})")
+        if combined_patterns:
+            separate_patterns.insert(0, regex.compile("|".join(combined_patterns)))
+        return separate_patterns
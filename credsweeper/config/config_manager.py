@@ -1,14 +1,14 @@
 import logging
 from pathlib import Path
 
-import yaml
-
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent.joinpath('secret')
 
 class ConfigManager:
     @staticmethod
     def load_conf(conf_file):
+        import yaml  # Imported on demand, as only logging configuration is loaded with the manager
+
         file_path = CONFIG_PATH.joinpath(conf_file)
         try:
             with open(file_path, 'r') as f:
@@ -1,5 +1,4 @@
-from multiprocessing import Manager
-from typing import List
+from typing import Any, Dict, Iterable, List
 
 from credsweeper.credentials import Candidate
 from credsweeper.credentials.candidate_group_generator import CandidateGroupGenerator, CandidateKey
@@ -8,11 +7,18 @@ from credsweeper.credentials.candidate_group_generator import CandidateGroupGene
 class CredentialManager:
     """The manager allows you to store, add and delete separate credit candidates
 
+    Candidates are stored in the main process only, worker processes pass their candidates with results of the scan
+    tasks, see `CredSweeper.scan`. Candidates are indexed by file path, by rule name and by group key as they are
+    added, so lookups and grouping do not go over all candidates
+
     Attributes:
         candidates: list of credential candidates
     """
     def __init__(self) -> None:
-        self.candidates: List[Candidate] = Manager().list()
+        self.candidates: List[Candidate] = []
+        self.__by_path: Dict[str, List[Candidate]] = {}
+        self.__by_rule: Dict[str, List[Candidate]] = {}
+        self.__groups: Dict[CandidateKey, List[Candidate]] = {}
 
     def get_credentials(self) -> List[Candidate]:
         """Get all credential candidates stored in the manager
@@ -22,13 +28,39 @@ class CredentialManager:
         """
         return self.candidates
 
+    def get_credentials_by_path(self, path: str) -> List[Candidate]:
+        """Get credential candidates found in a file
+
+        Args:
+            path: path to the file
+
+        Return:
+            List of candidates with line data of the file, in order they were added
+        """
+        return list(self.__by_path.get(path, []))
+
+    def get_credentials_by_rule(self, rule_name: str) -> List[Candidate]:
+        """Get credential candidates found by a rule
+
+        Args:
+            rule_name: name of the rule
+
+        Return:
+            List of candidates of the rule, in order they were added
+        """
+        return list(self.__by_rule.get(rule_name, []))
+
     def set_credentials(self, candidates: List[Candidate]) -> None:
         """Remove all current credentials candidates from the manager and add new credentials
 
         Args:
             candidates: List with candidates to replace current candidates in the manager
         """
-        self.candidates = candidates
+        self.candidates = []
+        self.__by_path = {}
+        self.__by_rule = {}
+        self.__groups = {}
+        self.add_credentials(candidates)
 
     def add_credential(self, candidate: Candidate) -> None:
         """Add credential candidate to the manager
@@ -37,6 +69,22 @@ class CredentialManager:
             candidate: credential candidate to be added
         """
         self.candidates.append(candidate)
+        self.__by_rule.setdefault(candidate.rule_name, []).append(candidate)
+        paths = set()
+        for line_data in candidate.line_data_list:
+            if line_data.path not in paths:
+                paths.add(line_data.path)
+                self.__by_path.setdefault(line_data.path, []).append(candidate)
+            self.__groups.setdefault(CandidateKey(line_data), []).append(candidate)
+
+    def add_credentials(self, candidates: Iterable[Candidate]) -> None:
+        """Add credential candidates to the manager
+
+        Args:
+            candidates: credential candidates to be added
+        """
+        for candidate in candidates:
+            self.add_credential(candidate)
 
     def remove_credential(self, candidate: Candidate) -> None:
         """Remove credential candidate from the manager
@@ -45,6 +93,19 @@ class CredentialManager:
             candidate: credential candidate to be removed
         """
         self.candidates.remove(candidate)
+        self._remove_from_index(self.__by_rule, candidate.rule_name, candidate)
+        for line_data in candidate.line_data_list:
+            self._remove_from_index(self.__by_path, line_data.path, candidate)
+            self._remove_from_index(self.__groups, CandidateKey(line_data), candidate)
+
+    @classmethod
+    def _remove_from_index(cls, index: Dict[Any, List[Candidate]], key: Any, candidate: Candidate) -> None:
+        candidates = index.get(key)
+        # Candidate is indexed once by path, even if several line data of the candidate have the path
+        if candidates is not None and candidate in candidates:
+            candidates.remove(candidate)
+            if not candidates:
+                del index[key]
 
     def group_credentials(self) -> CandidateGroupGenerator:
         """Join candidates that references same secret value in the same line.
@@ -54,12 +115,6 @@ class CredentialManager:
             CandidateGroupGenerator. Contain dictionary of [path, line_num, value] -> credential candidates list
         """
         groups = CandidateGroupGenerator()
-        for credential_candidate in self.get_credentials():
-            for line_data in credential_candidate.line_data_list:
-                # Match by file path+line num+value. Value required so two different credentials still be
-                #  processed independently
-                candidate_key = CandidateKey(line_data)
-                if candidate_key not in groups:
-                    groups[candidate_key] = list()
-                groups[candidate_key].append(credential_candidate)
+        for candidate_key, candidates in self.__groups.items():
+            groups[candidate_key] = list(candidates)
         return groups
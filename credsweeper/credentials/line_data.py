@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from regex import regex
 
@@ -13,31 +13,50 @@ class LineData:
         key: Optional[str] = None
         line: string variable, line
         line_num: int variable, number of line in file
+        end_line_num: int variable, number of the last line of the credential in file. Same as line_num, except
+            for credentials that span several lines, like PEM keys
+        column_offset: int variable, column of the value in the original file line. Not 0 only for windows of
+            lines that are too long to be scanned whole
         path: string variable, path to file
         pattern: regex pattern, detected pattern in line
         separator: optional string variable, separators between variable and value
         separator_span: optional tuple variable, separator position
         value: optional string variable, detected value in line
+        value_span: optional tuple variable, position of the value group of the match in line
         variable: optional string variable, detected variable in line
     """
     comment_starts = ["//", "*", "#", "/*", "<!––", "%{", "%", "...", "(*", "--", "--[[", "#="]
     bash_param_split = regex.compile("\\s+(\\-|\\||\\>|\\w+?\\>|\\&)")
-
-    def __init__(self, config: Config, line: str, line_num: int, path: str, pattern: regex.Pattern) -> None:
+    pattern_groups: Dict[regex.Pattern, FrozenSet[str]] = {}
+
+    def __init__(self,
+                 config: Config,
+                 line: str,
+                 line_num: int,
+                 path: str,
+                 pattern: regex.Pattern,
+                 match_obj: Optional[regex.Match] = None,
+                 match_groups: Optional[List[Any]] = None) -> None:
         self.config = config
         self.key: Optional[str] = None
         self.line: str = line
         self.line_num: int = line_num
+        self.end_line_num: int = line_num
+        self.column_offset: int = 0
         self.path: str = path
         self.pattern: regex.Pattern = pattern
         self.separator: Optional[str] = None
         self.separator_span: Optional[Tuple[int, int]] = None
         self.value: Optional[str] = None
+        self.value_span: Optional[Tuple[int, int]] = None
         self.variable: Optional[str] = None
         self.value_leftquote: Optional[str] = None
         self.value_rightquote: Optional[str] = None
 
-        self.initialize()
+        if match_groups is not None:
+            self.set_match_groups(match_groups)
+        else:
+            self.initialize(match_obj)
 
     @property
     def key(self) -> str:
@@ -63,6 +82,22 @@ class LineData:
     def line_num(self, line_num: int) -> None:
         self.__line_num = line_num
 
+    @property
+    def end_line_num(self) -> int:
+        return self.__end_line_num
+
+    @end_line_num.setter
+    def end_line_num(self, end_line_num: int) -> None:
+        self.__end_line_num = end_line_num
+
+    @property
+    def column_offset(self) -> int:
+        return self.__column_offset
+
+    @column_offset.setter
+    def column_offset(self, column_offset: int) -> None:
+        self.__column_offset = column_offset
+
     @property
     def path(self) -> str:
         return self.__path
@@ -103,6 +138,14 @@ class LineData:
     def value(self, value: str) -> None:
         self.__value = value
 
+    @property
+    def value_span(self) -> Tuple[int, int]:
+        return self.__value_span
+
+    @value_span.setter
+    def value_span(self, value_span: Tuple[int, int]) -> None:
+        self.__value_span = value_span
+
     @property
     def variable(self) -> str:
         return self.__variable
@@ -127,39 +170,76 @@ class LineData:
     def value_rightquote(self, value_rightquote: str) -> None:
         self.__value_rightquote = value_rightquote
 
-    def initialize(self) -> None:
-        """Setup all internal fields"""
-        self.set_pattern_match_groups()
+    def initialize(self, match_obj: Optional[regex.Match] = None) -> None:
+        """Setup all internal fields
+
+        Args:
+            match_obj: optional match of the pattern in the line, if it was already searched by the caller
+        """
+        self.set_pattern_match_groups(match_obj)
+
+    @classmethod
+    def get_pattern_groups(cls, pattern: regex.Pattern) -> FrozenSet[str]:
+        """Get names of the groups defined in the pattern. Names are computed once per pattern
 
-    def set_pattern_match_groups(self) -> None:
-        """Apply regex to the candidate line and setup internal fields based on match"""
-        match_obj = self.pattern.search(self.line)
+        Args:
+            pattern: compiled regex object
+
+        Return:
+            Frozen set of group names
+        """
+        groups = cls.pattern_groups.get(pattern)
+        if groups is None:
+            groups = frozenset(pattern.groupindex)
+            cls.pattern_groups[pattern] = groups
+        return groups
+
+    def set_pattern_match_groups(self, match_obj: Optional[regex.Match] = None) -> None:
+        """Setup internal fields based on match of the regex in the candidate line
+
+        Args:
+            match_obj: optional match of the pattern in the line. Pattern is applied to the line if not provided
+        """
         if match_obj is None:
-            return
-
-        def get_group_from_match_obj(match_obj: regex.Match, group: str) -> Optional[str]:
-            try:
-                return match_obj.group(group)
-            except Exception:
-                return None
-
-        def get_span_from_match_obj(match_obj: regex.Match, group: str) -> Optional[Tuple[int, int]]:
-            try:
-                return match_obj.span(group)
-            except Exception:
-                return None
-
-        self.key = get_group_from_match_obj(match_obj, "keyword")
-        self.separator = get_group_from_match_obj(match_obj, "separator")
-        self.separator_span = get_span_from_match_obj(match_obj, "separator")
-        self.value = get_group_from_match_obj(match_obj, "value")
-        self.variable = get_group_from_match_obj(match_obj, "variable")
-        self.value_leftquote = get_group_from_match_obj(match_obj, "value_leftquote")
-        self.value_rightquote = get_group_from_match_obj(match_obj, "value_rightquote")
+            match_obj = self.pattern.search(self.line)
+            if match_obj is None:
+                return
+
+        groups = self.get_pattern_groups(self.pattern)
+        self.key = match_obj.group("keyword") if "keyword" in groups else None
+        self.separator = match_obj.group("separator") if "separator" in groups else None
+        self.separator_span = match_obj.span("separator") if "separator" in groups else None
+        self.value = match_obj.group("value") if "value" in groups else None
+        self.value_span = match_obj.span("value") if "value" in groups else None
+        self.variable = match_obj.group("variable") if "variable" in groups else None
+        self.value_leftquote = match_obj.group("value_leftquote") if "value_leftquote" in groups else None
+        self.value_rightquote = match_obj.group("value_rightquote") if "value_rightquote" in groups else None
         self.clean_url_parameters()
         self.clean_bash_parameters()
         self.sanitize_variable()
 
+    def get_match_groups(self) -> List[Any]:
+        """Get fields set up from the match of the pattern, as plain data
+
+        Return:
+            List of key, separator, separator span, value, value span, variable, left and right quotes of the value
+        """
+        return [
+            self.key, self.separator, self.separator_span, self.value, self.value_span, self.variable,
+            self.value_leftquote, self.value_rightquote
+        ]
+
+    def set_match_groups(self, match_groups: List[Any]) -> None:
+        """Set up fields from the list of `get_match_groups`, so the pattern is not applied to the line again
+
+        Args:
+            match_groups: fields of line data set up from the match of the same pattern in the same line
+        """
+        self.key, self.separator, separator_span, self.value, value_span, self.variable, self.value_leftquote, \
+            self.value_rightquote = match_groups
+        self.separator_span = tuple(separator_span) if separator_span is not None else None
+        self.value_span = tuple(value_span) if value_span is not None else None
+
     def clean_url_parameters(self) -> None:
         """
         If line seem to be a URL - split by & character.
@@ -239,6 +319,8 @@ class LineData:
         return {
             "line": self.line,
             "line_num": self.line_num,
+            "end_line_num": self.end_line_num,
+            "column_offset": self.column_offset,
             "path": self.path,
             "value": self.value,
             "entropy_validation": Util.is_entropy_validate(self.value)
@@ -1,6 +1,5 @@
 import logging
 import logging.config
-import os
 from pathlib import Path
 
 from credsweeper.config import ConfigManager
@@ -49,9 +48,3 @@ class Logger:
         except (IOError, OSError):
             logging.basicConfig(level=logging.WARNING)
 
-
-log_level = os.getenv("LOG_LEVEL")
-if log_level is None:
-    log_level = "warning"
-
-Logger.init_logging(log_level)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from regex import regex
 
@@ -21,8 +21,11 @@ class Rule:
         patterns: regular expressions that can be used for detection
         pattern_type: single_pattern/multi_pattern/pem_key_pattern. single_pattern for simple single line credentials
             multi_pattern for credentials span for rew lines. pem_key_pattern for PEM like credentials
+        required_substrings: case folded literals, at least one of them is present in any line detected by the first
+            pattern. None if rule has no such literals and should be checked on every line
         use_ml: Should ML work on this credential or not. If not prediction based on regular expression and filter only
-        validations: List of Validation objects that can check this credential using external API
+        validations: List of Validation objects that can check this credential using external API. Empty if API
+            validation is disabled in config
     """
     SINGLE_PATTERN = "single_pattern"
     MULTI_PATTERN = "multi_pattern"
@@ -36,6 +39,7 @@ class Rule:
         self.filters: List[Filter] = rule_template.get("filter_type")
         self.patterns: List[regex.Pattern] = (rule_template["type"], rule_template["values"])
         self.pattern_type: Optional[str] = (rule_template["type"], rule_template["values"])
+        self.required_substrings: Optional[FrozenSet[str]] = Util.get_required_substrings(self.patterns[0])
         self.use_ml: bool = rule_template["use_ml"]
         self.validations: List[Validation] = rule_template.get("validations")
 
@@ -131,6 +135,14 @@ class Rule:
         elif len(values) > 1:
             self.__pattern_type = self.MULTI_PATTERN
 
+    @property
+    def required_substrings(self) -> Optional[FrozenSet[str]]:
+        return self.__required_substrings
+
+    @required_substrings.setter
+    def required_substrings(self, required_substrings: Optional[FrozenSet[str]]) -> None:
+        self.__required_substrings = required_substrings
+
     @property
     def use_ml(self) -> bool:
         return self.__use_ml
@@ -147,7 +159,9 @@ class Rule:
 
     @validations.setter
     def validations(self, validation_names: List[str]) -> None:
-        """Set api validations to the current rule. All string should be class names from `credsweeper.validations`
+        """Set api validations to the current rule. All string should be class names from `credsweeper.validations`.
+            Validation objects are created only if API validation is enabled, so modules of validations and their
+            dependencies are not imported otherwise
 
         Args:
             validation_names: List of validation names
@@ -156,10 +170,11 @@ class Rule:
 
         if validation_names is not None:
             for vn in validation_names:
-                validation_template = getattr(validations, vn, None)
-                if validation_template is None:
+                if vn not in validations.VALIDATION_MODULES:
                     raise ValueError(f'Malformed rule config file. Validation "{vn}" is invalid.')
-                selected_validations.append(validation_template())
+                if self.config.api_validation:
+                    validation_template = getattr(validations, vn)
+                    selected_validations.append(validation_template())
 
         self.__validations = selected_validations
 
@@ -0,0 +1,110 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from regex import regex
+
+import credsweeper
+from credsweeper.logger.logger import logging
+from credsweeper.rules.rule import Rule
+from credsweeper.utils import Util
+
+
+class RuleSetCache:
+    """Cache of the rule set loaded from a rule config file
+
+    Parsed rule templates and analysis of all rule patterns are stored as a json file in cache directory. Cache file
+    is keyed by hash of the rule config file, the package version, source of the pattern analysis code and Python
+    version, so the cache of the changed rule file, of another CredSweeper version or of changed analysis is never
+    used
+
+    Attributes:
+        cache_dir: directory to store cache files
+        FORMAT_VERSION: Int constant. Version of the cache file structure
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def get_key(cls, rule_file: bytes) -> str:
+        """Get cache key of the rule config file content for current package version and pattern analysis code
+
+        Args:
+            rule_file: content of the rule config file
+
+        Return:
+            Hex digest string
+        """
+        hasher = hashlib.sha256(rule_file)
+        hasher.update(f"\0{credsweeper.__version__}\0{cls.FORMAT_VERSION}".encode())
+        # Analysis depends on Util code and on the regex parser of the Python version
+        hasher.update(f"\0{Util.get_source_hash([inspect.getfile(Util)])}\0{sys.version_info[:2]}".encode())
+        return hasher.hexdigest()
+
+    def get_cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"rules_{key[:32]}.json")
+
+    def load(self, rule_file: bytes) -> Optional[List[Dict]]:
+        """Load rule templates of the rule config file from cache. Pattern analysis from cache is set to
+            `Util.pattern_analysis`, so it is not computed when rules are created
+
+        Args:
+            rule_file: content of the rule config file
+
+        Return:
+            List of rule templates, or None if there is no valid cache for the rule file
+        """
+        key = self.get_key(rule_file)
+        try:
+            with open(self.get_cache_path(key), "r") as f:
+                cache = json.load(f)
+            if cache["key"] != key:
+                return None
+            pattern_analysis = {}
+            for pattern, verbose, required, buffer_searchable, max_match_length in cache["pattern_analysis"]:
+                required_set = frozenset(required) if required is not None else None
+                pattern_analysis[(pattern, verbose)] = (required_set, buffer_searchable, max_match_length)
+            rule_templates = cache["rule_templates"]
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logging.debug(f"Rule set cache is not loaded: {exc}")
+            return None
+        Util.pattern_analysis.update(pattern_analysis)
+        return rule_templates
+
+    def save(self, rule_file: bytes, rule_templates: List[Dict], rules: List[Rule]) -> None:
+        """Save rule templates and analysis of patterns of created rules to cache. Errors are ignored, so the
+            scan works with read-only cache directory
+
+        Args:
+            rule_file: content of the rule config file
+            rule_templates: rule templates parsed from the rule config file
+            rules: rules created from the templates
+        """
+        key = self.get_key(rule_file)
+        pattern_analysis = []
+        for rule in rules:
+            for pattern in rule.patterns:
+                required, buffer_searchable, max_match_length = Util.get_pattern_analysis(pattern)
+                verbose = bool(pattern.flags & regex.VERBOSE)
+                required_list = sorted(required) if required is not None else None
+                pattern_analysis.append([pattern.pattern, verbose, required_list, buffer_searchable, max_match_length])
+        cache = {"key": key, "rule_templates": rule_templates, "pattern_analysis": pattern_analysis}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to temporary file first, so concurrent processes never read a partially written cache
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, self.get_cache_path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as exc:
+            logging.debug(f"Rule set cache is not saved: {exc}")
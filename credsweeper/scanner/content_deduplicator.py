@@ -0,0 +1,113 @@
+import os
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from credsweeper.logger.logger import logging
+from credsweeper.scanner.scan_cache import ScanCache
+from credsweeper.utils import Util
+
+
+class ContentDeduplicator:
+    """Skip files with the same content as a file that is already scanned, and copy its findings to them
+
+    Files are compared by size and extension first, so a file is read and hashed only if another file of the same
+    size and extension was seen. Extension is compared because filters check if the file is a source file
+
+    Results of the scanned files may come in any order. Findings are copied to a skipped file as soon as the file with
+    the same content is scanned, so only records of the scanned files with findings and skipped files that wait for
+    their file are kept
+
+    Attributes:
+        duplicates_count: number of skipped paths
+    """
+    def __init__(self) -> None:
+        self.duplicates_count = 0
+        # Skipped paths with index of the unique path with the same content, not yet given by `pop_copies`
+        self.__duplicates: Deque[Tuple[str, int]] = deque()
+        # Size and extension -> index and path of the first file, or None if the file is already hashed
+        self.__sizes: Dict[Tuple[int, str], Optional[Tuple[int, str]]] = {}
+        self.__hashes: Dict[Tuple[int, str, str], int] = {}
+        # Flag for each index of unique path that its results are added
+        self.__scanned = bytearray()
+        self.__records: Dict[int, List[Any]] = {}
+        self.__waiting: Dict[int, List[str]] = {}
+
+    def filter_unique(self, file_paths: Iterable[str]) -> Iterator[Tuple[str, int]]:
+        """Remove files with the same content as a previous file lazily, keeping the order of the paths
+
+        Args:
+            file_paths: paths of files to be scanned
+
+        Return:
+            Iterator over the paths with unique content and their file sizes. Paths that cannot be read are passed
+                as unique with zero size
+        """
+        index = 0
+        for file_path in file_paths:
+            unique_index, size = self._get_unique_index(file_path, index)
+            if unique_index is None:
+                yield file_path, size
+                index += 1
+            else:
+                self.__duplicates.append((file_path, unique_index))
+                self.duplicates_count += 1
+        if self.duplicates_count:
+            logging.info(f"Files with duplicated content are not scanned: {self.duplicates_count}")
+
+    def _get_unique_index(self, file_path: str, index: int) -> Tuple[Optional[int], int]:
+        try:
+            size_key = (os.path.getsize(file_path), Util.get_extension(file_path))
+        except OSError:
+            return None, 0
+        if size_key not in self.__sizes:
+            self.__sizes[size_key] = (index, file_path)
+            return None, size_key[0]
+        first = self.__sizes[size_key]
+        if first is not None:
+            # First file of the size is hashed only when the second one is seen
+            self.__sizes[size_key] = None
+            self._add_hash(size_key, *first)
+        unique_index = self._add_hash(size_key, index, file_path)
+        return None if unique_index is None or unique_index == index else unique_index, size_key[0]
+
+    def _add_hash(self, size_key: Tuple[int, str], index: int, file_path: str) -> Optional[int]:
+        try:
+            content_hash = ScanCache.get_content_hash(file_path)
+        except OSError:
+            return None
+        return self.__hashes.setdefault((*size_key, content_hash), index)
+
+    def add_records(self, index: int, records: List[Any]) -> List[Tuple[str, List[Any]]]:
+        """Add findings of a scanned path and copy them to the skipped paths with the same content seen so far
+
+        Args:
+            index: index of the path in `filter_unique` output
+            records: records of credential candidates of the path, see `ScanCache.get_records`
+
+        Return:
+            Skipped paths that waited for the path, with records of their findings. Paths without findings are not
+                given
+        """
+        if len(self.__scanned) <= index:
+            self.__scanned.extend(bytes(index + 1 - len(self.__scanned)))
+        self.__scanned[index] = 1
+        if records:
+            self.__records[index] = records
+        waiting = self.__waiting.pop(index, [])
+        return [(file_path, records) for file_path in waiting] if records else []
+
+    def pop_copies(self) -> List[Tuple[str, List[Any]]]:
+        """Take skipped paths found by `filter_unique` since the previous call. Paths of already scanned content get
+            findings of that content, others wait for `add_records` of their path with the same content
+
+        Return:
+            Skipped paths with records of their findings. Paths without findings are not given
+        """
+        copies = []
+        while self.__duplicates:
+            file_path, unique_index = self.__duplicates.popleft()
+            if unique_index >= len(self.__scanned) or not self.__scanned[unique_index]:
+                self.__waiting.setdefault(unique_index, []).append(file_path)
+            elif unique_index in self.__records:
+                copies.append((file_path, self.__records[unique_index]))
+        return copies
@@ -0,0 +1,92 @@
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set
+
+from regex import regex
+
+from credsweeper.utils.text_lines import TextLines
+
+
+class LiteralIndex:
+    """Multi-literal prefilter that selects rules that can be detected in a line
+
+    All required literals of the rules are compiled to a single case-insensitive string set automaton, so a line is
+    searched once no matter how many rules are loaded. Rules without required literals are selected for every line
+
+    Attributes:
+        rules_count: number of indexed rules
+        always_rule_indices: indices of rules without required literals
+        literal_rule_indices: case folded literal -> sorted indices of rules selected when the literal is found
+        literal_pattern: compiled automaton of all literals, None if no rule has literals
+    """
+    def __init__(self, rules_required_substrings: Sequence[Optional[FrozenSet[str]]]) -> None:
+        self.rules_count = len(rules_required_substrings)
+        self.always_rule_indices: List[int] = []
+        rule_indices: Dict[str, Set[int]] = {}
+        for rule_index, required_substrings in enumerate(rules_required_substrings):
+            if not required_substrings:
+                self.always_rule_indices.append(rule_index)
+                continue
+            for literal in required_substrings:
+                rule_indices.setdefault(literal.casefold(), set()).add(rule_index)
+
+        # At any position automaton reports the longest literal only. All shorter literals that start at the same
+        #  position are prefixes of it, so they should select their rules too
+        self.literal_rule_indices: Dict[str, List[int]] = {}
+        for literal in rule_indices:
+            selected = set()
+            for prefix, prefix_rule_indices in rule_indices.items():
+                if literal.startswith(prefix):
+                    selected.update(prefix_rule_indices)
+            self.literal_rule_indices[literal] = sorted(selected)
+
+        self.literal_pattern: Optional[regex.Pattern] = None
+        if rule_indices:
+            self.literal_pattern = regex.compile(r"\L<literals>", literals=list(rule_indices), flags=regex.IGNORECASE)
+
+    def get_rule_indices(self, line: str) -> List[int]:
+        """Get indices of rules whose required literals are present in the line
+
+        Args:
+            line: line to check
+
+        Return:
+            Sorted list of rule indices
+        """
+        if self.literal_pattern is None:
+            return self.always_rule_indices
+        selected: Set[int] = set()
+        for match_obj in self.literal_pattern.finditer(line, overlapped=True):
+            literal_rule_indices = self.literal_rule_indices.get(match_obj.group().casefold())
+            if literal_rule_indices is None:
+                # Case folding of the matched text differs from the literal: cannot narrow the rules down
+                return list(range(self.rules_count))
+            selected.update(literal_rule_indices)
+        if not selected:
+            return self.always_rule_indices
+        selected.update(self.always_rule_indices)
+        return sorted(selected)
+
+    def get_rule_line_nums(self, lines: TextLines) -> List[Optional[Set[int]]]:
+        """Search literals over the whole text buffer at once and map them to lines of each rule
+
+        Args:
+            lines: lines of the text buffer to search
+
+        Return:
+            For each rule, set of numbers of lines where the rule required literals are present. None for rules
+                without required literals
+        """
+        always_rule_indices = set(self.always_rule_indices)
+        rule_line_nums: List[Optional[Set[int]]] = [
+            None if rule_index in always_rule_indices else set() for rule_index in range(self.rules_count)
+        ]
+        if self.literal_pattern is None:
+            return rule_line_nums
+        for match_obj in self.literal_pattern.finditer(lines.text, overlapped=True):
+            line_num = lines.get_line_num(match_obj.start())
+            literal_rule_indices = self.literal_rule_indices.get(match_obj.group().casefold())
+            if literal_rule_indices is None:
+                literal_rule_indices = range(self.rules_count)
+            for rule_index in literal_rule_indices:
+                if rule_index not in always_rule_indices:
+                    rule_line_nums[rule_index].add(line_num)
+        return rule_line_nums
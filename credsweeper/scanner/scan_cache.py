@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+import credsweeper
+from credsweeper.credentials import Candidate, LineData
+from credsweeper.logger.logger import logging
+from credsweeper.rules import Rule
+from credsweeper.utils import Util
+
+
+class ScanCache:
+    """Persistent cache of findings of scanned files, keyed by file content hash, file extension and fingerprint of
+    rules, config and package code. Extension is a part of the key because filters check if the file is a source file
+
+    Findings are stored as plain records in a SQLite database in the cache directory, so worker processes share the
+    cache and a file with the same content is answered from it without reading and scanning. Status of each path
+    (size, modification time and inode) is stored with its content hash, so a file that was not modified since the
+    previous run is not even read. Total size of the records is bounded, least recently used records are evicted
+
+    Attributes:
+        cache_path: path to the database file
+        fingerprint: hash of the rule set and of the configs that change findings
+        max_size: max total size of the stored records in bytes
+        FORMAT_VERSION: Int constant. Version of the record structure
+        MAX_SIZE: Int constant. Default max total size of the stored records in bytes
+    """
+    FORMAT_VERSION = 4
+    MAX_SIZE = 1 << 30
+    DB_NAME = "scan_cache.sqlite3"
+    HASH_SIZE = 20
+    RACY_TIME_NS = 2_000_000_000
+    # Connection of the current process for each database path
+    connections: Dict[str, sqlite3.Connection] = {}
+    # Fingerprint of the package code, computed once per process
+    code_fingerprint: Optional[str] = None
+
+    def __init__(self, cache_dir: str, fingerprint: str, max_size: int = MAX_SIZE) -> None:
+        self.cache_path = os.path.join(cache_dir, self.DB_NAME)
+        self.fingerprint = fingerprint
+        self.max_size = max_size
+        self.used = int(time.time())
+
+    @classmethod
+    def get_fingerprint(cls, rule_set_key: str, rules: List[Rule], config_dict: Dict[str, Any]) -> str:
+        """Get fingerprint of the rule set, of the configs that change findings and of the package code
+
+        Args:
+            rule_set_key: key of the rule config file content and package version, see `RuleSetCache.get_key`
+            rules: rules of the scanner. Records refer to rules by index, so the rules are included in their order
+            config_dict: configs used to create Config object. Validation options and cache directory do not
+                change findings of the scan and are not included
+
+        Return:
+            Hex digest string
+        """
+        scan_config = {key: value for key, value in config_dict.items() if key not in ("validation", "cache_dir")}
+        hasher = hashlib.sha256(rule_set_key.encode())
+        hasher.update(
+            json.dumps([[rule.rule_name, rule.severity.value, [pattern.pattern for pattern in rule.patterns]]
+                        for rule in rules]).encode())
+        hasher.update(json.dumps(scan_config, sort_keys=True).encode())
+        hasher.update(f"\0{cls.FORMAT_VERSION}\0{cls.get_code_fingerprint()}".encode())
+        return hasher.hexdigest()
+
+    @classmethod
+    def get_code_fingerprint(cls) -> str:
+        """Get fingerprint of the package version, of the package sources and of the keyword checklist, so findings
+            cached by other scanner or filter code are not used, even if the package version is the same
+
+        Return:
+            Hex digest string
+        """
+        if cls.code_fingerprint is None:
+            package_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+            file_paths = [os.path.join(package_dir, "common", "keyword_checklist.txt")]
+            for dir_path, dir_names, file_names in os.walk(package_dir):
+                dir_names.sort()
+                file_paths.extend(
+                    os.path.join(dir_path, file_name) for file_name in sorted(file_names) if file_name.endswith(".py"))
+            cls.code_fingerprint = f"{credsweeper.__version__}\0{Util.get_source_hash(file_paths)}"
+        return cls.code_fingerprint
+
+    def get_connection(self) -> Optional[sqlite3.Connection]:
+        """Get connection to the database of the current process. Database is created if absent
+
+        Return:
+            Connection object, or None if the database cannot be opened
+        """
+        connection = self.connections.get(self.cache_path)
+        if connection is None:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                connection = sqlite3.connect(self.cache_path, timeout=60, isolation_level=None)
+                # Cache can be rebuilt, so durability is traded for speed of the writes
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=OFF")
+                connection.execute("CREATE TABLE IF NOT EXISTS findings"
+                                   " (key TEXT PRIMARY KEY, hash TEXT, records TEXT, size INTEGER, used INTEGER)")
+                connection.execute("CREATE INDEX IF NOT EXISTS findings_used ON findings (used)")
+                connection.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, stat TEXT, hash TEXT)")
+            except (OSError, sqlite3.Error) as exc:
+                logging.warning(f"Scan cache is not available in {self.cache_path}: {exc}")
+                return None
+            self.connections[self.cache_path] = connection
+        return connection
+
+    def get_key(self, file_path: str) -> Optional[str]:
+        """Get cache key of the file content. Content hash is taken from the cache if the file status is the same as
+            when the hash was computed, otherwise the file is read and hashed
+
+        Args:
+            file_path: path to the file
+
+        Return:
+            Key string: prefix of the fingerprint, content hash and file extension. None if the file cannot be read
+                or the cache is not available
+        """
+        connection = self.get_connection()
+        if connection is None:
+            return None
+        try:
+            path = os.path.abspath(file_path)
+            stat = os.stat(path)
+            stat_key = f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ctime_ns}:{stat.st_ino}:{stat.st_dev}"
+            row = connection.execute("SELECT stat, hash FROM files WHERE path = ?", (path, )).fetchone()
+            if row is not None and row[0] == stat_key:
+                content_hash = row[1]
+            else:
+                content_hash = self.get_content_hash(path)
+                # File modified right before it was hashed may be modified again without change of the status
+                if time.time_ns() - stat.st_mtime_ns > self.RACY_TIME_NS:
+                    connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                                       (path, stat_key, content_hash))
+        except (OSError, sqlite3.Error) as exc:
+            logging.debug(f"Scan cache key is not available for {file_path}: {exc}")
+            return None
+        return f"{self.fingerprint[:32]}{content_hash}{Util.get_extension(path)}"
+
+    @classmethod
+    def get_content_hash(cls, file_path: str) -> str:
+        """Get hash of the file content
+
+        Args:
+            file_path: path to the file
+
+        Return:
+            Hex digest string
+        """
+        hasher = hashlib.blake2b(digest_size=cls.HASH_SIZE)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+
+    def load(self, key: str) -> Optional[List[Any]]:
+        """Load records of the findings of file content
+
+        Args:
+            key: cache key of the file content
+
+        Return:
+            List of records, or None if the content is not cached
+        """
+        connection = self.get_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute("SELECT records, used FROM findings WHERE key = ?", (key, )).fetchone()
+            if row is None:
+                return None
+            if row[1] < self.used:
+                connection.execute("UPDATE findings SET used = ? WHERE key = ?", (self.used, key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as exc:
+            logging.debug(f"Scan cache is not loaded: {exc}")
+            return None
+
+    def save(self, key: str, records: List[Any]) -> None:
+        """Save records of the findings of file content. Errors are ignored, so the scan works without the cache
+
+        Args:
+            key: cache key of the file content
+            records: records of the findings, see `get_records`
+        """
+        connection = self.get_connection()
+        if connection is None:
+            return
+        data = json.dumps(records, separators=(",", ":"))
+        # Content hash is stored apart from the key to find status of paths which content is no longer cached
+        try:
+            connection.execute("INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?)",
+                               (key, key[32:32 + self.HASH_SIZE * 2], data, len(key) + len(data), self.used))
+        except sqlite3.Error as exc:
+            logging.debug(f"Scan cache is not saved: {exc}")
+
+    def evict(self) -> None:
+        """Remove least recently used records while total size of the records is over max_size, and remove status
+            of the paths which content is no longer cached"""
+        connection = self.get_connection()
+        if connection is None:
+            return
+        try:
+            total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM findings").fetchone()[0]
+            if total_size <= self.max_size:
+                return
+            removed_size = 0
+            removed_keys = []
+            cursor = connection.execute("SELECT key, size FROM findings ORDER BY used")
+            for key, size in cursor:
+                if total_size - removed_size <= self.max_size:
+                    break
+                removed_keys.append((key, ))
+                removed_size += size
+            cursor.close()
+            connection.execute("BEGIN")
+            connection.executemany("DELETE FROM findings WHERE key = ?", removed_keys)
+            connection.execute("DELETE FROM files WHERE hash NOT IN (SELECT hash FROM findings)")
+            connection.execute("COMMIT")
+            logging.info(f"Scan cache records evicted: {len(removed_keys)}")
+        except sqlite3.Error as exc:
+            logging.warning(f"Scan cache is not evicted: {exc}")
+
+    @classmethod
+    def get_records(cls, candidates: List[Candidate], rules: List[Rule]) -> List[Any]:
+        """Convert candidates to plain records. Rules, patterns and config are not included, they are referred by
+            rule index and pattern index, and file path is not included. Rule names are not unique, so the name does
+            not refer to a rule
+
+        Args:
+            candidates: candidates found in a file
+            rules: rules of the scanner that found the candidates
+
+        Return:
+            List of records: rule index and, for each line data, pattern index, line, line number, end line number,
+                column offset and groups of the pattern match, see `LineData.get_match_groups`
+        """
+        # Candidate refers to the patterns of its rule
+        rule_indexes = {id(rule.patterns): rule_index for rule_index, rule in enumerate(rules)}
+        return [[
+            rule_indexes[id(candidate.patterns)],
+            [[
+                candidate.patterns.index(line_data.pattern), line_data.line, line_data.line_num,
+                line_data.end_line_num, line_data.column_offset, line_data.get_match_groups()
+            ] for line_data in candidate.line_data_list]
+        ] for candidate in candidates]
+
+    @classmethod
+    def get_candidates(cls, records: List[Any], file_path: str, rules: List[Rule]) -> List[Candidate]:
+        """Create candidates from plain records with rules and config of the current process
+
+        Args:
+            records: records of the findings, see `get_records`
+            file_path: path to the file of the findings
+            rules: rules of the scanner, in the same order as in `get_records`
+
+        Return:
+            List of candidates
+        """
+        candidates = []
+        for rule_index, line_data_records in records:
+            rule = rules[rule_index]
+            line_data_list = []
+            for pattern_index, line, line_num, end_line_num, column_offset, match_groups in line_data_records:
+                line_data = LineData(rule.config,
+                                     line,
+                                     line_num,
+                                     file_path,
+                                     rule.patterns[pattern_index],
+                                     match_groups=match_groups)
+                line_data.end_line_num = end_line_num
+                line_data.column_offset = column_offset
+                line_data_list.append(line_data)
+            candidates.append(
+                Candidate(line_data_list, rule.patterns, rule.rule_name, rule.severity, rule.validations, rule.use_ml))
+        return candidates
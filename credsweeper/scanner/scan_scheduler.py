@@ -0,0 +1,108 @@
+import heapq
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from credsweeper.logger.logger import logging
+
+
+class ScanScheduler:
+    """Order files to scan largest first, pack them into chunks of balanced scan cost, and account work of workers
+
+    Paths are held in a window ordered by size, and the largest one is sent first, so a big file is not left to the
+    end of the scan when other workers are idle. Smaller files are packed into chunks of about the same scan cost, so
+    each task takes about the same time. Cost of a file is its size and FILE_COST for opening the file
+
+    Attributes:
+        WINDOW_SIZE: Int constant. Max number of paths ordered at once, so the whole scan is ordered if it has no
+            more paths
+        WINDOW_STEP: Int constant. Max number of paths taken from the input for a chunk. Workers do not wait for the
+            whole window at the start, and the window grows faster than chunks take paths from it
+        FILE_COST: Int constant. Scan cost of a file besides its size, in bytes
+        MAX_CHUNK_SIZE: Int constant. Max number of files in a chunk
+        workers: number of files, their cost and busy time in seconds for each worker process id
+        scan_time: time in seconds from creation of the scheduler to the last completed chunk
+    """
+    WINDOW_SIZE = 100000
+    WINDOW_STEP = 1024
+    FILE_COST = 4096
+    MAX_CHUNK_SIZE = 256
+
+    def __init__(self, sized_paths: Iterable[Tuple[str, int]]) -> None:
+        """Create scheduler
+
+        Args:
+            sized_paths: paths to scan with file sizes. Index of a path in the iterable is passed with it
+        """
+        self.__sized_paths = enumerate(sized_paths)
+        # Heap of negative cost, index and path, so the largest file with the lowest index is the first
+        self.__window: List[Tuple[int, int, str]] = []
+        # First index of a chunk -> number of files and cost of the chunk
+        self.__tasks: Dict[int, Tuple[int, int]] = {}
+        # Cost scanned per second by a worker, it is not known before the first chunk is completed
+        self.__throughput: Optional[float] = None
+        self.__start_time = time.perf_counter()
+        self.workers: Dict[int, Tuple[int, int, float]] = {}
+        self.scan_time = 0.0
+
+    def get_chunk(self, chunk_time: float) -> List[Tuple[int, str]]:
+        """Take the largest files from the window, up to cost that a worker scans in chunk_time
+
+        Args:
+            chunk_time: expected scan time of the chunk in seconds. Chunks have a file each until scan time of a
+                chunk is known
+
+        Return:
+            Indexes and paths of files to scan at once, largest first. Empty list if all paths are taken
+        """
+        self._fill_window()
+        chunk_cost = 0 if self.__throughput is None else chunk_time * self.__throughput
+        chunk: List[Tuple[int, str]] = []
+        cost = 0
+        while self.__window and len(chunk) < self.MAX_CHUNK_SIZE:
+            file_cost = -self.__window[0][0]
+            if chunk and cost + file_cost > chunk_cost:
+                break
+            _, index, file_path = heapq.heappop(self.__window)
+            chunk.append((index, file_path))
+            cost += file_cost
+        if chunk:
+            self.__tasks[chunk[0][0]] = (len(chunk), cost)
+        return chunk
+
+    def _fill_window(self) -> None:
+        for _ in range(min(self.WINDOW_STEP, self.WINDOW_SIZE - len(self.__window))):
+            sized_path = next(self.__sized_paths, None)
+            if sized_path is None:
+                break
+            index, (file_path, size) = sized_path
+            heapq.heappush(self.__window, (-(size + self.FILE_COST), index, file_path))
+
+    def complete_chunk(self, first_index: int, worker_id: int, chunk_scan_time: float) -> None:
+        """Account scan of a chunk given by `get_chunk`
+
+        Args:
+            first_index: index of the first file of the chunk
+            worker_id: id of the worker process that scanned the chunk
+            chunk_scan_time: scan time of the chunk in seconds, measured by the worker
+        """
+        files_count, cost = self.__tasks.pop(first_index)
+        # Average with the previous value, so a single slow file does not shrink chunks for long
+        chunk_throughput = cost / max(chunk_scan_time, 1e-6)
+        self.__throughput = chunk_throughput if self.__throughput is None else \
+            (self.__throughput + chunk_throughput) / 2
+        worker_files_count, worker_cost, worker_time = self.workers.get(worker_id, (0, 0, 0.0))
+        self.workers[worker_id] = (worker_files_count + files_count, worker_cost + cost, worker_time + chunk_scan_time)
+        self.scan_time = time.perf_counter() - self.__start_time
+
+    def report_utilization(self, pool_count: int) -> None:
+        """Report busy time of each worker process relative to the scan time
+
+        Args:
+            pool_count: number of worker processes in the pool
+        """
+        if not self.workers or self.scan_time <= 0:
+            return
+        logging.info(f"Scan time: {self.scan_time:.3f}s, workers used: {len(self.workers)} of {pool_count}")
+        for worker_id, (files_count, cost, worker_time) in sorted(self.workers.items()):
+            logging.info(f"Worker {worker_id} files: {files_count} cost: {cost} busy: {worker_time:.3f}s"
+                         f" utilization: {100 * worker_time / self.scan_time:.1f}%")
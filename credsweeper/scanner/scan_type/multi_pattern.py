@@ -1,9 +1,14 @@
-from typing import List, Optional
+import copy
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
 
 from credsweeper.config import Config
-from credsweeper.credentials import Candidate
+from credsweeper.credentials import Candidate, LineData
+from credsweeper.logger.logger import logging
 from credsweeper.rules import Rule
 from credsweeper.scanner.scan_type import ScanType
+from credsweeper.utils import Util
+from credsweeper.utils.text_lines import TextLines
 
 
 class MultiPattern(ScanType):
@@ -16,8 +21,14 @@ class MultiPattern(ScanType):
     MAX_SEARCH_MARGIN = 10
 
     @classmethod
-    def run(cls, config: Config, line: str, line_num: int, file_path: str, rule: Rule,
-            lines: List[str]) -> Optional[Candidate]:
+    def run(cls,
+            config: Config,
+            line: str,
+            line_num: int,
+            file_path: str,
+            rule: Rule,
+            lines: List[str],
+            file_cache: Optional[Dict[Any, Any]] = None) -> Optional[Candidate]:
         """Check if multiline credential present if the file within MAX_SEARCH_MARGIN range from current line_num
 
         Args:
@@ -27,6 +38,8 @@ class MultiPattern(ScanType):
             file_path: Path to the file that contain current line
             rule: Rule object to check current line. Should be a multi-pattern rule
             lines: All lines if the file
+            file_cache: Optional dictionary shared by all rules while the file is scanned. Index of the second part
+                lines is stored there, so it is built once per file
 
         Return:
             Candidate object if pattern defined in a rule is present in a line and second part of multi-pattern rule is
@@ -34,52 +47,102 @@ class MultiPattern(ScanType):
         """
         assert rule.pattern_type == rule.MULTI_PATTERN, \
             "Rules provided to MultiPattern.run should have pattern_type equal to MULTI_PATTERN"
-        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters)
+        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters,
+                                      file_cache)
 
         if line_data is None:
             return None
 
-        candidate = Candidate([line_data], rule.patterns, rule.rule_name, rule.severity, rule.validations, rule.use_ml)
-        line_num_margin = 1
-
-        while line_num_margin <= cls.MAX_SEARCH_MARGIN:
-            if candidate.line_data_list[0].line_num - line_num_margin >= 1 \
-                and cls.scan(config, candidate, -line_num_margin, lines, file_path, rule):
-                break
-            if candidate.line_data_list[0].line_num + line_num_margin <= len(lines) \
-                and cls.scan(config, candidate, line_num_margin, lines, file_path, rule):
-                break
-            line_num_margin += 1
-
-        # Check if found multi line
-        if len(candidate.line_data_list) == 1:
+        if file_cache is None:
+            file_cache = {}
+        index_key = (cls.__name__, id(rule))
+        if index_key not in file_cache:
+            file_cache[index_key] = cls.get_second_part_index(config, file_path, rule, lines, file_cache)
+        second_part_line_nums, second_part_line_data = file_cache[index_key]
+
+        second_line_num = cls.get_nearest_line_num(second_part_line_nums, line_data.line_num)
+        if second_line_num is None:
             return None
 
+        candidate = Candidate([line_data], rule.patterns, rule.rule_name, rule.severity, rule.validations, rule.use_ml)
+        # Second part may be near several lines, so each candidate gets own copy of the line data
+        candidate.add_line_data(copy.copy(second_part_line_data[second_line_num]))
         return candidate
 
     @classmethod
-    def scan(cls, config: Config, candidate: Candidate, line_num_margin: int, lines: List[str],
-             file_path: str, rule: Rule) -> bool:
-        """Search for second part of multiline rule near the current line. Automatically update candidate with
-            detected line if any
-
-        Attributes:
-            candidate: Current credential candidate detected in the line
-            line_num_margin: Number of lines around candidate to perform search
-            lines: All lines if the file
+    def get_second_part_index(cls, config: Config, file_path: str, rule: Rule, lines: List[str],
+                              file_cache: Dict[Any, Any]) -> Tuple[List[int], Dict[int, LineData]]:
+        """Find all lines of the file with second part of the rule that are not removed by filters
+
+        Lines are located by searching the second pattern over the whole text, when the pattern allows it, and each
+        located line is checked with filters once
+
+        Args:
+            config: user configs
             file_path: Path to the file that contain current line
-            rule: Rule object to check current line. Should be a multi-pattern rule
+            rule: Rule object. Should be a multi-pattern rule
+            lines: All lines if the file
+            file_cache: Dictionary shared by all rules while the file is scanned
 
         Return:
-            Boolean. True if second part detected. False otherwise
+            Sorted list of line numbers with the second part, and dictionary of line number to line data
         """
-        candi_line_num = candidate.line_data_list[0].line_num + line_num_margin
-        candi_line = lines[candi_line_num - 1]
+        pattern = rule.patterns[1]
+        line_nums = range(1, len(lines) + 1)
+        if Util.is_buffer_searchable(pattern):
+            text_lines = cls.get_text_lines(lines, file_cache)
+            if text_lines is not None:
+                try:
+                    line_nums = text_lines.find_line_nums(pattern, config.regex_timeout)
+                except TimeoutError:
+                    # Search of the whole text took too long, every line is checked with its own timeout
+                    logging.debug(f"Regex timeout for rule: {rule.rule_name} in file: {file_path}")
+
+        line_data_index: Dict[int, LineData] = {}
+        for line_num in line_nums:
+            line = lines[line_num - 1]
+            if not cls.is_valid_line_length(line):
+                continue
+            line_data = cls.get_line_data(config, line, line_num, file_path, pattern, rule.filters, file_cache)
+            if line_data is not None:
+                line_data_index[line_num] = line_data
+        return sorted(line_data_index), line_data_index
 
-        line_data = cls.get_line_data(config, candi_line, candi_line_num, file_path, rule.patterns[1], rule.filters)
+    @classmethod
+    def get_text_lines(cls, lines: List[str], file_cache: Dict[Any, Any]) -> Optional[TextLines]:
+        """Get lines of the file as a single text buffer. Buffer is joined once per file
 
-        if line_data is None:
-            return False
+        Return:
+            TextLines object with same lines, or None if the lines cannot be joined without changing line numbers
+        """
+        if isinstance(lines, TextLines):
+            return lines
+        key = (cls.__name__, TextLines.__name__)
+        if key not in file_cache:
+            text_lines = TextLines("\n".join(lines))
+            # Lines that contain line break characters themselves would shift line numbers
+            file_cache[key] = text_lines if len(text_lines) == len(lines) else None
+        return file_cache[key]
+
+    @classmethod
+    def get_nearest_line_num(cls, line_nums: List[int], line_num: int) -> Optional[int]:
+        """Find nearest line in the sorted list within MAX_SEARCH_MARGIN from line_num, excluding the line itself.
+            If lines above and below are at the same distance, line above is selected
+
+        Args:
+            line_nums: sorted list of line numbers
+            line_num: number of the current line
 
-        candidate.add_line_data(line_data)
-        return True
+        Return:
+            Number of the nearest line, or None if there is no line within MAX_SEARCH_MARGIN
+        """
+        above_pos = bisect_left(line_nums, line_num) - 1
+        below_pos = bisect_right(line_nums, line_num)
+        above_margin = line_num - line_nums[above_pos] if above_pos >= 0 else None
+        below_margin = line_nums[below_pos] - line_num if below_pos < len(line_nums) else None
+        if above_margin is not None and above_margin <= cls.MAX_SEARCH_MARGIN \
+                and (below_margin is None or above_margin <= below_margin):
+            return line_nums[above_pos]
+        if below_margin is not None and below_margin <= cls.MAX_SEARCH_MARGIN:
+            return line_nums[below_pos]
+        return None
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
@@ -13,15 +13,23 @@ class PemKeyPattern(ScanType):
 
     Attributes:
         MAX_LINE_LENGTH: Int constant. Max line length allowed in Scanner. All lines longer than this will be ignored
+        MAX_PEM_KEY_LINES: Int constant. Max number of lines in PEM key body (including `-----END` line) to check
         ignore_starts: List of strings. Leading lines in pem file that should be ignored
         remove_characters: List of characters. This characters would be striped from PEM lines before entropy check
     """
+    MAX_PEM_KEY_LINES = 190
     ignore_starts = ["Proc-Type", "Version", "DEK-Info"]
     remove_characters = " '\";,[]\n\r\t\\+#*"
 
     @classmethod
-    def run(cls, config: Config, line: str, line_num: int, file_path: str, rule: Rule,
-            lines: List[str]) -> Optional[Candidate]:
+    def run(cls,
+            config: Config,
+            line: str,
+            line_num: int,
+            file_path: str,
+            rule: Rule,
+            lines: List[str],
+            file_cache: Optional[Dict[Any, Any]] = None) -> Optional[Candidate]:
         """Check if current line is a start of a PEM key
 
         Args:
@@ -31,6 +39,8 @@ class PemKeyPattern(ScanType):
             file_path: Path to the file that contain current line
             rule: Rule object to check current line. Should be a pem-pattern rule
             lines: All lines if the file
+            file_cache: Optional dictionary shared by all rules while the file is scanned. Regex timeouts are
+                recorded there
 
         Return:
             Candidate object if pattern defined in a rule is present in a line and filters defined in rule do not
@@ -38,12 +48,16 @@ class PemKeyPattern(ScanType):
         """
         assert rule.pattern_type == rule.PEM_KEY_PATTERN, \
             "Rules provided to PemKeyPattern.run should have pattern_type equal to PEM_KEY_PATTERN"
-        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters)
+        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters,
+                                      file_cache)
 
         if line_data is None:
             return None
 
-        if cls.is_pem_key(lines[line_num:]):
+        end_index = cls.get_pem_key_end(lines, line_num)
+        if end_index is not None:
+            # Line data points to the whole key: from the header line to the `-----END` line
+            line_data.end_line_num = end_index + 1
             candidate = Candidate([line_data], rule.patterns, rule.rule_name, rule.severity, rule.validations,
                                   rule.use_ml)
             return candidate
@@ -59,27 +73,76 @@ class PemKeyPattern(ScanType):
         Return:
             Boolean. True if PEM key, False otherwise
         """
-        lines = cls.strip_lines(lines)
-        lines = cls.remove_leading_config_lines(lines)
-        key_data = ""
-        for line_num, line in enumerate(lines):
-            if line_num >= 190:
-                return False
+        return cls.get_pem_key_end(lines, 0) is not None
+
+    @classmethod
+    def get_pem_key_end(cls, lines: List[str], start: int) -> Optional[int]:
+        """Check if lines from the start index is a PEM key body and find its end
+
+        Lines are stripped one by one and only until the `-----END` line or MAX_PEM_KEY_LINES lines after leading
+        config lines, so the rest of the file is never copied or processed
+
+        Attributes:
+            lines: All lines of the file
+            start: Index of the first line after the PEM header
+
+        Return:
+            Index of the `-----END` line in lines if PEM key, None otherwise
+        """
+        index = start
+        # Skip leading config lines, they do not count to MAX_PEM_KEY_LINES
+        while index < len(lines) and cls.is_leading_config_line(cls.strip_line(lines[index])):
+            index += 1
+
+        key_data: List[str] = []
+        for index in range(index, min(index + cls.MAX_PEM_KEY_LINES, len(lines))):
+            line = cls.strip_line(lines[index])
             if "-----END" in line:
+                key = "".join(key_data)
                 # Check if entropy is high enough
-                removed_by_entropy = not Util.is_entropy_validate(key_data)
+                removed_by_entropy = not Util.is_entropy_validate(key)
                 # Check if have no substring with 5 same consecutive characters (like 'AAAAA')
                 pattern_check = ValuePatternCheck(5)
-                removed_by_filter = pattern_check.equal_pattern_check(key_data)
-                not_removed = not (removed_by_entropy or removed_by_filter)
-                return not_removed
+                removed_by_filter = pattern_check.equal_pattern_check(key)
+                if removed_by_entropy or removed_by_filter:
+                    return None
+                return index
             # PEM key line should not contain spaces or . (and especially not ...)
             elif " " in line or "..." in line:
-                return False
+                return None
             else:
-                key_data += line
+                key_data.append(line)
+
+        return None  # No `-END` section in lines
+
+    @classmethod
+    def strip_line(cls, line: str) -> str:
+        """Remove common symbols that can surround PEM keys inside code from a single line
+
+        Attributes:
+            line: Line to be striped
 
-        return False  # Return false if no `-END` section in lines
+        Return:
+            line with special characters removed from both ends
+        """
+        # Note that this strip would remove `\n` but not `\\n`
+        line = line.strip(cls.remove_characters)
+        # If line still ends with "\n" - remove last 2 characters and strip again (case of `\\n` in the line)
+        if line.endswith("\\n"):
+            line = line[:-2].strip(cls.remove_characters)
+        return line
+
+    @classmethod
+    def is_leading_config_line(cls, line: str) -> bool:
+        """Check if stripped line is a non-key line that can precede PEM key body
+
+        Attributes:
+            line: Stripped line to be checked
+
+        Return:
+            Boolean. True if line is empty or starts with one of ignore_starts, False otherwise
+        """
+        return len(line) == 0 or any(line.startswith(ignore_string) for ignore_string in cls.ignore_starts)
 
     @classmethod
     def strip_lines(cls, lines: List[str]) -> List[str]:
@@ -95,13 +158,7 @@ class PemKeyPattern(ScanType):
         Return:
             lines with special characters removed from both ends
         """
-        # Note that this strip would remove `\n` but not `\\n`
-        stripped_lines = [line.strip(cls.remove_characters) for line in lines]
-        # If line still ends with "\n" - remove last 2 characters and strip again (case of `\\n` in the line)
-        stripped_lines = [
-            line[:-2].strip(cls.remove_characters) if line.endswith("\\n") else line for line in stripped_lines
-        ]
-        return stripped_lines
+        return [cls.strip_line(line) for line in lines]
 
     @classmethod
     def remove_leading_config_lines(cls, lines: List[str]) -> List[str]:
@@ -123,7 +180,7 @@ class PemKeyPattern(ScanType):
         leading_lines = 0
 
         for line in lines:
-            if any(line.startswith(ignore_string) for ignore_string in cls.ignore_starts) or len(line) == 0:
+            if cls.is_leading_config_line(line):
                 leading_lines += 1
             else:
                 break
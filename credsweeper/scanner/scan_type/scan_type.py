@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from regex import regex
 
@@ -15,13 +15,21 @@ class ScanType(ABC):
 
     Attributes:
         MAX_LINE_LENGTH: Int constant. Max line length allowed in Scanner. All lines longer than this will be ignored
+        REGEX_TIMEOUTS: Key of the file cache item with list of patterns which search exceeded `regex_timeout`
     """
     MAX_LINE_LENGTH = 1500
+    REGEX_TIMEOUTS = "regex_timeouts"
 
     @classmethod
     @abstractmethod
-    def run(cls, config: Config, line: str, line_num: int, file_path: str, rule: Rule,
-            lines: List[str]) -> Optional[Candidate]:
+    def run(cls,
+            config: Config,
+            line: str,
+            line_num: int,
+            file_path: str,
+            rule: Rule,
+            lines: List[str],
+            file_cache: Optional[Dict[Any, Any]] = None) -> Optional[Candidate]:
         """Check if regex pattern defined in a rule is present in a line
 
         Args:
@@ -31,6 +39,8 @@ class ScanType(ABC):
             file_path: Path to the file that contain current line
             rule: Rule object to check current line
             lines: All lines if the file
+            file_cache: Optional dictionary shared by all rules while the file is scanned. Scanners can store data
+                computed once per file there
 
         Return:
             Candidate object if pattern defined in a rule is present in a line and filters defined in rule do not
@@ -59,9 +69,47 @@ class ScanType(ABC):
         return False
 
     @classmethod
-    def get_line_data(cls, config: Config, line: str, line_num: int, file_path: str, pattern: regex.Pattern,
-                      filters: List[Filter]) -> Optional[LineData]:
-        """Check if regex pattern is present in line, and line should not be removed by filters
+    def search(cls,
+               config: Config,
+               line: str,
+               line_num: int,
+               file_path: str,
+               pattern: regex.Pattern,
+               file_cache: Optional[Dict[Any, Any]] = None) -> Optional[regex.Match]:
+        """Search regex pattern in line within `regex_timeout` seconds from the config
+
+        If the search takes longer, the line is treated as having no match and the pattern is added to the
+        REGEX_TIMEOUTS list of file cache, so the scanner can count timeouts per rule and file
+
+        Attributes:
+            line: Line to check
+            line_num: Line number of a current line
+            file_path: Path to the file that contain current line
+            pattern: Compiled regex object to be searched in line
+            file_cache: Optional dictionary shared by all rules while the file is scanned
+
+        Return:
+            Match object if pattern is found in time. None otherwise
+        """
+        try:
+            return pattern.search(line, timeout=config.regex_timeout)
+        except TimeoutError:
+            logging.debug(f"Regex timeout for pattern: {pattern.pattern} in file: {file_path}:{line_num}")
+            if file_cache is not None:
+                file_cache.setdefault(cls.REGEX_TIMEOUTS, []).append(pattern)
+            return None
+
+    @classmethod
+    def get_line_data(cls,
+                      config: Config,
+                      line: str,
+                      line_num: int,
+                      file_path: str,
+                      pattern: regex.Pattern,
+                      filters: List[Filter],
+                      file_cache: Optional[Dict[Any, Any]] = None) -> Optional[LineData]:
+        """Check if regex pattern is present in line, and line should not be removed by filters. Line length is
+            expected to be checked by the caller with `is_valid_line_length`
 
         Attributes:
             line: Line to check
@@ -69,14 +117,18 @@ class ScanType(ABC):
             file_path: Path to the file that contain current line
             pattern: Compiled regex object to be searched in line
             filters: Filters to use
+            file_cache: Optional dictionary shared by all rules while the file is scanned. Regex timeouts are
+                recorded there
 
         Return:
             LineData object if pattern a line and filters do not remove current line. None otherwise
         """
-        if not cls.is_valid_line(line, pattern):
+        match_obj = cls.search(config, line, line_num, file_path, pattern, file_cache)
+        if match_obj is None:
             return None
         logging.debug(f"Valid line for pattern: {pattern} in file: {file_path}:{line_num} in line: {line}")
-        line_data = LineData(config, line, line_num, file_path, pattern)
+        # Match is passed to LineData, so the line is searched with the pattern only once
+        line_data = LineData(config, line, line_num, file_path, pattern, match_obj)
 
         if cls.filtering(config, line_data, filters):
             return None
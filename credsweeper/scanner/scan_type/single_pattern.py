@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
@@ -13,8 +13,14 @@ class SinglePattern(ScanType):
         MAX_LINE_LENGTH: Int constant. Max line length allowed in Scanner. All lines longer than this will be ignored
     """
     @classmethod
-    def run(cls, config: Config, line: str, line_num: int, file_path: str, rule: Rule,
-            lines: List[str]) -> Optional[Candidate]:
+    def run(cls,
+            config: Config,
+            line: str,
+            line_num: int,
+            file_path: str,
+            rule: Rule,
+            lines: List[str],
+            file_cache: Optional[Dict[Any, Any]] = None) -> Optional[Candidate]:
         """Check if regex pattern defined in a rule is present in a line
 
         Args:
@@ -24,12 +30,15 @@ class SinglePattern(ScanType):
             file_path: Path to the file that contain current line
             rule: Rule object to check current line
             lines: All lines if the file
+            file_cache: Optional dictionary shared by all rules while the file is scanned. Regex timeouts are
+                recorded there
 
         Return:
             Candidate object if pattern defined in a rule is present in a line and filters defined in rule do not
              remove current line. None otherwise
         """
-        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters)
+        line_data = cls.get_line_data(config, line, line_num, file_path, rule.patterns[0], rule.filters,
+                                      file_cache)
 
         if line_data is None:
             return None
@@ -1,13 +1,18 @@
+import itertools
 import os
-from typing import List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
-import yaml
+from regex import regex
 
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
 from credsweeper.logger.logger import logging
 from credsweeper.rules import Rule
+from credsweeper.rules.rule_set_cache import RuleSetCache
+from credsweeper.scanner.literal_index import LiteralIndex
 from credsweeper.scanner.scan_type import MultiPattern, PemKeyPattern, ScanType, SinglePattern
+from credsweeper.utils import Util
+from credsweeper.utils.text_lines import TextLines
 
 
 class Scanner:
@@ -15,38 +20,324 @@ class Scanner:
 
     Attributes:
         rules: list of rule objects to check
+        rule_scanners: list of (rule, scanner type) pairs, resolved once when rules are set
+        literal_index: prefilter that selects rules which required literals are present in a line
+        buffer_searchable: for each rule, can first pattern of the rule be searched over whole text buffer
+        long_line_overlaps: for each rule, overlap of windows used to scan lines longer than MAX_LINE_LENGTH
+        pattern_rule_names: name of the rule for each rule pattern, to report regex timeouts
+        regex_timeouts: number of lines skipped because of regex timeout, per rule name and file path
+        rule_set_key: key of the rule config file content and package version
+        STREAM_BLOCK_SIZE: Int constant. Approximate number of characters in a block of lines scanned at once by
+            `scan_stream`
+        CONTEXT_LINES_BEFORE: Int constant. Number of lines before a line that multi-line rules may need to check it
+        CONTEXT_LINES_AFTER: Int constant. Number of lines after a line that multi-line rules may need to check it
     """
+    STREAM_BLOCK_SIZE = 1 << 20
+    CONTEXT_LINES_BEFORE = MultiPattern.MAX_SEARCH_MARGIN
+    CONTEXT_LINES_AFTER = max(MultiPattern.MAX_SEARCH_MARGIN, PemKeyPattern.MAX_PEM_KEY_LINES)
+
     def __init__(self, config: Config, rule_path: Optional[str]) -> None:
         self.config = config
+        self.regex_timeouts: Dict[Tuple[str, str], int] = {}
         self._set_rules(rule_path)
 
+    @property
+    def rules(self) -> List[Rule]:
+        return self.__rules
+
+    @rules.setter
+    def rules(self, rules: List[Rule]) -> None:
+        self.__rules = rules
+        self.__rule_scanners = [(rule, self.get_scanner(rule)) for rule in rules]
+        self.__literal_index = LiteralIndex([rule.required_substrings for rule in rules])
+        self.__buffer_searchable = [Util.is_buffer_searchable(rule.patterns[0]) for rule in rules]
+        self.__long_line_overlaps = [self.get_long_line_overlap(rule) for rule in rules]
+        # First rule wins if several rules have the same pattern
+        self.__pattern_rule_names = {
+            pattern: rule.rule_name
+            for rule in reversed(rules) for pattern in rule.patterns
+        }
+
+    @property
+    def rule_scanners(self) -> List[Tuple[Rule, Type[ScanType]]]:
+        return self.__rule_scanners
+
+    @property
+    def literal_index(self) -> LiteralIndex:
+        return self.__literal_index
+
+    @property
+    def buffer_searchable(self) -> List[bool]:
+        return self.__buffer_searchable
+
+    @property
+    def long_line_overlaps(self) -> List[int]:
+        return self.__long_line_overlaps
+
+    @property
+    def pattern_rule_names(self) -> Dict[regex.Pattern, str]:
+        return self.__pattern_rule_names
+
     def _set_rules(self, rule_path: Optional[str]) -> None:
-        self.rules: List[Rule] = []
+        """Load rules from the rule config file. If cache directory is set in the config, parsed rule set is taken
+            from RuleSetCache when the cache is valid for the file, and is rebuilt and saved to the cache otherwise
+
+        Args:
+            rule_path: optional path of rule config file. Default rules are used if not set
+        """
         if rule_path is None:
             project_dir_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
             rule_path = os.path.join(project_dir_path, "rules", "config.yaml")
-        with open(rule_path, "r") as f:
-            rule_templates = yaml.load(f, Loader=yaml.Loader)
-        for rule_template in rule_templates:
-            self.rules.append(Rule(self.config, rule_template))
+        with open(rule_path, "rb") as f:
+            rule_file = f.read()
+        self.rule_set_key = RuleSetCache.get_key(rule_file)
+        # Cache is used only in the directory given by the user, so nothing is written without consent
+        rule_set_cache = RuleSetCache(self.config.cache_dir) if self.config.cache_dir else None
+        rule_templates = rule_set_cache.load(rule_file) if rule_set_cache is not None else None
+        if rule_templates is not None:
+            try:
+                self.rules = [Rule(self.config, rule_template) for rule_template in rule_templates]
+                return
+            except (ValueError, KeyError, TypeError, AttributeError) as exc:
+                logging.debug(f"Rule set cache is not valid for {rule_path}: {exc}")
+        import yaml  # Only needed when the rule set is not cached
+
+        rule_templates = yaml.load(rule_file, Loader=yaml.Loader)
+        self.rules = [Rule(self.config, rule_template) for rule_template in rule_templates]
+        if rule_set_cache is not None:
+            rule_set_cache.save(rule_file, rule_templates, self.rules)
 
-    def scan(self, file_path: str, lines: List[str]) -> List[Candidate]:
+    def scan(self,
+             file_path: str,
+             lines: List[str],
+             line_nums: Optional[Iterable[int]] = None,
+             line_num_offset: int = 0) -> List[Candidate]:
         """Run scanning of file with path 'file_path' with set of rule from 'self.rules'
 
+        Lines are visited once: line length is checked a single time per line and the line is then dispatched only to
+        the rules which required literals are present in the line. Findings are collected per rule, so the result
+        keeps the rule-by-rule, line-by-line order
+
         Args:
             file_path: string variable, path to file to scan
             lines: list of string variables, row from file to scan
+            line_nums: optional ascending numbers of lines to check, starting from 1. Other lines are only used as
+                context by multi-line rules. All lines are checked if not set
+            line_num_offset: number of file lines before the first of `lines`. Line numbers of the findings are
+                shifted by it, so they refer to the whole file
+        """
+        return list(itertools.chain(*self.scan_by_rule(file_path, lines, line_nums, line_num_offset)))
+
+    def scan_by_rule(self,
+                     file_path: str,
+                     lines: List[str],
+                     line_nums: Optional[Iterable[int]] = None,
+                     line_num_offset: int = 0) -> List[List[Candidate]]:
+        """Same as `scan`, but findings are returned in a separate list for each rule of 'self.rules'"""
+        credentials: List[List[Candidate]] = [[] for _ in self.rule_scanners]
+        file_cache = {}
+        if line_nums is None:
+            line_nums = range(1, len(lines) + 1)
+        for line_num in line_nums:
+            line = lines[line_num - 1]
+            if not ScanType.is_valid_line_length(line):
+                if self.config.long_line_scan:
+                    for rule_index in self.literal_index.get_rule_indices(line):
+                        credentials[rule_index].extend(
+                            self.scan_long_line(rule_index, file_path, line, line_num, lines, file_cache))
+                continue
+            for rule_index in self.literal_index.get_rule_indices(line):
+                rule, scanner = self.rule_scanners[rule_index]
+                new_credential = scanner.run(self.config, line, line_num, file_path, rule, lines, file_cache)
+                if new_credential:
+                    logging.debug(f"Credential for rule: {rule.rule_name} in file: {file_path}:{line_num} in line: {line}")
+                    credentials[rule_index].append(new_credential)
+        self.add_regex_timeouts(file_path, file_cache)
+        if line_num_offset:
+            self.shift_line_nums(itertools.chain(*credentials), line_num_offset)
+        return credentials
+
+    def scan_stream(self, file_path: str, lines: Iterable[str]) -> List[Candidate]:
+        """Run scanning of file lines that are read lazily, so memory does not depend on the file size
+
+        Lines are scanned in blocks of about STREAM_BLOCK_SIZE characters. Each block is scanned together with
+        context lines around it: MAX_SEARCH_MARGIN lines before, and enough lines after for the second part of
+        multi-pattern rules and for the longest PEM key. Context lines are not checked themselves, they are checked in
+        the neighbour block. Findings and their order are the same as `scan` gives for the whole list of lines
+
+        Args:
+            file_path: string variable, path to file to scan
+            lines: iterable of file lines without line breaks
         """
+        context_before = self.CONTEXT_LINES_BEFORE
+        context_after = self.CONTEXT_LINES_AFTER
+        credentials: List[List[Candidate]] = [[] for _ in self.rule_scanners]
+        window: List[str] = []
+        # Number of file lines before the window, and index of the first not scanned line in the window
+        window_offset = 0
+        block_start = 0
+        block_size = 0
+        block_end = None
+        for line in lines:
+            window.append(line)
+            if block_end is None:
+                block_size += len(line) + 1
+                if block_size >= self.STREAM_BLOCK_SIZE:
+                    block_end = len(window)
+            elif len(window) - block_end >= context_after:
+                self.extend_by_rule(
+                    credentials,
+                    self.scan_by_rule(file_path, window, range(block_start + 1, block_end + 1), window_offset))
+                drop = max(block_end - context_before, 0)
+                del window[:drop]
+                window_offset += drop
+                block_start = block_end - drop
+                block_size = sum(len(window_line) + 1 for window_line in window[block_start:])
+                block_end = None
+                if block_size >= self.STREAM_BLOCK_SIZE:
+                    block_end = len(window)
+        if block_start < len(window):
+            self.extend_by_rule(
+                credentials,
+                self.scan_by_rule(file_path, window, range(block_start + 1, len(window) + 1), window_offset))
+        return list(itertools.chain(*credentials))
+
+    @classmethod
+    def extend_by_rule(cls, credentials: List[List[Candidate]], new_credentials: List[List[Candidate]]) -> None:
+        """Append findings of each rule to the findings of the same rule"""
+        for rule_credentials, new_rule_credentials in zip(credentials, new_credentials):
+            rule_credentials.extend(new_rule_credentials)
+
+    def scan_text(self, file_path: str, text: str) -> List[Candidate]:
+        """Run scanning of whole file content with path 'file_path' with set of rule from 'self.rules'
+
+        Instead of searching every line, rule literals are searched over the whole text buffer in one pass. Matches
+        are mapped to line numbers with the line-offset index of TextLines, and only located lines are checked with
+        the rule. Rules without literals search their pattern over the buffer, if it gives the same result as line
+        search. Findings and their order are the same as `scan` gives for `text.splitlines()`
+
+        Args:
+            file_path: string variable, path to file to scan
+            text: whole content of the file
+        """
+        lines = TextLines(text)
+        rule_line_nums = self.literal_index.get_rule_line_nums(lines)
         credentials = []
-        for rule in self.rules:
-            for line_num, line in enumerate(lines):
-                line_num += 1
-                new_credential = self.get_scanner(rule).run(self.config, line, line_num, file_path, rule, lines)
+        file_cache = {}
+        for rule_index, (rule, scanner) in enumerate(self.rule_scanners):
+            line_nums: Iterable[int] = rule_line_nums[rule_index]
+            if line_nums is None:
+                line_nums = range(1, len(lines) + 1)
+                if self.buffer_searchable[rule_index]:
+                    try:
+                        line_nums = lines.find_line_nums(rule.patterns[0], self.config.regex_timeout)
+                    except TimeoutError:
+                        # Search of the whole text took too long, every line is checked with its own timeout
+                        logging.debug(f"Regex timeout for rule: {rule.rule_name} in file: {file_path}")
+            for line_num in sorted(line_nums):
+                line = lines[line_num - 1]
+                if not ScanType.is_valid_line_length(line):
+                    if self.config.long_line_scan:
+                        credentials.extend(self.scan_long_line(rule_index, file_path, line, line_num, lines, file_cache))
+                    continue
+                new_credential = scanner.run(self.config, line, line_num, file_path, rule, lines, file_cache)
                 if new_credential:
                     logging.debug(f"Credential for rule: {rule.rule_name} in file: {file_path}:{line_num} in line: {line}")
                     credentials.append(new_credential)
+        self.add_regex_timeouts(file_path, file_cache)
         return credentials
 
+    def scan_long_line(self, rule_index: int, file_path: str, line: str, line_num: int, lines: List[str],
+                       file_cache: Dict[Any, Any]) -> List[Candidate]:
+        """Scan line longer than MAX_LINE_LENGTH with a single rule in overlapping windows
+
+        Each window is MAX_LINE_LENGTH characters long and is checked by the rule as a separate line, so regex and
+        filter cost stays linear in the line length. Windows overlap by the longest possible match of the rule, so
+        any match of bounded length is found whole at least in one window. Matches found in several windows are
+        reported once by the position of their value in the line, the longest one is kept. Line data of the findings
+        has `column_offset` of the value in the line
+
+        Args:
+            rule_index: index of the rule in self.rules
+            file_path: string variable, path to file to scan
+            line: line to scan
+            line_num: number of the line in the file
+            lines: all lines of the file
+            file_cache: dictionary shared by all rules while the file is scanned
+
+        Return:
+            List of candidates found in the line, ordered by column
+        """
+        rule, scanner = self.rule_scanners[rule_index]
+        step = ScanType.MAX_LINE_LENGTH - self.long_line_overlaps[rule_index]
+        # Absolute start of the value -> (absolute end of the value, candidate). Matches of the same value may start
+        # at different columns, if a window starts inside the variable name before the value
+        found: Dict[int, Tuple[int, Candidate]] = {}
+        for offset in range(0, len(line) - self.long_line_overlaps[rule_index], step):
+            window = line[offset:offset + ScanType.MAX_LINE_LENGTH]
+            new_credential = scanner.run(self.config, window, line_num, file_path, rule, lines, file_cache)
+            if not new_credential:
+                continue
+            line_data = new_credential.line_data_list[0]
+            start, end = line_data.value_span if line_data.value_span is not None else (0, len(window))
+            start, end = start + offset, end + offset
+            line_data.column_offset = start
+            if start not in found or found[start][0] < end:
+                logging.debug(f"Credential for rule: {rule.rule_name} in file: {file_path}:{line_num} in column: {start}")
+                found[start] = (end, new_credential)
+        return [new_credential for _, new_credential in found.values()]
+
+    @classmethod
+    def shift_line_nums(cls, credentials: Iterable[Candidate], line_num_offset: int) -> None:
+        """Add offset to line numbers of the candidates
+
+        Args:
+            credentials: candidates found in part of a file
+            line_num_offset: number of file lines before the part
+        """
+        for candidate in credentials:
+            for line_data in candidate.line_data_list:
+                line_data.line_num += line_num_offset
+                line_data.end_line_num += line_num_offset
+
+    def add_regex_timeouts(self, file_path: str, file_cache: Dict[Any, Any]) -> None:
+        """Count regex timeouts recorded in file cache while the file was scanned
+
+        Args:
+            file_path: string variable, path to scanned file
+            file_cache: dictionary shared by all rules while the file was scanned
+        """
+        for pattern in file_cache.get(ScanType.REGEX_TIMEOUTS, []):
+            key = (self.pattern_rule_names.get(pattern, pattern.pattern), file_path)
+            self.regex_timeouts[key] = self.regex_timeouts.get(key, 0) + 1
+
+    def pop_regex_timeouts(self) -> Dict[Tuple[str, str], int]:
+        """Get regex timeouts counted since the previous call
+
+        Return:
+            Dictionary of number of regex timeouts per rule name and file path
+        """
+        regex_timeouts = self.regex_timeouts
+        self.regex_timeouts = {}
+        return regex_timeouts
+
+    @classmethod
+    def get_long_line_overlap(cls, rule: Rule) -> int:
+        """Get overlap of windows to scan long lines with the rule. Overlap is the longest possible match of the
+            first pattern of the rule, but not more than half of the window
+
+        Args:
+            rule: Rule object
+
+        Return:
+            Number of characters shared by consecutive windows
+        """
+        max_overlap = ScanType.MAX_LINE_LENGTH // 2
+        max_length = Util.get_max_match_length(rule.patterns[0])
+        if max_length is None:
+            return max_overlap
+        return min(max_length, max_overlap)
+
     @classmethod
     def get_scanner(cls, rule: Rule) -> Type[ScanType]:
         """Choose type of scanner base on rule affiliation
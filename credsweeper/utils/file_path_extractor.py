@@ -1,15 +1,31 @@
 import os
-from pathlib import Path
-from typing import List
-
-from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from credsweeper.config import Config
 from credsweeper.utils import Util
+from credsweeper.utils.git_check_ignore import GitCheckIgnore
+from credsweeper.utils.git_ignore import GitIgnore
 
 
 class FilePathExtractor:
-    located_repos = {}
+    """Locate files to scan
+
+    Attributes:
+        DISCOVERY_THREADS: Int constant. Number of threads that walk top-level subdirectories in parallel
+        DISCOVERY_QUEUE_SIZE: Int constant. Max number of path batches held for each top-level subdirectory
+        DISCOVERY_BATCH_SIZE: Int constant. Number of found paths passed from a walking thread at once
+        GITIGNORE_BATCH_SIZE: Int constant. Number of paths checked against gitignore rules at once
+    """
+    DISCOVERY_THREADS = 8
+    DISCOVERY_QUEUE_SIZE = 16
+    DISCOVERY_BATCH_SIZE = 64
+    GITIGNORE_BATCH_SIZE = 1024
+    # Directory -> working tree of the repository that contains the directory, or None
+    located_repos: Dict[str, Optional[str]] = {}
 
     @classmethod
     def apply_gitignore(cls, detected_files: List[str]) -> List[str]:
@@ -22,79 +38,267 @@ class FilePathExtractor:
             List of files with all files ignored by git removed
         """
 
-        filtered_files = [file_path for file_path in detected_files if FilePathExtractor.is_valid_path(file_path)]
+        return list(cls.filter_gitignored(detected_files))
+
+    @classmethod
+    def filter_gitignored(cls, file_paths: Iterable[str]) -> Iterator[str]:
+        """Remove files ignored by git lazily, keeping the order of the paths
+
+        Paths are checked in batches of GITIGNORE_BATCH_SIZE. Paths of a batch are grouped by the repository they
+        belong to, and each repository is checked by a single `git check-ignore` process for all batches
+
+        Args:
+            file_paths: paths of files to be checked
 
-        return filtered_files
+        Return:
+            Iterator over the paths that are not ignored by git
+        """
+        git_check_ignores: Dict[str, GitCheckIgnore] = {}
+        try:
+            for batch in cls._get_batches(file_paths, cls.GITIGNORE_BATCH_SIZE):
+                repo_paths: Dict[str, List[str]] = {}
+                for file_path in batch:
+                    repo_path = cls.find_repo_path(file_path)
+                    if repo_path is not None:
+                        repo_paths.setdefault(repo_path, []).append(file_path)
+                ignored_paths = set()
+                for repo_path, paths in repo_paths.items():
+                    if repo_path not in git_check_ignores:
+                        git_check_ignores[repo_path] = GitCheckIgnore(repo_path)
+                    ignored = git_check_ignores[repo_path].get_ignored(paths)
+                    ignored_paths.update(path for path, is_ignored in zip(paths, ignored) if is_ignored)
+                yield from (file_path for file_path in batch if file_path not in ignored_paths)
+        finally:
+            for git_check_ignore in git_check_ignores.values():
+                git_check_ignore.close()
 
     @classmethod
-    def get_file_paths(cls, config: Config, path: str) -> List[str]:
+    def find_repo_path(cls, path: str) -> Optional[str]:
+        """Locate nearest directory with ".git" in it, up from the path. Result is cached for every visited directory
+
+        Args:
+            path: path to the file or directory to check
+
+        Return:
+            Path to the working tree of the repository, or None if the path is not in a repository
+        """
+        dir_path = os.path.dirname(os.path.abspath(path))
+        visited_dir_paths = []
+        while dir_path not in cls.located_repos:
+            visited_dir_paths.append(dir_path)
+            if os.path.exists(os.path.join(dir_path, ".git")):
+                cls.located_repos[dir_path] = dir_path
+                break
+            parent_dir_path = os.path.dirname(dir_path)
+            if parent_dir_path == dir_path:
+                # Root is reached: no .git directory located in the entire path
+                cls.located_repos[dir_path] = None
+                break
+            dir_path = parent_dir_path
+        repo_path = cls.located_repos[dir_path]
+        for visited_dir_path in visited_dir_paths:
+            cls.located_repos[visited_dir_path] = repo_path
+        return repo_path
+
+    @classmethod
+    def _get_batches(cls, items: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @classmethod
+    def get_file_paths(cls, config: Config, path: str, skip_ignored: bool = False) -> List[str]:
         """Get all files in the directory. Automatically exclude files non-code or data files (such as .jpg)
 
         Args:
             path: path to the file or directory to be scanned
+            skip_ignored: exclude files ignored by gitignore rules with in-process GitIgnore matcher. Ignored
+                directories are not entered
 
         Return:
             List all non-excluded files in the directory
         """
+        git_ignore = GitIgnore(path) if skip_ignored else None
+        return list(cls.walk_file_paths(config, path, git_ignore))
+
+    @classmethod
+    def walk_file_paths(cls, config: Config, path: str, git_ignore: Optional[GitIgnore] = None) -> Iterator[str]:
+        """Get all non-excluded files in the directory lazily, in the same order as `get_file_paths`
+
+        Args:
+            config: user configs
+            path: path to the file or directory to be scanned
+            git_ignore: optional gitignore matcher, ignored files and directories are excluded
+
+        Return:
+            Iterator over non-excluded file paths
+        """
         path = os.path.expanduser(path)  # Replace ~ character with a full path to the home directory
-        file_paths = []
         if os.path.isfile(path):
-            if not FilePathExtractor.check_exclude_file(config, path):
-                file_paths.append(path)
-            return file_paths
-
-        for dirpath, _, filenames in os.walk(path):
-            for filename in filenames:
-                file_path = f"{dirpath}/{filename}"
-                if FilePathExtractor.check_exclude_file(config, file_path):
+            if not FilePathExtractor.check_exclude_file(config, path) \
+                    and (git_ignore is None or not git_ignore.is_ignored(path, False)):
+                yield path
+            return
+        # Directories are visited in the same order as os.walk gives, but excluded directories are not entered
+        dir_paths = [path]
+        while dir_paths:
+            file_paths, sub_dir_paths = cls.scan_dir(config, dir_paths.pop(), git_ignore)
+            yield from file_paths
+            dir_paths.extend(reversed(sub_dir_paths))
+
+    @classmethod
+    def scan_dir(cls,
+                 config: Config,
+                 dir_path: str,
+                 git_ignore: Optional[GitIgnore] = None) -> Tuple[List[str], List[str]]:
+        """List non-excluded files and subdirectories of a single directory
+
+        Args:
+            config: user configs
+            dir_path: path to the directory
+            git_ignore: optional gitignore matcher, ignored files and subdirectories are excluded
+
+        Return:
+            List of non-excluded file paths and list of subdirectory paths. Both are empty if the directory is
+                excluded or cannot be listed
+        """
+        file_paths: List[str] = []
+        sub_dir_paths: List[str] = []
+        if FilePathExtractor.check_exclude_dir(config, dir_path):
+            return file_paths, sub_dir_paths
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            return file_paths, sub_dir_paths
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+                if is_dir and entry.is_symlink():
+                    # Same as os.walk, symbolic links to directories are not followed
                     continue
-                if os.path.isfile(file_path):
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                sub_dir_path = os.path.join(dir_path, entry.name)
+                if git_ignore is None or not git_ignore.is_ignored(sub_dir_path, True):
+                    sub_dir_paths.append(sub_dir_path)
+            elif is_file:
+                file_path = f"{dir_path}/{entry.name}"
+                if not FilePathExtractor.check_exclude_file(config, file_path) \
+                        and (git_ignore is None or not git_ignore.is_ignored(file_path, False)):
                     file_paths.append(file_path)
-        return file_paths
+        return file_paths, sub_dir_paths
 
     @classmethod
-    def is_valid_path(cls, path: str) -> bool:
-        """Locate nearest .git directory to the path and check if path is ignored
+    def discover_file_paths(cls, config: Config, paths: Iterable[str], skip_ignored: bool = False) -> Iterator[str]:
+        """Get all non-excluded files of the paths lazily, walking top-level subdirectories in parallel threads
+
+        Up to DISCOVERY_THREADS top-level subdirectories are walked at once, each into its own queue of
+        DISCOVERY_QUEUE_SIZE batches of paths. Queues are drained in subdirectory order, so the order of files is the
+        same as `get_file_paths` gives, first files are available as soon as they are found, and at most
+        DISCOVERY_THREADS * DISCOVERY_QUEUE_SIZE * DISCOVERY_BATCH_SIZE paths are held in memory
 
         Args:
-            path: path to the file or directory to check
+            config: user configs
+            paths: paths to the files or directories to be scanned
+            skip_ignored: exclude files ignored by gitignore rules with in-process GitIgnore matcher. Ignored
+                directories are not entered
 
         Return:
-            Boolean. False if file is ignored by git. True otherwise
+            Iterator over non-excluded file paths
         """
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=cls.DISCOVERY_THREADS, thread_name_prefix="discovery") as executor:
+            try:
+                for path in paths:
+                    path = os.path.expanduser(path)
+                    git_ignore = GitIgnore(path) if skip_ignored else None
+                    if not os.path.isdir(path):
+                        yield from cls.walk_file_paths(config, path, git_ignore)
+                        continue
+                    file_paths, sub_dir_paths = cls.scan_dir(config, path, git_ignore)
+                    yield from file_paths
+                    sub_dir_paths.reverse()
+                    walks: Deque[Tuple[queue.Queue, Future]] = deque()
+                    while sub_dir_paths or walks:
+                        # Walks are started in subdirectory order, so the subdirectory being drained is always walked
+                        while sub_dir_paths and len(walks) < cls.DISCOVERY_THREADS:
+                            path_queue = queue.Queue(maxsize=cls.DISCOVERY_QUEUE_SIZE)
+                            future = executor.submit(cls._walk_to_queue, config, sub_dir_paths.pop(), git_ignore,
+                                                     path_queue, stop_event)
+                            walks.append((path_queue, future))
+                        path_queue, future = walks.popleft()
+                        for file_paths in iter(path_queue.get, None):
+                            yield from file_paths
+                        # Raise the exception of the walk, if any
+                        future.result()
+            finally:
+                # Walks blocked on full queues are stopped if the consumer does not drain them
+                stop_event.set()
 
-        parent_directory = Path(path).parent
+    @classmethod
+    def _walk_to_queue(cls, config: Config, path: str, git_ignore: Optional[GitIgnore], path_queue: queue.Queue,
+                       stop_event: threading.Event) -> None:
+        try:
+            file_paths = []
+            for file_path in cls.walk_file_paths(config, path, git_ignore):
+                file_paths.append(file_path)
+                if len(file_paths) >= cls.DISCOVERY_BATCH_SIZE:
+                    if not cls._put(path_queue, file_paths, stop_event):
+                        return
+                    file_paths = []
+            if file_paths:
+                cls._put(path_queue, file_paths, stop_event)
+        finally:
+            cls._put(path_queue, None, stop_event)
 
-        # Iterate over file path to find nearest ".git" directory
-        while True:
+    @classmethod
+    def _put(cls, path_queue: queue.Queue, item: Optional[List[str]], stop_event: threading.Event) -> bool:
+        while not stop_event.is_set():
             try:
-                if parent_directory in cls.located_repos:
-                    repo = cls.located_repos[parent_directory]
-                else:
-                    # The directory must have ".git" in it. If not it occurs error.
-                    repo = Repo(parent_directory)
+                path_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-                    # Cache already located repositories, so we would not need to load it for each new file
-                    cls.located_repos[parent_directory] = repo
+    @classmethod
+    def is_valid_path(cls, path: str) -> bool:
+        """Locate nearest .git directory to the path and check if path is ignored. Use `filter_gitignored` to check
+            many paths, it does not start a process for each of them
 
-                # Return True if there is no ignored file in 'path' and False if any.
-                return len(repo.ignored(path)) == 0
+        Args:
+            path: path to the file or directory to check
 
-            except (InvalidGitRepositoryError, NoSuchPathError):
-                new_parent = parent_directory.parent
-                # If we encountered root and cannot move further: no .git directory located in the entire path
-                if new_parent == parent_directory:
-                    return True
-                parent_directory = new_parent
+        Return:
+            Boolean. False if file is ignored by git. True otherwise
+        """
+        return any(True for _ in cls.filter_gitignored([path]))
 
     @classmethod
     def check_exclude_file(cls, config: Config, path: str) -> bool:
-        if config.not_allowed_path_pattern.match(path):
-            return True
-        if any(exclude_pattern.match(path) for exclude_pattern in config.exclude_patterns):
-            return True
-        if any(exclude_path in path for exclude_path in config.exclude_paths):
-            return True
         if Util.get_extension(path) in config.exclude_extensions:
             return True
-        return False
+        if config.exclude_path_pattern.match(path):
+            return True
+        return any(exclude_pattern.match(path) for exclude_pattern in config.exclude_patterns)
+
+    @classmethod
+    def check_exclude_dir(cls, config: Config, path: str) -> bool:
+        """Check if all files in the directory are excluded by their path, so the directory need not be entered.
+            Only checks that hold for any path that starts with the directory path are applied
+
+        Args:
+            config: user configs
+            path: path to the directory
+
+        Return:
+            Boolean. True if the directory is excluded. False otherwise
+        """
+        return config.exclude_path_pattern.match(f"{path}/") is not None
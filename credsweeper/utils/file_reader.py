@@ -0,0 +1,188 @@
+import codecs
+import mmap
+import os
+from typing import BinaryIO, Iterator, Optional
+
+from credsweeper.logger.logger import logging
+
+
+class FileReader:
+    """Read content of files to scan
+
+    Head of a file is sniffed before the whole file is read, so binary files are rejected after reading a few KB.
+    Large files are memory mapped and decoded directly from the mapping, without intermediate bytes copy
+
+    Attributes:
+        SNIFF_SIZE: Int constant. Number of bytes at the file start checked for NUL bytes and invalid UTF-8
+        MMAP_MIN_SIZE: Int constant. Files of this size and larger are memory mapped instead of read
+        ENCODING: Str constant. Encoding of text files
+        STREAM_BLOCK_SIZE: Int constant. Number of bytes read at once when file lines are streamed
+        STREAM_MAX_LINE_LENGTH: Int constant. Streamed lines are truncated to this length, so memory stays bounded
+            for files without line breaks. Credentials after the limit are not found, a warning is logged for each
+            truncated line
+    """
+    SNIFF_SIZE = 8192
+    MMAP_MIN_SIZE = 1 << 20
+    ENCODING = "utf-8"
+    STREAM_BLOCK_SIZE = 1 << 20
+    STREAM_MAX_LINE_LENGTH = 1 << 16
+
+    @classmethod
+    def is_binary(cls, head: bytes) -> bool:
+        """Check if data from the file start looks like binary file content
+
+        Args:
+            head: first bytes of the file. Data may end in the middle of UTF-8 sequence
+
+        Return:
+            Boolean. True if data contains NUL byte or is not valid UTF-8. False otherwise
+        """
+        if b"\0" in head:
+            return True
+        try:
+            # Incremental decoder accepts incomplete sequence at the end of data
+            codecs.getincrementaldecoder(cls.ENCODING)().decode(head, final=False)
+        except UnicodeDecodeError:
+            return True
+        return False
+
+    @classmethod
+    def read_text(cls, file_path: str, max_size: Optional[int] = None) -> Optional[str]:
+        """Read whole file as text
+
+        Args:
+            file_path: path to the file
+            max_size: optional max number of bytes to read. Only complete lines are returned from larger files
+
+        Return:
+            File content, or None if the file is binary or cannot be decoded
+        """
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return ""
+            if max_size is not None and size > max_size:
+                return cls.read_head(file_path, f, max_size)
+            if size < cls.MMAP_MIN_SIZE:
+                data = f.read(cls.SNIFF_SIZE)
+                if cls.is_binary(data):
+                    logging.debug(f"Binary file skipped: \"{file_path}\".")
+                    return None
+                rest = f.read()
+                return cls.decode(file_path, data + rest if rest else data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if cls.is_binary(mapped_file[:cls.SNIFF_SIZE]):
+                    logging.debug(f"Binary file skipped: \"{file_path}\".")
+                    return None
+                with memoryview(mapped_file) as view:
+                    return cls.decode(file_path, view)
+
+    @classmethod
+    def read_head(cls, file_path: str, f: BinaryIO, max_size: int) -> Optional[str]:
+        """Read complete lines from the first max_size bytes of the file
+
+        Args:
+            file_path: path to the file, for logging
+            f: file opened in binary mode at the file start
+            max_size: number of bytes to read
+
+        Return:
+            Text of the complete lines, or None if the file is binary or cannot be decoded
+        """
+        data = f.read(max_size)
+        if cls.is_binary(data[:cls.SNIFF_SIZE]):
+            logging.debug(f"Binary file skipped: \"{file_path}\".")
+            return None
+        try:
+            text = codecs.getincrementaldecoder(cls.ENCODING)().decode(data, final=False)
+        except UnicodeDecodeError:
+            logging.warning(f"Can't read file content from \"{file_path}\".")
+            return None
+        lines = text.splitlines(keepends=True)
+        if lines and not cls.has_line_break(lines[-1]):
+            # Last line is cut by max_size
+            lines.pop()
+        return "".join(lines)
+
+    @classmethod
+    def read_lines(cls, file_path: str) -> Optional[Iterator[str]]:
+        """Read file lines lazily, in blocks of STREAM_BLOCK_SIZE bytes, so memory does not depend on the file size.
+            Lines longer than STREAM_MAX_LINE_LENGTH are truncated with a warning
+
+        Args:
+            file_path: path to the file
+
+        Return:
+            Iterator over lines without line breaks, as `str.splitlines` gives, or None if the file is binary.
+                Iterator raises UnicodeDecodeError if the file cannot be decoded further
+        """
+        f = open(file_path, "rb")
+        head = f.read(cls.SNIFF_SIZE)
+        if cls.is_binary(head):
+            f.close()
+            logging.debug(f"Binary file skipped: \"{file_path}\".")
+            return None
+        return cls._iter_lines(file_path, f, head)
+
+    @classmethod
+    def _iter_lines(cls, file_path: str, f: BinaryIO, head: bytes) -> Iterator[str]:
+        with f:
+            decoder = codecs.getincrementaldecoder(cls.ENCODING)()
+            pending = ""
+            # Pending line was already cut, its end is dropped as it is read
+            truncated = False
+            line_num = 0
+            data = head
+            while data:
+                lines = (pending + decoder.decode(data)).splitlines(keepends=True)
+                pending = lines.pop() if lines else ""
+                if cls.has_line_break(pending) and not pending.endswith("\r"):
+                    # Line ending with "\r" stays pending, as "\n" of "\r\n" may be in the next block
+                    lines.append(pending)
+                    pending = ""
+                for line in lines:
+                    line_num += 1
+                    yield cls._truncate_line(file_path, line_num, cls.strip_line_break(line), truncated)
+                    truncated = False
+                if len(pending) > cls.STREAM_MAX_LINE_LENGTH and not pending.endswith("\r"):
+                    pending = pending[:cls.STREAM_MAX_LINE_LENGTH]
+                    truncated = True
+                data = f.read(cls.STREAM_BLOCK_SIZE)
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield cls._truncate_line(file_path, line_num + 1, cls.strip_line_break(pending), truncated)
+
+    @classmethod
+    def _truncate_line(cls, file_path: str, line_num: int, line: str, truncated: bool) -> str:
+        if truncated or len(line) > cls.STREAM_MAX_LINE_LENGTH:
+            logging.warning(f"Line {line_num} longer than {cls.STREAM_MAX_LINE_LENGTH} characters is truncated in "
+                            f"streamed file: \"{file_path}\".")
+            return line[:cls.STREAM_MAX_LINE_LENGTH]
+        return line
+
+    @classmethod
+    def has_line_break(cls, line: str) -> bool:
+        """Check if line from `str.splitlines(keepends=True)` ends with line break"""
+        return len(line.splitlines()[0]) < len(line) if line else False
+
+    @classmethod
+    def strip_line_break(cls, line: str) -> str:
+        """Remove line break from the end of line from `str.splitlines(keepends=True)`"""
+        return line.splitlines()[0] if line else line
+
+    @classmethod
+    def decode(cls, file_path: str, data: bytes) -> Optional[str]:
+        """Decode file data
+
+        Args:
+            file_path: path to the file, for logging
+            data: bytes-like object with the file content
+
+        Return:
+            Decoded text, or None if data cannot be decoded
+        """
+        try:
+            return str(data, cls.ENCODING)
+        except UnicodeDecodeError:
+            logging.warning(f"Can't read file content from \"{file_path}\".")
+            return None
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import threading
+from typing import Iterator, List, Optional
+
+from credsweeper.logger.logger import logging
+
+
+class GitCheckIgnore:
+    """Long-lived `git check-ignore --stdin` process of a single repository
+
+    Paths are written to the process and a record is read back for each of them, so a repository costs one
+    subprocess whatever the number of checked paths. Same as `git check-ignore` does, tracked files are never ignored
+
+    Attributes:
+        repo_path: path to the working tree of the repository
+    """
+    COMMAND = ["git", "check-ignore", "--stdin", "-z", "--verbose", "--non-matching"]
+    # Each record is source, line number, pattern and path, all terminated by NUL
+    RECORD_FIELDS = 4
+
+    def __init__(self, repo_path: str) -> None:
+        self.repo_path = repo_path
+        self.__process: Optional[subprocess.Popen] = None
+        self.__fields: Optional[Iterator[bytes]] = None
+
+    def get_ignored(self, paths: List[str]) -> List[bool]:
+        """Check which of the paths are ignored by git. Git stops on a path that it cannot check, e.g. a path beyond
+            a symbolic link, so the process is started again for the paths after it
+
+        Args:
+            paths: paths to files in the working tree of the repository
+
+        Return:
+            List of booleans, True for each ignored path. Paths are not ignored if git cannot check them
+        """
+        ignored: List[bool] = []
+        while len(ignored) < len(paths):
+            remaining_paths = paths[len(ignored):]
+            checked = self._check(remaining_paths)
+            ignored.extend(checked)
+            if len(checked) < len(remaining_paths):
+                logging.warning(f"git check-ignore stopped on {remaining_paths[len(checked)]} in {self.repo_path}")
+                ignored.append(False)
+        return ignored
+
+    def _check(self, paths: List[str]) -> List[bool]:
+        """Check the paths with the running process. Checked paths are given until the process stops"""
+        if not self._start():
+            return [False] * len(paths)
+        process, fields = self.__process, self.__fields
+        # Paths are written by another thread, so neither side blocks on a full pipe
+        writer = threading.Thread(target=self._write, args=(process, paths), daemon=True)
+        writer.start()
+        ignored = []
+        try:
+            for _ in paths:
+                source, _, pattern, _ = (next(fields) for _ in range(self.RECORD_FIELDS))
+                # Path matched by a negated pattern is reported with the pattern, but is not ignored
+                ignored.append(bool(source) and not pattern.startswith(b"!"))
+        except (StopIteration, RuntimeError):
+            self.close()
+        writer.join()
+        return ignored
+
+    def close(self) -> None:
+        """Stop the process. It is started again on the next check"""
+        if self.__process is not None:
+            try:
+                self.__process.stdin.close()
+            except OSError:
+                pass
+            self.__process.kill()
+            self.__process.wait()
+            self.__process.stdout.close()
+            self.__process = None
+            self.__fields = None
+
+    def _start(self) -> bool:
+        if self.__process is None:
+            try:
+                self.__process = subprocess.Popen(self.COMMAND,
+                                                  cwd=self.repo_path,
+                                                  stdin=subprocess.PIPE,
+                                                  stdout=subprocess.PIPE,
+                                                  stderr=subprocess.DEVNULL)
+            except OSError as exc:
+                logging.warning(f"Cannot run git check-ignore in {self.repo_path}: {exc}")
+                return False
+            self.__fields = self._read_fields(self.__process)
+        return True
+
+    @classmethod
+    def _write(cls, process: subprocess.Popen, paths: List[str]) -> None:
+        try:
+            process.stdin.write(b"".join(os.fsencode(os.path.abspath(path)) + b"\0" for path in paths))
+            process.stdin.flush()
+        except (OSError, ValueError):
+            # The process has stopped, the reader reports it
+            pass
+
+    @classmethod
+    def _read_fields(cls, process: subprocess.Popen) -> Iterator[bytes]:
+        pending = b""
+        while True:
+            data = process.stdout.read1(1 << 16)
+            if not data:
+                return
+            fields = (pending + data).split(b"\0")
+            pending = fields.pop()
+            yield from fields
@@ -0,0 +1,137 @@
+import codecs
+import os
+import subprocess
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from regex import regex
+
+# Hunk is lines of the new file version, numbers of the added lines among them starting from 1, and number of the
+# file lines before the first line of the hunk
+DiffHunk = Tuple[List[str], List[int], int]
+
+
+class GitDiff:
+    """Parser of unified diff, and runner of `git diff` that gives it
+
+    Only the new version of each file is taken from the diff: context and added lines of each hunk, with numbers of
+    the added lines. So a diff is scanned in time of its size, and findings have line numbers of the new file version
+
+    Attributes:
+        SRC_PREFIX: Str constant. Prefix of the old file paths in the diff headers
+        DST_PREFIX: Str constant. Prefix of the new file paths in the diff headers, it is removed from the paths
+    """
+    SRC_PREFIX = "a/"
+    DST_PREFIX = "b/"
+    HUNK_HEADER_PATTERN = regex.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+    @classmethod
+    def run_git_diff(cls,
+                     path: str,
+                     base_ref: str,
+                     head_ref: Optional[str] = None,
+                     context_lines: int = 3) -> Iterator[bytes]:
+        """Run `git diff` of the path and give its output lazily. Deleted files are not included
+
+        Args:
+            path: file or directory in the working tree of a repository. Paths in the diff are relative to the
+                directory of the path
+            base_ref: git revision to compare with
+            head_ref: git revision with the changes, working tree is compared if not set
+            context_lines: number of context lines around changed lines
+
+        Return:
+            Iterator over lines of the diff
+
+        Raises:
+            RuntimeError: if git fails, for example the revision is not known
+        """
+        dir_path, pathspec = (path, ".") if os.path.isdir(path) else os.path.split(path)
+        command = [
+            "git", "-c", "core.quotePath=false", "diff", "--no-color", "--no-ext-diff", "--diff-filter=d",
+            "--relative", f"--src-prefix={cls.SRC_PREFIX}", f"--dst-prefix={cls.DST_PREFIX}",
+            f"--unified={context_lines}", base_ref
+        ]
+        if head_ref:
+            command.append(head_ref)
+        command.extend(["--", pathspec])
+        with subprocess.Popen(command, cwd=dir_path or ".", stdout=subprocess.PIPE) as process:
+            yield from process.stdout
+        if process.returncode != 0:
+            raise RuntimeError(f"git diff failed with code {process.returncode} in {path}")
+
+    @classmethod
+    def parse(cls, diff_lines: Iterable[bytes], dir_path: str = "") -> Iterator[Tuple[str, DiffHunk]]:
+        """Parse unified diff into hunks of new file versions
+
+        Args:
+            diff_lines: lines of the diff
+            dir_path: directory the paths of the diff are relative to. It is joined with the paths
+
+        Return:
+            Iterator over file path and hunk. Hunks of deleted and binary files are not given
+        """
+        file_path: Optional[str] = None
+        diff_iter = iter(diff_lines)
+        for diff_line in diff_iter:
+            if diff_line.startswith(b"+++ "):
+                file_path = cls.get_file_path(cls.decode(diff_line[4:]), dir_path)
+                continue
+            if not diff_line.startswith(b"@@ "):
+                continue
+            match_obj = cls.HUNK_HEADER_PATTERN.match(cls.decode(diff_line))
+            if match_obj is None:
+                continue
+            old_count = int(match_obj.group(2)) if match_obj.group(2) is not None else 1
+            new_count = int(match_obj.group(4)) if match_obj.group(4) is not None else 1
+            new_start = int(match_obj.group(3))
+            lines: List[str] = []
+            added_line_nums: List[int] = []
+            # Lines of the hunk are counted, so removed lines that look like headers are not taken for them
+            while old_count > 0 or new_count > 0:
+                diff_line = next(diff_iter, None)
+                if diff_line is None:
+                    break
+                kind = diff_line[:1]
+                if kind == b"\\":
+                    # "\ No newline at end of file"
+                    continue
+                if kind == b"-":
+                    old_count -= 1
+                    continue
+                lines.append(cls.decode(diff_line[1:]))
+                new_count -= 1
+                if kind == b"+":
+                    added_line_nums.append(len(lines))
+                else:
+                    old_count -= 1
+            if file_path is not None and added_line_nums:
+                yield file_path, (lines, added_line_nums, max(new_start - 1, 0))
+
+    @classmethod
+    def get_file_path(cls, header_path: str, dir_path: str) -> Optional[str]:
+        """Get path of the new file version from the value of `+++` header
+
+        Args:
+            header_path: value of the header, with optional quotes, prefix and timestamp
+            dir_path: directory the paths of the diff are relative to
+
+        Return:
+            File path, or None if the file is deleted
+        """
+        if header_path.startswith("\""):
+            # Path with special characters is quoted with C-style escapes of UTF-8 bytes
+            header_path = codecs.escape_decode(header_path[1:header_path.rindex("\"")].encode())[0].decode(
+                errors="replace")
+        else:
+            # Diff of other tools may have timestamp after the path
+            header_path = header_path.split("\t", 1)[0]
+        if header_path == "/dev/null":
+            return None
+        if header_path.startswith(cls.DST_PREFIX):
+            header_path = header_path[len(cls.DST_PREFIX):]
+        return os.path.join(dir_path, header_path) if dir_path else header_path
+
+    @classmethod
+    def decode(cls, diff_line: bytes) -> str:
+        """Decode line of the diff without line break. Invalid UTF-8 bytes are replaced"""
+        return diff_line.rstrip(b"\n").rstrip(b"\r").decode(errors="replace")
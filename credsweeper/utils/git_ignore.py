@@ -0,0 +1,291 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+from regex import regex
+
+# Rule is regex of the pattern relative to the base directory, negation flag and directory-only flag
+GitIgnoreRule = Tuple[str, bool, bool]
+# Rules in effect in a directory with base directory of each rule, and compiled matchers for files and directories
+DirRules = Tuple[Tuple[Tuple[str, GitIgnoreRule], ...], regex.Pattern, regex.Pattern]
+
+
+class GitIgnore:
+    """In-process matcher of gitignore rules, works without git and without `.git` directory
+
+    Rules are read from `.gitignore` files, `.git/info/exclude` and the global excludes file. Rules in effect in a
+    directory are compiled into a single regex over absolute paths, with alternatives ordered so the first matched
+    alternative is the rule that git applies. Directories without own `.gitignore` share the regex of their parent,
+    so a regex is compiled once per `.gitignore` file. Unlike `git check-ignore`, tracked files are not known and
+    are ignored by the rules the same way as untracked ones
+
+    Attributes:
+        root_path: directory where rules start if the paths are not in a repository. Nearest directory with `.git`
+            above it is used instead if there is one
+    """
+    GITIGNORE = ".gitignore"
+
+    def __init__(self, root_path: Optional[str] = None) -> None:
+        self.root_path = self.find_root_path(root_path) if root_path is not None else None
+        # Directory -> rules in effect for entries of the directory, or None if the directory itself is ignored
+        self.__dir_rules: Dict[str, Optional[DirRules]] = {}
+        self.__global_rules: Optional[List[GitIgnoreRule]] = None
+
+    def is_ignored(self, path: str, is_dir: Optional[bool] = None) -> bool:
+        """Check if the path is ignored by gitignore rules. Path is ignored if any of its parent directories is
+
+        Args:
+            path: path to the file or directory to check
+            is_dir: is the path a directory, checked on the file system if not set
+
+        Return:
+            Boolean. True if the path is ignored. False otherwise
+        """
+        path = os.path.abspath(path)
+        if is_dir is None:
+            is_dir = os.path.isdir(path)
+        if is_dir and os.path.exists(os.path.join(path, ".git")):
+            # Nested repository has its own rules
+            return False
+        dir_rules = self._get_dir_rules(os.path.dirname(path))
+        return dir_rules is None or self._match(dir_rules, path, is_dir)
+
+    def _get_dir_rules(self, dir_path: str) -> Optional[DirRules]:
+        if dir_path in self.__dir_rules:
+            return self.__dir_rules[dir_path]
+        parent_path = os.path.dirname(dir_path)
+        if parent_path == dir_path or dir_path == self.root_path or os.path.exists(os.path.join(dir_path, ".git")):
+            rules = [(dir_path, rule) for rule in self.get_global_rules()]
+            exclude_path = os.path.join(dir_path, ".git", "info", "exclude")
+            rules.extend((dir_path, rule) for rule in self.read_rules(exclude_path))
+            dir_rules = self._extend_rules(tuple(rules), dir_path)
+        else:
+            parent_rules = self._get_dir_rules(parent_path)
+            if parent_rules is None or self._match(parent_rules, dir_path, True):
+                dir_rules = None
+            else:
+                dir_rules = self._extend_rules(parent_rules[0], dir_path, parent_rules)
+        self.__dir_rules[dir_path] = dir_rules
+        return dir_rules
+
+    def _extend_rules(self,
+                      rules: Tuple[Tuple[str, GitIgnoreRule], ...],
+                      dir_path: str,
+                      parent_rules: Optional[DirRules] = None) -> DirRules:
+        own_rules = self.read_rules(os.path.join(dir_path, self.GITIGNORE))
+        if parent_rules is not None and not own_rules:
+            return parent_rules
+        rules = rules + tuple((dir_path, rule) for rule in own_rules)
+        return rules, self.compile_rules(rules, False), self.compile_rules(rules, True)
+
+    @classmethod
+    def _match(cls, dir_rules: DirRules, path: str, is_dir: bool) -> bool:
+        match_obj = (dir_rules[2] if is_dir else dir_rules[1]).fullmatch(cls.get_posix_path(path))
+        # Group name tells if the rule that is applied ignores the path or is negated
+        return match_obj is not None and match_obj.lastgroup[0] == "i"
+
+    @classmethod
+    def compile_rules(cls, rules: Tuple[Tuple[str, GitIgnoreRule], ...], is_dir: bool) -> regex.Pattern:
+        """Compile rules into single regex over absolute paths with POSIX separators, see `get_posix_path`. The last
+            rule has the highest priority, so rules are placed in reverse order, and the first alternative that
+            matches is the rule git applies
+
+        Args:
+            rules: rules with their base directories, in order of increasing priority
+            is_dir: compile regex for directories. Directory-only rules are skipped for files
+
+        Return:
+            Compiled regex. Name of the matched group starts with "i" for ignoring rules and with "n" for negated
+        """
+        alternatives = []
+        for index in range(len(rules) - 1, -1, -1):
+            base_path, (pattern, negated, dir_only) = rules[index]
+            if dir_only and not is_dir:
+                continue
+            prefix = regex.escape(cls.get_posix_path(base_path).rstrip("/") + "/")
+            alternatives.append(f"(?P<{'n' if negated else 'i'}{index}>{prefix}{pattern})")
+        if not alternatives:
+            # Pattern that never matches
+            return regex.compile("(?!)")
+        return regex.compile("|".join(alternatives), flags=regex.DOTALL)
+
+    @classmethod
+    def get_posix_path(cls, path: str) -> str:
+        """Get path with POSIX separators, as gitignore patterns use them on every platform
+
+        Args:
+            path: path with separators of the platform
+
+        Return:
+            Path with "/" separators
+        """
+        return path.replace(os.sep, "/")
+
+    def get_global_rules(self) -> List[GitIgnoreRule]:
+        """Get rules of the global excludes file, `core.excludesFile` of the user git config. Rules are read once"""
+        if self.__global_rules is None:
+            self.__global_rules = self.read_rules(self.get_global_excludes_path())
+        return self.__global_rules
+
+    @classmethod
+    def get_global_excludes_path(cls) -> str:
+        """Get path to the global excludes file from `core.excludesFile` of `~/.gitconfig` or default location"""
+        config_home = os.getenv("XDG_CONFIG_HOME") or os.path.expanduser(os.path.join("~", ".config"))
+        # Setting of ~/.gitconfig overrides the one of XDG config, as git reads it later
+        for config_path in (os.path.expanduser(os.path.join("~", ".gitconfig")),
+                            os.path.join(config_home, "git", "config")):
+            excludes_path = cls.read_core_excludes_file(config_path)
+            if excludes_path:
+                return os.path.expanduser(excludes_path)
+        return os.path.join(config_home, "git", "ignore")
+
+    @classmethod
+    def read_core_excludes_file(cls, config_path: str) -> Optional[str]:
+        """Read `excludesFile` of `core` section from git config file
+
+        Args:
+            config_path: path to git config file
+
+        Return:
+            Value of the setting, or None if the file or the setting is absent
+        """
+        try:
+            with open(config_path, encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        section = None
+        excludes_path = None
+        for line in lines:
+            line = line.strip()
+            if line.startswith("["):
+                section = line.strip("[]").strip().lower()
+            elif section == "core" and "=" in line:
+                key, value = line.split("=", 1)
+                if key.strip().lower() == "excludesfile":
+                    excludes_path = value.strip().strip("\"")
+        return excludes_path
+
+    @classmethod
+    def read_rules(cls, file_path: str) -> List[GitIgnoreRule]:
+        """Read rules from gitignore file
+
+        Args:
+            file_path: path to the file
+
+        Return:
+            List of rules, empty if the file is absent
+        """
+        try:
+            with open(file_path, encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return []
+        rules = []
+        for line in lines:
+            rule = cls.parse_rule(line)
+            if rule is not None:
+                rules.append(rule)
+        return rules
+
+    @classmethod
+    def parse_rule(cls, line: str) -> Optional[GitIgnoreRule]:
+        """Parse line of gitignore file
+
+        Args:
+            line: line of the file
+
+        Return:
+            Rule, or None if the line is blank or a comment
+        """
+        if line.startswith("#"):
+            return None
+        # Trailing spaces are ignored unless escaped with backslash
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        if dir_only:
+            line = line[:-1]
+        if not line:
+            return None
+        # Pattern with a slash at the beginning or in the middle is relative to the gitignore directory,
+        # otherwise it matches at any level below the directory
+        anchored = "/" in line
+        if line.startswith("/"):
+            line = line[1:]
+        pattern = cls.translate(line)
+        return pattern if anchored else f"(?:.*/)?{pattern}", negated, dir_only
+
+    @classmethod
+    def translate(cls, pattern: str) -> str:
+        """Translate gitignore glob to regex
+
+        Args:
+            pattern: glob without leading and trailing slashes
+
+        Return:
+            Regex string that matches the same paths
+        """
+        result = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "*":
+                if pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/") \
+                        and (i + 2 == len(pattern) or pattern[i + 2] == "/"):
+                    if i + 2 == len(pattern):
+                        # Trailing "/**" matches everything inside
+                        result.append(".*")
+                        i += 2
+                    else:
+                        # Leading "**/" and "/**/" match zero or more directories
+                        result.append("(?:.*/)?")
+                        i += 3
+                    continue
+                while i < len(pattern) and pattern[i] == "*":
+                    i += 1
+                result.append("[^/]*")
+                continue
+            if char == "?":
+                result.append("[^/]")
+            elif char == "[":
+                # "]" right after the opening bracket or its negation is a character of the class
+                end = pattern.find("]", i + 3 if pattern[i + 1:i + 2] in ("!", "^") else i + 2)
+                if end < 0:
+                    result.append(regex.escape(char))
+                else:
+                    chars = pattern[i + 1:end]
+                    if chars[0] in "!^":
+                        chars = "^/" + chars[1:]
+                    result.append("[" + chars.replace("\\", "\\\\").replace("[", "\\[") + "]")
+                    i = end
+            elif char == "\\" and i + 1 < len(pattern):
+                i += 1
+                result.append(regex.escape(pattern[i]))
+            else:
+                result.append(regex.escape(char))
+            i += 1
+        return "".join(result)
+
+    @classmethod
+    def find_root_path(cls, path: str) -> str:
+        """Locate nearest directory with `.git` at or above the path
+
+        Args:
+            path: path to the file or directory
+
+        Return:
+            Path to the repository directory, or the directory of the path if it is not in a repository
+        """
+        path = os.path.abspath(path)
+        dir_path = path if os.path.isdir(path) else os.path.dirname(path)
+        root_path = dir_path
+        while True:
+            if os.path.exists(os.path.join(dir_path, ".git")):
+                return dir_path
+            parent_path = os.path.dirname(dir_path)
+            if parent_path == dir_path:
+                return root_path
+            dir_path = parent_path
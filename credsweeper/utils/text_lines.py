@@ -0,0 +1,77 @@
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Union
+
+from regex import regex
+
+
+class TextLines(Sequence[str]):
+    """Lazy list of lines over a whole text buffer
+
+    Lines are split in the same way as `str.splitlines` does, but only offsets of line starts and ends are stored.
+    Line strings are sliced from the buffer on access, so only lines that are actually used get allocated
+
+    Attributes:
+        text: whole text buffer
+        line_starts: offset of the first character of each line
+        line_ends: offset right after the last character of each line (line break not included)
+    """
+    LINE_BREAK_PATTERN = regex.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        line_breaks = [match_obj.span() for match_obj in self.LINE_BREAK_PATTERN.finditer(text)]
+        self.line_starts: List[int] = [0] + [end for _, end in line_breaks]
+        self.line_ends: List[int] = [start for start, _ in line_breaks] + [len(text)]
+        if self.line_starts[-1] == len(text):
+            # Same as `str.splitlines`: no empty line after the trailing line break, and no lines in empty text
+            self.line_starts.pop()
+            self.line_ends.pop()
+
+    def __len__(self) -> int:
+        return len(self.line_starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self.text[self.line_starts[index]:self.line_ends[index]]
+
+    def get_line_num(self, offset: int) -> int:
+        """Get number of line that contains character at the offset
+
+        Args:
+            offset: position in the text buffer. Line breaks belong to the line they terminate
+
+        Return:
+            Line number starting from 1
+        """
+        return max(bisect_right(self.line_starts, offset), 1)
+
+    def find_line_nums(self, pattern: regex.Pattern, timeout: Optional[float] = None) -> List[int]:
+        """Search the pattern over the whole buffer, at most once per line
+
+        After a match, search continues from the start of the next line, so each line is reported once and a match
+        that spans several lines does not hide a match that starts in the following line
+
+        Args:
+            pattern: compiled regex to search
+            timeout: optional time limit in seconds for a single search. TimeoutError is raised when exceeded
+
+        Return:
+            Sorted list of numbers of lines where a match starts
+        """
+        line_nums = []
+        pos = 0
+        while pos < len(self.text):
+            match_obj = pattern.search(self.text, pos, timeout=timeout)
+            if match_obj is None:
+                break
+            line_num = self.get_line_num(match_obj.start())
+            line_nums.append(line_num)
+            if line_num >= len(self):
+                break
+            pos = self.line_starts[line_num]
+        return line_nums
@@ -1,22 +1,58 @@
+import functools
+import hashlib
+import itertools
 import math
 import os
-from typing import List
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from regex import regex
 
 from credsweeper.common.constants import Chars, KeywordPattern, Separator
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
 
 class Util:
     """
     Class that contains different useful methods
+
+    Attributes:
+        pattern_analysis: required substrings, buffer searchability and max match length of already analyzed
+            patterns, by pattern string and verbose flag. Can be filled from a cache to skip the analysis
     """
+    pattern_analysis: Dict[Tuple[str, bool], Tuple[Optional[FrozenSet[str]], bool, Optional[int]]] = {}
 
     @classmethod
     def get_extension(cls, file_path: str) -> str:
         _, extension = os.path.splitext(file_path)
         return extension
 
+    @classmethod
+    def get_source_hash(cls, file_paths: Iterable[str]) -> str:
+        """Get hash of source files content, to key caches of data computed by the code of the files. So the cache
+            is not used after the code is changed, even if the package version is the same
+
+        Args:
+            file_paths: paths of the source files
+
+        Return:
+            Hex digest string. File that cannot be read is hashed by its path only
+        """
+        hasher = hashlib.sha256()
+        for file_path in file_paths:
+            hasher.update(f"{os.path.basename(file_path)}\0".encode())
+            try:
+                with open(file_path, "rb") as f:
+                    hasher.update(f.read())
+            except OSError:
+                continue
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
     @classmethod
     def get_keyword_pattern(cls, keyword: str, separator: Separator = Separator.common) -> regex.Pattern:
         return regex.compile(KeywordPattern.key.format(keyword) + KeywordPattern.separator.format(separator) +
@@ -36,6 +72,233 @@ class Util:
 
         return result
 
+    @classmethod
+    def get_required_substrings(cls, pattern: regex.Pattern) -> Optional[FrozenSet[str]]:
+        """Extract set of literals such that any match of the pattern contains at least one of them
+
+        Literals are returned case folded and should be searched case-insensitively. Pattern that cannot be parsed
+        or that has no literal of at least MIN_REQUIRED_SUBSTRING_LENGTH characters gets None
+
+        Args:
+            pattern: compiled regex pattern
+
+        Return:
+            Frozen set of case folded literals, or None if no required literal found
+        """
+        return cls.get_pattern_analysis(pattern)[0]
+
+    @classmethod
+    def is_buffer_searchable(cls, pattern: regex.Pattern) -> bool:
+        """Check that pattern detected in a line is also found in the same place when whole text is searched
+
+        Anchors, lookarounds, possessive quantifiers and atomic groups may give different result when a line is
+        followed by a line break and other lines, so patterns with them should be searched line by line
+
+        Args:
+            pattern: compiled regex pattern
+
+        Return:
+            Boolean. True if pattern can be searched over the whole text. False otherwise
+        """
+        return cls.get_pattern_analysis(pattern)[1]
+
+    @classmethod
+    def get_max_match_length(cls, pattern: regex.Pattern) -> Optional[int]:
+        """Get the longest possible length of a pattern match
+
+        Args:
+            pattern: compiled regex pattern
+
+        Return:
+            Max length of a match, or None if the length is not bounded or the pattern cannot be parsed
+        """
+        return cls.get_pattern_analysis(pattern)[2]
+
+    @classmethod
+    def get_pattern_analysis(cls, pattern: regex.Pattern) -> Tuple[Optional[FrozenSet[str]], bool, Optional[int]]:
+        """Get required substrings, buffer searchability and max match length of the pattern. Pattern is analyzed
+            once and the result is kept in `pattern_analysis`
+
+        Args:
+            pattern: compiled regex pattern
+
+        Return:
+            Tuple of results of `get_required_substrings`, `is_buffer_searchable` and `get_max_match_length`
+        """
+        key = (pattern.pattern, bool(pattern.flags & regex.VERBOSE))
+        analysis = cls.pattern_analysis.get(key)
+        if analysis is None:
+            if cls._has_inner_global_flags(*key):
+                # Parser of each Python version treats such flags differently, so nothing is known about the pattern
+                analysis = (None, False, None)
+            else:
+                analysis = (cls._get_pattern_required_substrings(*key), cls._is_pattern_buffer_searchable(*key),
+                            cls._get_pattern_max_match_length(*key))
+            cls.pattern_analysis[key] = analysis
+        return analysis
+
+    LEADING_FLAGS_PATTERN = regex.compile(r"(?:\(\?[aiLmsux]+\))+")
+
+    @classmethod
+    def _has_inner_global_flags(cls, pattern: str, verbose: bool) -> bool:
+        """Check whether the pattern has global inline flags, like `(?i)`, besides a flags group at its start"""
+        base_flags = regex.VERBOSE if verbose else 0
+        leading_flags = cls.LEADING_FLAGS_PATTERN.match(pattern)
+        leading_pattern = leading_flags.group() if leading_flags else ""
+        return regex.compile(pattern, base_flags).flags != regex.compile(leading_pattern, base_flags).flags
+
+    @classmethod
+    def _get_pattern_max_match_length(cls, pattern: str, verbose: bool) -> Optional[int]:
+        try:
+            _, max_length = sre_parse.parse(pattern, re.VERBOSE if verbose else 0).getwidth()
+        except Exception:
+            # Pattern uses syntax specific to `regex` module
+            return None
+        return max_length if max_length < sre_parse.MAXREPEAT else None
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _parse_pattern(cls, pattern: str, verbose: bool) -> Optional[list]:
+        try:
+            return list(sre_parse.parse(pattern, re.VERBOSE if verbose else 0))
+        except Exception:
+            # Pattern uses syntax specific to `regex` module
+            return None
+
+    @classmethod
+    def _is_pattern_buffer_searchable(cls, pattern: str, verbose: bool) -> bool:
+        parsed = cls._parse_pattern(pattern, verbose)
+        return parsed is not None and cls._is_sequence_buffer_searchable(parsed)
+
+    @classmethod
+    def _is_sequence_buffer_searchable(cls, items: Iterable) -> bool:
+        for op, av in items:
+            if op is sre_parse.AT:
+                if av not in (sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY):
+                    return False
+            elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT, getattr(sre_parse, "ATOMIC_GROUP", None),
+                        getattr(sre_parse, "POSSESSIVE_REPEAT", None)):
+                return False
+            elif op is sre_parse.SUBPATTERN:
+                if not cls._is_sequence_buffer_searchable(av[-1]):
+                    return False
+            elif op is sre_parse.BRANCH:
+                if not all(cls._is_sequence_buffer_searchable(branch) for branch in av[1]):
+                    return False
+            elif op in cls._get_repeat_ops():
+                if not cls._is_sequence_buffer_searchable(av[2]):
+                    return False
+            elif op is sre_parse.GROUPREF_EXISTS:
+                if not all(cls._is_sequence_buffer_searchable(branch) for branch in av[1:] if branch is not None):
+                    return False
+        return True
+
+    @classmethod
+    def _get_pattern_required_substrings(cls, pattern: str, verbose: bool) -> Optional[FrozenSet[str]]:
+        parsed = cls._parse_pattern(pattern, verbose)
+        if parsed is None:
+            # Cannot say anything about the literals
+            return None
+        required = cls._get_sequence_required_substrings(parsed)
+        if required is None:
+            return None
+        return frozenset(literal.casefold() for literal in required)
+
+    MIN_REQUIRED_SUBSTRING_LENGTH = 2
+    MAX_EXACT_SUBSTRINGS = 32
+
+    @classmethod
+    def _get_sequence_required_substrings(cls, items: Iterable) -> Optional[Set[str]]:
+        """Find the best set of required literals of a parsed regex sequence"""
+        candidates = []
+        run = {""}
+        for item in items:
+            exact = cls._get_exact_substrings(item)
+            if exact is not None and len(run) * len(exact) <= cls.MAX_EXACT_SUBSTRINGS:
+                # Consecutive exact items are joined to a longer literal
+                run = {prefix + suffix for prefix in run for suffix in exact}
+                continue
+            candidates.append(run)
+            if exact is not None:
+                run = exact
+            else:
+                candidates.append(cls._get_item_required_substrings(item))
+                run = {""}
+        candidates.append(run)
+        valid_candidates = [
+            candidate for candidate in candidates
+            if candidate and all(len(literal) >= cls.MIN_REQUIRED_SUBSTRING_LENGTH for literal in candidate)
+        ]
+        if not valid_candidates:
+            return None
+        # Longest shortest literal gives the most selective set
+        return max(valid_candidates, key=lambda candidate: (min(map(len, candidate)), -len(candidate)))
+
+    @classmethod
+    def _get_item_required_substrings(cls, item: tuple) -> Optional[Set[str]]:
+        """Find required literals of a single non-exact item of a parsed regex"""
+        op, av = item
+        if op is sre_parse.SUBPATTERN:
+            return cls._get_sequence_required_substrings(av[-1])
+        if op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            return cls._get_sequence_required_substrings(av)
+        if op in cls._get_repeat_ops() and av[0] >= 1:
+            return cls._get_sequence_required_substrings(av[2])
+        if op is sre_parse.BRANCH:
+            result = set()
+            for branch in av[1]:
+                branch_required = cls._get_sequence_required_substrings(branch)
+                if branch_required is None:
+                    return None
+                result.update(branch_required)
+            return result
+        return None
+
+    @classmethod
+    def _get_exact_substrings(cls, item: tuple) -> Optional[Set[str]]:
+        """Get all strings that a parsed regex item can match, if there are only few of them. None otherwise"""
+        op, av = item
+        if op is sre_parse.LITERAL:
+            return {chr(av)}
+        if op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            # Zero-width items do not break consecutive literals
+            return {""}
+        if op is sre_parse.IN:
+            if len(av) <= cls.MAX_EXACT_SUBSTRINGS and all(in_op is sre_parse.LITERAL for in_op, _ in av):
+                return {chr(code) for _, code in av}
+            return None
+        if op is sre_parse.SUBPATTERN:
+            return cls._get_sequence_exact_substrings(av[-1])
+        if op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            return cls._get_sequence_exact_substrings(av)
+        if op is sre_parse.BRANCH:
+            result = set()
+            for branch in av[1]:
+                branch_exact = cls._get_sequence_exact_substrings(branch)
+                if branch_exact is None:
+                    return None
+                result.update(branch_exact)
+            return result if len(result) <= cls.MAX_EXACT_SUBSTRINGS else None
+        if op in cls._get_repeat_ops() and av[0] == av[1]:
+            return cls._get_sequence_exact_substrings(list(av[2]) * av[0])
+        return None
+
+    @classmethod
+    def _get_sequence_exact_substrings(cls, items: Iterable) -> Optional[Set[str]]:
+        result = {""}
+        for item in items:
+            exact = cls._get_exact_substrings(item)
+            if exact is None or len(result) * len(exact) > cls.MAX_EXACT_SUBSTRINGS:
+                return None
+            result = {prefix + suffix for prefix, suffix in itertools.product(result, exact)}
+        return result
+
+    @classmethod
+    def _get_repeat_ops(cls) -> tuple:
+        return tuple(
+            getattr(sre_parse, op_name) for op_name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+            if hasattr(sre_parse, op_name))
+
     @classmethod
     def is_entropy_validate(cls, data: str) -> bool:
         if cls.get_shannon_entropy(data, Chars.BASE64_CHARS) > 4.5 or \
@@ -1,9 +1,30 @@
-from credsweeper.validations.github_token_validation import GithubTokenValidation
-from credsweeper.validations.google_api_key_validation import GoogleApiKeyValidation
-from credsweeper.validations.google_multi_validation import GoogleMultiValidation
-from credsweeper.validations.mailchimp_key_validation import MailChimpKeyValidation
-from credsweeper.validations.slack_token_validation import SlackTokenValidation
-from credsweeper.validations.square_access_token_validation import SquareAccessTokenValidation
-from credsweeper.validations.square_client_id_validation import SquareClientIdValidation
-from credsweeper.validations.stripe_api_key_validation import StripeApiKeyValidation
+import importlib
+from typing import Any, List
+
+# Credentials package is initialized first, as its Candidate imports Validation back from this package
+import credsweeper.credentials  # isort:skip
 from credsweeper.validations.validation import Validation
+
+# Validation classes depend on heavy `requests` and `google_auth_oauthlib` packages, so their modules are imported on
+# first access to the class, only when API validation is used
+VALIDATION_MODULES = {
+    "GithubTokenValidation": "credsweeper.validations.github_token_validation",
+    "GoogleApiKeyValidation": "credsweeper.validations.google_api_key_validation",
+    "GoogleMultiValidation": "credsweeper.validations.google_multi_validation",
+    "MailChimpKeyValidation": "credsweeper.validations.mailchimp_key_validation",
+    "SlackTokenValidation": "credsweeper.validations.slack_token_validation",
+    "SquareAccessTokenValidation": "credsweeper.validations.square_access_token_validation",
+    "SquareClientIdValidation": "credsweeper.validations.square_client_id_validation",
+    "StripeApiKeyValidation": "credsweeper.validations.stripe_api_key_validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = VALIDATION_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(VALIDATION_MODULES))
@@ -1,10 +1,16 @@
+import os
+import re
+
 import setuptools
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+# Version is defined once in the package, it is read without import of the package
+with open(os.path.join("credsweeper", "__init__.py"), "r") as fh:
+    version = re.search(r"^__version__ = \"(.+)\"$", fh.read(), re.MULTILINE).group(1)
+
 install_requires = [
-    "GitPython",
     "google_auth_oauthlib",
     "PyYAML",
     "regex",
@@ -19,7 +25,7 @@ ml_requires = [
 
 setuptools.setup(
     name="CredSweeper",
-    version="1.0.0",
+    version=version,
     description="Credential Sweeper",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -0,0 +1,24 @@
+import json
+import os
+
+from credsweeper.config import Config
+
+
+class TestConfig:
+    def test_get_exclude_path_pattern_p(self) -> None:
+        pattern = Config.get_exclude_path_pattern(["/.git/", "/node_modules/"])
+        assert pattern.match("repo/node_modules/lib.js")
+        assert pattern.match("repo/app.min.js")
+        assert not pattern.match("repo/src/app.js")
+
+    def test_get_exclude_path_pattern_n(self) -> None:
+        """Config without path exclusions is created, only NOT_ALLOWED_PATH is excluded"""
+        dir_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+        with open(os.path.join(dir_path, "credsweeper", "secret", "config.json"), "r") as conf_file:
+            config_dict = json.load(conf_file)
+        config_dict["exclude"]["path"] = []
+        config_dict["validation"] = {"ml_validation": False, "api_validation": False}
+        config_dict["use_filters"] = True
+        config = Config(config_dict)
+        assert config.exclude_path_pattern.match("repo/app.min.js")
+        assert not config.exclude_path_pattern.match("repo/.git/config")
@@ -25,3 +25,21 @@ class TestCredentialManager:
         groups = cred_sweeper.credential_manager.group_credentials()
         # Assert that no credentials can be grouped in tested cases
         assert len(groups) == len(detections)
+
+    def test_get_credentials_by_path_and_rule_p(self):
+        cred_sweeper = CredSweeper()
+        credential_manager = cred_sweeper.credential_manager
+        credential_manager.add_credentials(cred_sweeper.scanner.scan("a.py", ["password = 'cackle!4aB'"]))
+        credential_manager.add_credentials(cred_sweeper.scanner.scan("b.py", ["token = 'cackle!4aB'"]))
+        assert [candidate.rule_name for candidate in credential_manager.get_credentials_by_path("b.py")] == ["Token"]
+        assert [candidate.line_data_list[0].path
+                for candidate in credential_manager.get_credentials_by_rule("Password")] == ["a.py"]
+        credential_manager.remove_credential(credential_manager.get_credentials_by_path("a.py")[0])
+        assert credential_manager.get_credentials_by_path("a.py") == []
+        assert credential_manager.get_credentials_by_rule("Password") == []
+        assert len(credential_manager.group_credentials()) == len(credential_manager.get_credentials()) == 1
+
+    def test_get_credentials_by_path_n(self):
+        cred_sweeper = CredSweeper()
+        assert cred_sweeper.credential_manager.get_credentials_by_path("a.py") == []
+        assert cred_sweeper.credential_manager.get_credentials_by_rule("Password") == []
@@ -1,4 +1,5 @@
 import pytest
+from regex import regex
 
 from credsweeper.config import Config
 from credsweeper.credentials import LineData
@@ -89,3 +90,23 @@ class TestLineData:
         line_data = LineData(config, formatted_line, 0, file_path, rule.patterns[0])
         assert line_data.value == "ngh679x"
         assert line_data.variable == var_name
+
+    @pytest.mark.parametrize("var_name, rule_name", [("password", "Password"), ("aws_token", "Token")])
+    def test_match_obj_p(self, file_path: pytest.fixture, rule: pytest.fixture, var_name: str, rule_name: str,
+                         config: Config) -> None:
+        """Check that LineData built from existing match is the same as LineData that searches the line itself"""
+        line = f'{var_name} = my_func("ngh679x")'
+        match_obj = rule.patterns[0].search(line)
+        line_data = LineData(config, line, 0, file_path, rule.patterns[0], match_obj)
+        expected = LineData(config, line, 0, file_path, rule.patterns[0])
+        assert line_data.value == expected.value == "ngh679x"
+        assert line_data.variable == expected.variable == var_name
+        assert line_data.separator_span == expected.separator_span
+
+    def test_match_obj_no_groups_p(self, file_path: pytest.fixture, config: Config) -> None:
+        """Check that groups not defined in the pattern are left empty"""
+        pattern = regex.compile(r"(?P<value>ngh679x)")
+        line_data = LineData(config, "ngh679x", 0, file_path, pattern, pattern.search("ngh679x"))
+        assert line_data.value == "ngh679x"
+        assert line_data.variable is None
+        assert line_data.separator_span is None
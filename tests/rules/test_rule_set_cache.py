@@ -0,0 +1,51 @@
+import os
+
+from credsweeper.config import Config
+from credsweeper.rules.rule_set_cache import RuleSetCache
+from credsweeper.scanner import Scanner
+from credsweeper.utils import Util
+
+
+class TestRuleSetCache:
+    def test_load_p(self, config: Config, rule_path: str, tmp_path) -> None:
+        config.cache_dir = str(tmp_path)
+        scanner = Scanner(config, rule_path)
+        assert len(os.listdir(tmp_path)) == 1
+        with open(rule_path, "rb") as f:
+            rule_templates = RuleSetCache(str(tmp_path)).load(f.read())
+        assert rule_templates is not None
+        assert [template["name"] for template in rule_templates] == [rule.rule_name for rule in scanner.rules]
+        cached_scanner = Scanner(config, rule_path)
+        assert [rule.patterns for rule in cached_scanner.rules] == [rule.patterns for rule in scanner.rules]
+
+    def test_load_n(self, config: Config, rule_path: str, tmp_path) -> None:
+        config.cache_dir = str(tmp_path)
+        Scanner(config, rule_path)
+        with open(rule_path, "rb") as f:
+            rule_file = f.read()
+        assert RuleSetCache(str(tmp_path)).load(rule_file + b"\n") is None
+        # Broken cache file is rebuilt
+        cache_path = RuleSetCache(str(tmp_path)).get_cache_path(RuleSetCache.get_key(rule_file))
+        with open(cache_path, "w") as f:
+            f.write("{")
+        assert RuleSetCache(str(tmp_path)).load(rule_file) is None
+        assert len(Scanner(config, rule_path).rules) > 0
+        assert RuleSetCache(str(tmp_path)).load(rule_file) is not None
+
+    def test_load_changed_code_n(self, config: Config, rule_path: str, tmp_path, monkeypatch) -> None:
+        """Cache of pattern analysis is not used after the analysis code is changed in the same package version"""
+        config.cache_dir = str(tmp_path)
+        Scanner(config, rule_path)
+        with open(rule_path, "rb") as f:
+            rule_file = f.read()
+        assert RuleSetCache(str(tmp_path)).load(rule_file) is not None
+        monkeypatch.setattr(Util, "get_source_hash", lambda file_paths: "changed")
+        assert RuleSetCache(str(tmp_path)).load(rule_file) is None
+
+    def test_no_cache_dir_n(self, config: Config, rule_path: str, tmp_path, monkeypatch) -> None:
+        """Rule set is not cached anywhere if cache directory is not set"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        config.cache_dir = None
+        assert len(Scanner(config, rule_path).rules) > 0
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,61 @@
+import os
+
+from credsweeper.scanner.content_deduplicator import ContentDeduplicator
+
+
+class TestContentDeduplicator:
+    def test_filter_unique_p(self, tmp_path) -> None:
+        contents = {"a.py": "secret = 'cackle!4aB'", "b.py": "secret = 'cackle!4aB'", "c.txt": "secret = 'cackle!4aB'",
+                    "d.py": "secret = 'cackle!4aC'", "e.py": "secret = 'cackle!4aC'", "f.py": "other"}
+        file_paths = []
+        for file_name, content in contents.items():
+            (tmp_path / file_name).write_text(content)
+            file_paths.append(str(tmp_path / file_name))
+        content_deduplicator = ContentDeduplicator()
+        unique_paths = list(content_deduplicator.filter_unique(file_paths))
+        # Same content of other extension is not a duplicate
+        assert [(os.path.basename(path), size) for path, size in unique_paths] == [("a.py", 21), ("c.txt", 21),
+                                                                                   ("d.py", 21), ("f.py", 5)]
+        assert content_deduplicator.duplicates_count == 2
+
+    def test_filter_unique_n(self, tmp_path) -> None:
+        file_paths = [str(tmp_path / "absent.py"), str(tmp_path / "absent.py")]
+        content_deduplicator = ContentDeduplicator()
+        assert list(content_deduplicator.filter_unique(file_paths)) == [(file_path, 0) for file_path in file_paths]
+        assert content_deduplicator.duplicates_count == 0
+        assert content_deduplicator.pop_copies() == []
+
+    def test_add_records_p(self, tmp_path) -> None:
+        """Findings are copied to skipped paths whether their unique path is scanned before or after they are found"""
+        contents = ["password = 'cackle!4aB'"] * 2 + ["password = 'cackle!4aC'", "password = 'cackle!4aB'"]
+        file_paths = []
+        for index, content in enumerate(contents):
+            (tmp_path / f"{index}.txt").write_text(content)
+            file_paths.append(str(tmp_path / f"{index}.txt"))
+        content_deduplicator = ContentDeduplicator()
+        unique_paths = content_deduplicator.filter_unique(file_paths)
+        assert next(unique_paths)[0] == file_paths[0]
+        assert next(unique_paths)[0] == file_paths[2]
+        # Second path is skipped before the first one is scanned, it waits for the findings
+        assert content_deduplicator.pop_copies() == []
+        records = [["record"]]
+        assert content_deduplicator.add_records(1, []) == []
+        assert content_deduplicator.add_records(0, records) == [(file_paths[1], records)]
+        assert list(unique_paths) == []
+        # Last path is skipped after the first one is scanned
+        assert content_deduplicator.pop_copies() == [(file_paths[3], records)]
+        assert content_deduplicator.pop_copies() == []
+
+    def test_add_records_n(self, tmp_path) -> None:
+        """Skipped paths of content without findings are not given"""
+        file_paths = []
+        for index in range(3):
+            (tmp_path / f"{index}.txt").write_text("text")
+            file_paths.append(str(tmp_path / f"{index}.txt"))
+        content_deduplicator = ContentDeduplicator()
+        unique_paths = content_deduplicator.filter_unique(file_paths)
+        assert next(unique_paths)[0] == file_paths[0]
+        assert list(unique_paths) == []
+        assert content_deduplicator.pop_copies() == []
+        assert content_deduplicator.add_records(0, []) == []
+        assert content_deduplicator.pop_copies() == []
@@ -0,0 +1,13 @@
+from credsweeper.scanner.literal_index import LiteralIndex
+
+
+class TestLiteralIndex:
+    def test_get_rule_indices_p(self) -> None:
+        index = LiteralIndex([frozenset({"pass"}), frozenset({"password"}), None, frozenset({"akia"})])
+        assert index.get_rule_indices("PASSWORD = 1") == [0, 1, 2]
+        assert index.get_rule_indices("pass = 1") == [0, 2]
+        assert index.get_rule_indices("key=AkIaXXX") == [2, 3]
+
+    def test_get_rule_indices_n(self) -> None:
+        index = LiteralIndex([frozenset({"pass"}), frozenset({"akia"})])
+        assert index.get_rule_indices("nothing here") == []
@@ -0,0 +1,112 @@
+import os
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import Severity
+from credsweeper.config import Config
+from credsweeper.scanner import Scanner
+from credsweeper.scanner.scan_cache import ScanCache
+from credsweeper.utils import Util
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "samples")
+
+
+class TestScanCache:
+    def test_records_p(self, config: Config, rule_path: str) -> None:
+        """Candidates created from records are the same as candidates of the scan"""
+        scanner = Scanner(config, rule_path)
+        for file_name in sorted(os.listdir(SAMPLES_DIR)):
+            file_path = os.path.join(SAMPLES_DIR, file_name)
+            with open(file_path) as f:
+                candidates = scanner.scan(file_path, f.read().splitlines())
+            records = ScanCache.get_records(candidates, scanner.rules)
+            restored = ScanCache.get_candidates(records, file_path, scanner.rules)
+            assert [candidate.to_json() for candidate in restored] == [candidate.to_json() for candidate in candidates]
+            for candidate, restored_candidate in zip(candidates, restored):
+                assert [line_data.get_match_groups() for line_data in restored_candidate.line_data_list] \
+                    == [line_data.get_match_groups() for line_data in candidate.line_data_list]
+
+    def test_records_same_rule_name_p(self, config: Config, tmp_path) -> None:
+        """Records refer to the rule that found the candidate, even if other rules have the same name"""
+        rule_path = tmp_path / "rules.yaml"
+        rule_path.write_text("""
+- name: Dup
+  severity: high
+  type: pattern
+  values:
+  - (?P<value>AKIA[0-9A-Z]{16})
+  filter_type: GeneralPattern
+  use_ml: false
+  validations: []
+
+- name: Dup
+  severity: low
+  type: pattern
+  values:
+  - (?P<value>ghp_[0-9a-zA-Z]{36})
+  filter_type: GeneralPattern
+  use_ml: false
+  validations: []
+""")
+        scanner = Scanner(config, str(rule_path))
+        candidates = scanner.scan("file", ["key = ghp_" + "a1B2c3D4e5" * 3 + "a1B2c3"])
+        assert [candidate.severity for candidate in candidates] == [Severity.LOW]
+        restored = ScanCache.get_candidates(ScanCache.get_records(candidates, scanner.rules), "file", scanner.rules)
+        assert [candidate.to_json() for candidate in restored] == [candidate.to_json() for candidate in candidates]
+        assert ScanCache.get_fingerprint("rules", scanner.rules, {}) \
+            != ScanCache.get_fingerprint("rules", scanner.rules[::-1], {})
+
+    def test_file_scan_cached_p(self, tmp_path, monkeypatch) -> None:
+        """Second scan of the same content is answered from the cache with the same findings"""
+        file_path = os.path.join(SAMPLES_DIR, "password")
+        cred_sweeper = CredSweeper(cache_dir=str(tmp_path))
+        expected = [candidate.to_json() for candidate in cred_sweeper.file_scan(file_path)]
+        assert len(expected) > 0
+
+        def read_and_scan_file(_file_path: str) -> None:
+            raise AssertionError("Cached file is scanned again")
+
+        cred_sweeper = CredSweeper(cache_dir=str(tmp_path))
+        monkeypatch.setattr(cred_sweeper, "read_and_scan_file", read_and_scan_file)
+        assert [candidate.to_json() for candidate in cred_sweeper.file_scan(file_path)] == expected
+
+    def test_file_scan_fingerprint_n(self, tmp_path) -> None:
+        """Cache of a scan with other configs is not used"""
+        file_path = os.path.join(SAMPLES_DIR, "password")
+        cred_sweeper = CredSweeper(cache_dir=str(tmp_path))
+        assert len(cred_sweeper.file_scan(file_path)) > 0
+        other_sweeper = CredSweeper(cache_dir=str(tmp_path), use_filters=False)
+        assert other_sweeper.scan_cache.fingerprint != cred_sweeper.scan_cache.fingerprint
+        key = other_sweeper.scan_cache.get_key(file_path)
+        assert other_sweeper.scan_cache.load(key) is None
+
+    def test_get_fingerprint_code_n(self, monkeypatch) -> None:
+        """Findings cached by other package code or keyword checklist are not used"""
+        fingerprint = ScanCache.get_fingerprint("rules", [], {"use_filters": True})
+        monkeypatch.setattr(ScanCache, "code_fingerprint", None)
+        monkeypatch.setattr(Util, "get_source_hash", lambda file_paths: "changed")
+        assert ScanCache.get_fingerprint("rules", [], {"use_filters": True}) != fingerprint
+
+    def test_get_code_fingerprint_p(self, monkeypatch) -> None:
+        hashed_paths = []
+        monkeypatch.setattr(ScanCache, "code_fingerprint", None)
+        monkeypatch.setattr(Util, "get_source_hash", lambda file_paths: hashed_paths.extend(file_paths) or "")
+        ScanCache.get_code_fingerprint()
+        file_names = [os.path.basename(file_path) for file_path in hashed_paths]
+        assert "keyword_checklist.txt" in file_names
+        assert "scanner.py" in file_names and "util.py" in file_names
+
+    def test_get_key_extension_n(self, tmp_path) -> None:
+        """Same content in a file of other extension has other key, as filters check the extension"""
+        (tmp_path / "a.py").write_text("password = 'cackle!4aB'\n")
+        (tmp_path / "a.txt").write_text("password = 'cackle!4aB'\n")
+        scan_cache = ScanCache(str(tmp_path / "cache"), "0" * 64)
+        assert scan_cache.get_key(str(tmp_path / "a.py")) != scan_cache.get_key(str(tmp_path / "a.txt"))
+
+    def test_evict_p(self, tmp_path) -> None:
+        scan_cache = ScanCache(str(tmp_path), "0" * 64, max_size=300)
+        for index in range(10):
+            scan_cache.used = index
+            scan_cache.save(f"key{index}", [["rule", [[0, "x" * 50, 1, 1, 0, [None] * 7]]]])
+        scan_cache.evict()
+        assert scan_cache.load("key0") is None
+        assert scan_cache.load("key9") is not None
@@ -0,0 +1,27 @@
+from credsweeper.scanner.scan_scheduler import ScanScheduler
+
+
+class TestScanScheduler:
+    def test_get_chunk_p(self) -> None:
+        """Largest files are sent first, smaller files are packed into chunks of balanced cost"""
+        sizes = [10, 1000000, 20, 30, 500000, 10]
+        scan_scheduler = ScanScheduler((f"{index}.txt", size) for index, size in enumerate(sizes))
+        # Scan time is not known before the first chunk is completed
+        assert scan_scheduler.get_chunk(0.1) == [(1, "1.txt")]
+        scan_scheduler.complete_chunk(1, 42, 1.0)
+        # About a half of the first file cost is scanned in 0.5s
+        assert scan_scheduler.get_chunk(0.5) == [(4, "4.txt")]
+        assert scan_scheduler.get_chunk(0.5) == [(3, "3.txt"), (2, "2.txt"), (0, "0.txt"), (5, "5.txt")]
+        assert scan_scheduler.get_chunk(0.5) == []
+        scan_scheduler.complete_chunk(4, 42, 0.5)
+        scan_scheduler.complete_chunk(3, 43, 0.1)
+        assert scan_scheduler.workers == {
+            42: (2, 1500000 + 2 * ScanScheduler.FILE_COST, 1.5),
+            43: (4, 70 + 4 * ScanScheduler.FILE_COST, 0.1)
+        }
+        assert scan_scheduler.scan_time > 0
+
+    def test_get_chunk_n(self) -> None:
+        scan_scheduler = ScanScheduler([])
+        assert scan_scheduler.get_chunk(0.1) == []
+        assert scan_scheduler.workers == {}
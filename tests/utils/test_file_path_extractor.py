@@ -1,3 +1,8 @@
+import os
+import subprocess
+from unittest import mock
+
+from credsweeper.config import Config
 from credsweeper.utils.file_path_extractor import FilePathExtractor
 
 
@@ -19,3 +24,73 @@ class TestFilePathExtractor:
         filtered_files = FilePathExtractor.apply_gitignore(files)
 
         assert len(filtered_files) == 0
+
+    def test_get_file_paths_p(self, config: Config, tmp_path) -> None:
+        """Files of excluded directories are not listed and the directories are not entered"""
+        for dir_name in ("src", "node_modules/pkg", "build/makefile.d"):
+            os.makedirs(tmp_path / dir_name)
+            (tmp_path / dir_name / "main.py").write_text("")
+        (tmp_path / "image.png").write_text("")
+        with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+            file_paths = FilePathExtractor.get_file_paths(config, str(tmp_path))
+        assert [os.path.normpath(file_path) for file_path in file_paths] == [os.path.join(tmp_path, "src", "main.py")]
+        scanned_dirs = {os.path.normpath(call[0][0]) for call in scandir.call_args_list}
+        assert scanned_dirs == {str(tmp_path), str(tmp_path / "src"), str(tmp_path / "build")}
+
+    def test_check_exclude_dir_n(self, config: Config) -> None:
+        assert not FilePathExtractor.check_exclude_dir(config, "src/messages")
+        assert not FilePathExtractor.check_exclude_dir(config, "src/.github")
+
+    def test_discover_file_paths_p(self, config: Config, monkeypatch) -> None:
+        """Parallel discovery gives the same files in the same order as the sequential walk"""
+        monkeypatch.setattr(FilePathExtractor, "DISCOVERY_THREADS", 2)
+        monkeypatch.setattr(FilePathExtractor, "DISCOVERY_QUEUE_SIZE", 1)
+        monkeypatch.setattr(FilePathExtractor, "DISCOVERY_BATCH_SIZE", 1)
+        tests_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+        paths = [tests_dir, os.path.join(tests_dir, "conftest.py")]
+        expected = [file_path for path in paths for file_path in FilePathExtractor.get_file_paths(config, path)]
+        assert list(FilePathExtractor.discover_file_paths(config, paths)) == expected
+        # Walking threads blocked on full queues are stopped when discovery is closed early
+        file_paths = FilePathExtractor.discover_file_paths(config, paths)
+        assert next(file_paths) == expected[0]
+        file_paths.close()
+
+    def test_check_exclude_file_p(self, config: Config) -> None:
+        config.exclude_patterns = Config.get_combined_patterns(
+            [".*generated.*", ".*vendor.*", "(a)\\1", "(?i).*SECRET.*"])
+        # Patterns with groups or global flags are not combined
+        assert len(config.exclude_patterns) == 3
+        for path in ("src/generated/main.py", "src/vendor/main.py", "aa/main.py", "src/secret/main.py",
+                     "src/app.min.js", "src/.git/config", "src/logo.png"):
+            assert FilePathExtractor.check_exclude_file(config, path), path
+        assert not FilePathExtractor.check_exclude_file(config, "src/main.py")
+
+    def test_filter_gitignored_p(self, tmp_path) -> None:
+        """Ignored files are removed, negated patterns and tracked files are kept, nested repositories are respected"""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\n")
+        os.makedirs(tmp_path / "nested")
+        subprocess.run(["git", "init", "-q", str(tmp_path / "nested")], check=True)
+        (tmp_path / "nested" / ".gitignore").write_text("*.py\n")
+        file_paths = [str(tmp_path / name) for name in ("a.py", "a.log", "keep.log", "nested/b.py", "nested/b.log")]
+        for file_path in file_paths:
+            with open(file_path, "w") as f:
+                f.write("")
+        subprocess.run(["git", "-C", str(tmp_path), "add", "-f", "a.log"], check=True)
+        expected = [file_paths[0], file_paths[1], file_paths[2], file_paths[4]]
+        assert list(FilePathExtractor.filter_gitignored(file_paths)) == expected
+        valid_paths = [FilePathExtractor.is_valid_path(file_path) for file_path in file_paths]
+        assert valid_paths == [True, True, True, False, True]
+
+    def test_get_file_paths_skip_ignored_p(self, config: Config, tmp_path) -> None:
+        """Ignored files are excluded without git, ignored directories are not entered"""
+        (tmp_path / ".gitignore").write_text("dist/\n*.log\n")
+        for dir_name in ("src", "dist"):
+            os.makedirs(tmp_path / dir_name)
+            (tmp_path / dir_name / "main.py").write_text("")
+            (tmp_path / dir_name / "main.log").write_text("")
+        with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+            file_paths = FilePathExtractor.get_file_paths(config, str(tmp_path), skip_ignored=True)
+        assert sorted(os.path.normpath(file_path) for file_path in file_paths) \
+            == [os.path.join(tmp_path, ".gitignore"), os.path.join(tmp_path, "src", "main.py")]
+        assert str(tmp_path / "dist") not in {os.path.normpath(call[0][0]) for call in scandir.call_args_list}
@@ -0,0 +1,70 @@
+from credsweeper.utils.file_reader import FileReader
+
+
+class TestFileReader:
+    def test_is_binary_p(self) -> None:
+        assert FileReader.is_binary(b"text\0text")
+        assert FileReader.is_binary(b"\xff\xfetext")
+
+    def test_is_binary_n(self) -> None:
+        assert not FileReader.is_binary(b"password = 'cackle!'\n")
+        # UTF-8 sequence cut by the sniff size is not an error
+        assert not FileReader.is_binary("пароль".encode("utf-8")[:-1])
+
+    def test_read_text_p(self, tmp_path, monkeypatch) -> None:
+        file_path = tmp_path / "text"
+        content = "password = 'cackle!'\r\nпароль\n" * 1000
+        file_path.write_bytes(content.encode("utf-8"))
+        assert FileReader.read_text(str(file_path)) == content
+        # Large file is memory mapped
+        monkeypatch.setattr(FileReader, "MMAP_MIN_SIZE", 1024)
+        assert FileReader.read_text(str(file_path)) == content
+        empty_path = tmp_path / "empty"
+        empty_path.write_bytes(b"")
+        assert FileReader.read_text(str(empty_path)) == ""
+
+    def test_read_text_n(self, tmp_path, monkeypatch) -> None:
+        binary_path = tmp_path / "binary"
+        binary_path.write_bytes(b"\x7fELF\0\0\0" + b"password = 'cackle!'\n" * 1000)
+        invalid_path = tmp_path / "invalid"
+        invalid_path.write_bytes(b"password = 'cackle!'\n" * 1000 + b"\xff")
+        for mmap_min_size in (FileReader.MMAP_MIN_SIZE, 1024):
+            monkeypatch.setattr(FileReader, "MMAP_MIN_SIZE", mmap_min_size)
+            assert FileReader.read_text(str(binary_path)) is None
+            assert FileReader.read_text(str(invalid_path)) is None
+
+    def test_read_text_head_p(self, tmp_path) -> None:
+        file_path = tmp_path / "text"
+        file_path.write_bytes(b"password = 'cackle!'\n" * 10)
+        # Only complete lines of the head are read
+        assert FileReader.read_text(str(file_path), 50) == "password = 'cackle!'\n" * 2
+
+    def test_read_lines_p(self, tmp_path, monkeypatch) -> None:
+        file_path = tmp_path / "text"
+        content = "password = 'cackle!'\r\nпароль\rtoken\n\n" * 100 + "last"
+        file_path.write_bytes(content.encode("utf-8"))
+        # Line breaks and UTF-8 sequences are cut by block borders
+        for block_size in (1, 3, 7, 1 << 20):
+            monkeypatch.setattr(FileReader, "SNIFF_SIZE", block_size)
+            monkeypatch.setattr(FileReader, "STREAM_BLOCK_SIZE", block_size)
+            assert list(FileReader.read_lines(str(file_path))) == content.splitlines()
+        monkeypatch.setattr(FileReader, "STREAM_MAX_LINE_LENGTH", 5)
+        assert list(FileReader.read_lines(str(file_path)))[:3] == ["passw", "пароль"[:5], "token"]
+
+    def test_read_lines_truncated_p(self, tmp_path, monkeypatch, caplog) -> None:
+        """Each truncated line is reported once, also if it was cut while it was pending between blocks"""
+        file_path = tmp_path / "text"
+        file_path.write_text("short\n" + "x" * 100 + "\nshort\n" + "y" * 100)
+        monkeypatch.setattr(FileReader, "SNIFF_SIZE", 8)
+        monkeypatch.setattr(FileReader, "STREAM_BLOCK_SIZE", 8)
+        monkeypatch.setattr(FileReader, "STREAM_MAX_LINE_LENGTH", 10)
+        assert list(FileReader.read_lines(str(file_path))) == ["short", "x" * 10, "short", "y" * 10]
+        warnings = [record.getMessage() for record in caplog.records if record.levelname == "WARNING"]
+        assert len(warnings) == 2
+        assert warnings[0].startswith("Line 2 longer than 10 characters is truncated")
+        assert warnings[1].startswith("Line 4 longer than 10 characters is truncated")
+
+    def test_read_lines_n(self, tmp_path) -> None:
+        binary_path = tmp_path / "binary"
+        binary_path.write_bytes(b"\x7fELF\0\0\0" + b"password = 'cackle!'\n" * 1000)
+        assert FileReader.read_lines(str(binary_path)) is None
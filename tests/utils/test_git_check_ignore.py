@@ -0,0 +1,34 @@
+import os
+import subprocess
+
+import pytest
+
+from credsweeper.utils.git_check_ignore import GitCheckIgnore
+
+
+class TestGitCheckIgnore:
+    def test_get_ignored_p(self, tmp_path) -> None:
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\n")
+        git_check_ignore = GitCheckIgnore(str(tmp_path))
+        try:
+            paths = [str(tmp_path / name) for name in ("a.log", "keep.log", "a.py")]
+            assert git_check_ignore.get_ignored(paths) == [True, False, False]
+            # Process is reused for the next check
+            assert git_check_ignore.get_ignored(paths[:1]) == [True]
+        finally:
+            git_check_ignore.close()
+
+    @pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="symbolic links are required")
+    def test_get_ignored_n(self, tmp_path) -> None:
+        """Paths after a path that git cannot check are checked by a new process"""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        os.makedirs(tmp_path / "real")
+        os.symlink(tmp_path / "real", tmp_path / "link")
+        git_check_ignore = GitCheckIgnore(str(tmp_path))
+        try:
+            paths = [str(tmp_path / name) for name in ("a.log", "link/a.log", "b.log", "link/b.log", "c.log")]
+            assert git_check_ignore.get_ignored(paths) == [True, False, True, False, True]
+        finally:
+            git_check_ignore.close()
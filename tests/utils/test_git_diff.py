@@ -0,0 +1,71 @@
+import os
+import subprocess
+
+from credsweeper.utils.git_diff import GitDiff
+
+DIFF = b"""diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -10,4 +10,5 @@ def main():
+ context 10
+--- removed line that looks like a header
++token = 'gi5aVx8kL2cq'\r
++++ added line that looks like a header
+ context 12
+ context 13
+@@ -40 +41,2 @@
+ context 41
++last line
+\\ No newline at end of file
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-password = 'cackle!4aB'
+diff --git "a/new\\tfile.txt" "b/new\\tfile.txt"
+new file mode 100644
+--- /dev/null
++++ "b/new\\tfile.txt"
+@@ -0,0 +1 @@
++password = 'cackle!4aB'
+"""
+
+
+class TestGitDiff:
+    def test_parse_p(self) -> None:
+        hunks = list(GitDiff.parse(DIFF.splitlines(keepends=True), "repo"))
+        assert hunks == [
+            (os.path.join("repo", "app.py"), (["context 10", "token = 'gi5aVx8kL2cq'",
+                                               "++ added line that looks like a header", "context 12",
+                                               "context 13"], [2, 3], 9)),
+            (os.path.join("repo", "app.py"), (["context 41", "last line"], [2], 40)),
+            (os.path.join("repo", "new\tfile.txt"), (["password = 'cackle!4aB'"], [1], 0)),
+        ]
+
+    def test_parse_n(self) -> None:
+        assert list(GitDiff.parse([b"Binary files a/image.png and b/image.png differ\n"])) == []
+        assert list(GitDiff.parse(b"--- a/x\n+++ b/x\n@@ -1 +1 @@\n-old\n+new\n".splitlines()[:4])) == []
+
+    def test_get_file_path_p(self) -> None:
+        assert GitDiff.get_file_path("b/dir/file.py", "") == "dir/file.py"
+        assert GitDiff.get_file_path("file.py\t2022-01-01 00:00:00", "") == "file.py"
+        assert GitDiff.get_file_path("\"b/\\320\\244.txt\"", "") == "Ф.txt"
+        assert GitDiff.get_file_path("/dev/null", "") is None
+
+    def test_run_git_diff_p(self, tmp_path) -> None:
+        """Only lines added since the base revision are given, with line numbers of the working tree file"""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        file_path = tmp_path / "app.py"
+        file_path.write_text("".join(f"line {i}\n" for i in range(1, 30)))
+        subprocess.run(["git", "-C", str(tmp_path), "add", "app.py"], check=True)
+        subprocess.run(["git", "-C", str(tmp_path), "-c", "user.name=test", "-c", "user.email=test@test",
+                        "commit", "-q", "-m", "base"], check=True)
+        file_path.write_text("".join(f"line {i}\n" if i != 20 else "added\n" for i in range(1, 30)))
+        hunks = list(GitDiff.parse(GitDiff.run_git_diff(str(tmp_path), "HEAD", context_lines=5), str(tmp_path)))
+        assert len(hunks) == 1
+        hunk_path, (lines, line_nums, line_num_offset) = hunks[0]
+        assert hunk_path == str(file_path)
+        assert [(line_num + line_num_offset, lines[line_num - 1]) for line_num in line_nums] == [(20, "added")]
+        assert len(lines) == 11
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from credsweeper.utils.git_ignore import GitIgnore
+
+
+class TestGitIgnore:
+    @pytest.mark.parametrize("pattern, path, is_ignored", [
+        ("*.log", "a/b.log", True),
+        ("/b.log", "a/b.log", False),
+        ("a/*.log", "a/b.log", True),
+        ("a/*.log", "x/a/b.log", False),
+        ("**/a/b.log", "x/a/b.log", True),
+        ("a/**/b.log", "a/x/y/b.log", True),
+        ("a/**", "a/x/b.log", True),
+        ("?.log", "ab.log", False),
+        ("[!a].log", "b.log", True),
+        ("\\#b.log", "#b.log", True),
+        ("b.log\\ ", "b.log ", True),
+    ])
+    def test_is_ignored_p(self, tmp_path, pattern: str, path: str, is_ignored: bool) -> None:
+        (tmp_path / ".gitignore").write_text(f"{pattern}\n")
+        git_ignore = GitIgnore(str(tmp_path))
+        assert git_ignore.is_ignored(str(tmp_path / path), False) == is_ignored
+
+    def test_is_ignored_priority_p(self, tmp_path) -> None:
+        """Negation and rules of nested gitignore files override previous rules, but not ignored parent directory"""
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\nbuild/\n")
+        os.makedirs(tmp_path / "src")
+        (tmp_path / "src" / ".gitignore").write_text("!*.log\n*.py\n")
+        git_ignore = GitIgnore(str(tmp_path))
+        assert git_ignore.is_ignored(str(tmp_path / "a.log"), False)
+        assert not git_ignore.is_ignored(str(tmp_path / "keep.log"), False)
+        assert not git_ignore.is_ignored(str(tmp_path / "src" / "a.log"), False)
+        assert git_ignore.is_ignored(str(tmp_path / "src" / "a.py"), False)
+        assert git_ignore.is_ignored(str(tmp_path / "build"), True)
+        assert not git_ignore.is_ignored(str(tmp_path / "build"), False)
+        assert git_ignore.is_ignored(str(tmp_path / "build" / "keep.log"), False)
+
+    def test_is_ignored_n(self, tmp_path) -> None:
+        (tmp_path / ".gitignore").write_text("# *.log\n\n")
+        git_ignore = GitIgnore(str(tmp_path))
+        assert not git_ignore.is_ignored(str(tmp_path / "# a.log"), False)
+        assert not git_ignore.is_ignored(str(tmp_path / "a.log"), False)
+
+    def test_compile_rules_windows_p(self, monkeypatch) -> None:
+        """Paths with Windows separators are matched by patterns with POSIX separators"""
+        monkeypatch.setattr(os, "sep", "\\")
+        rules = ((r"C:\repo", GitIgnore.parse_rule("build/*.log")), (r"C:\repo", GitIgnore.parse_rule("!keep.log")))
+        pattern = GitIgnore.compile_rules(rules, False)
+        assert pattern.fullmatch(GitIgnore.get_posix_path(r"C:\repo\build\a.log")).lastgroup == "i0"
+        assert pattern.fullmatch(GitIgnore.get_posix_path(r"C:\repo\build\keep.log")).lastgroup == "n1"
+        assert pattern.fullmatch(GitIgnore.get_posix_path(r"C:\repo\a.log")) is None
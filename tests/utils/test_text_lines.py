@@ -0,0 +1,26 @@
+import pytest
+from regex import regex
+
+from credsweeper.utils.text_lines import TextLines
+
+
+class TestTextLines:
+    @pytest.mark.parametrize("text", ["", "\n", "line", "line\n", "first\nsecond", "a\r\nb\rc\x85d e", "\n\nx\r\n"])
+    def test_split_p(self, text: str) -> None:
+        lines = TextLines(text)
+        assert list(lines) == text.splitlines()
+        assert lines[1:] == text.splitlines()[1:]
+
+    def test_get_line_num_p(self) -> None:
+        lines = TextLines("first\r\nsecond\nthird")
+        assert lines.get_line_num(0) == 1
+        assert lines.get_line_num(6) == 1
+        assert lines.get_line_num(7) == 2
+        assert lines.get_line_num(len("first\r\nsecond\nthird")) == 3
+
+    def test_find_line_nums_p(self) -> None:
+        lines = TextLines("a = 1\nkey key\nb = 2\nkey\n")
+        assert lines.find_line_nums(regex.compile("key")) == [2, 4]
+
+    def test_find_line_nums_n(self) -> None:
+        assert TextLines("a = 1\nb = 2").find_line_nums(regex.compile("key")) == []
@@ -0,0 +1,39 @@
+import pytest
+from regex import regex
+
+from credsweeper.utils import Util
+
+
+class TestUtil:
+    @pytest.mark.parametrize("pattern, required", [
+        (r"(?P<value>(AKIA|ASIA)[0-9A-Z]{16})", {"akia", "asia"}),
+        (r"(?P<value>-----BEGIN\s(?!ENCRYPTED|EC).*PRIVATE)", {"-----begin"}),
+        (r"(?P<value>[a-z0-9.-]+\.firebaseio\.com|[a-z0-9.-]+\.firebaseapp\.com)", {".firebaseio.com", ".firebaseapp.com"}),
+        (r"(?i)(?P<value>heroku[0-9a-f]{8})", {"heroku"}),
+    ])
+    def test_get_required_substrings_p(self, pattern: str, required: set) -> None:
+        assert Util.get_required_substrings(regex.compile(pattern)) == required
+
+    def test_get_required_substrings_keyword_p(self) -> None:
+        pattern = Util.get_keyword_pattern("password|passwd|pwd")
+        assert Util.get_required_substrings(pattern) == {"password", "passwd", "pwd"}
+
+    @pytest.mark.parametrize("pattern", [
+        r"(?P<value>[0-9a-zA-Z/+]{40})",
+        r"(?P<value>(abc)?[0-9]+)",
+        r"(?P<value>abc|[0-9]+)",
+        r"(?P<value>(?i)heroku[0-9a-f]{8})",
+        r"(?P<value>heroku(?x) [0-9a-f]{8})",
+    ])
+    def test_get_required_substrings_n(self, pattern: str) -> None:
+        # Global flags not at the start of a pattern are parsed differently by each Python version
+        assert Util.get_required_substrings(regex.compile(pattern)) is None
+
+    def test_get_source_hash_p(self, tmp_path) -> None:
+        file_path = tmp_path / "code.py"
+        file_path.write_text("a = 1")
+        source_hash = Util.get_source_hash([str(file_path)])
+        assert Util.get_source_hash([str(file_path)]) == source_hash
+        file_path.write_text("a = 2")
+        assert Util.get_source_hash([str(file_path)]) != source_hash
+        assert Util.get_source_hash([str(tmp_path / "absent.py")]) != source_hash